@@ -6,6 +6,14 @@ set -e
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 HOOK_SCRIPT="$SCRIPT_DIR/scripts/todo-workflow-observer.py"
+CLIENT_SCRIPT="$SCRIPT_DIR/scripts/todo-observer-client.py"
+DAEMON_SCRIPT="$SCRIPT_DIR/scripts/todo-observer-daemon.py"
+STORE_MODULE="$SCRIPT_DIR/scripts/session_store.py"
+MEMORY_MODULE="$SCRIPT_DIR/scripts/workflow_memory.py"
+
+# The hook runs the shim: it forwards to the resident daemon when it is up
+# and runs the observer in-process otherwise
+HOOK_COMMAND="python3 -I -S ~/.claude/hooks/todo-observer-client.py"
 STATUSLINE_SCRIPT="$SCRIPT_DIR/../statusline/statusline.sh"
 
 # Colors
@@ -34,8 +42,16 @@ chmod 755 ~/.claude/hooks
 # Copy hook script
 echo -e "${BLUE}📋 Installing observer hook...${NC}"
 cp "$HOOK_SCRIPT" ~/.claude/hooks/todo-workflow-observer.py
-chmod +x ~/.claude/hooks/todo-workflow-observer.py
+cp "$CLIENT_SCRIPT" ~/.claude/hooks/todo-observer-client.py
+cp "$DAEMON_SCRIPT" ~/.claude/hooks/todo-observer-daemon.py
+cp "$STORE_MODULE" ~/.claude/hooks/session_store.py
+cp "$MEMORY_MODULE" ~/.claude/hooks/workflow_memory.py
+chmod +x ~/.claude/hooks/todo-workflow-observer.py ~/.claude/hooks/todo-observer-client.py ~/.claude/hooks/todo-observer-daemon.py
 echo -e "${GREEN}✅ Installed: ~/.claude/hooks/todo-workflow-observer.py${NC}"
+echo -e "${GREEN}✅ Installed: ~/.claude/hooks/todo-observer-client.py (hook shim)${NC}"
+echo -e "${GREEN}✅ Installed: ~/.claude/hooks/todo-observer-daemon.py (optional resident daemon)${NC}"
+echo -e "${GREEN}✅ Installed: ~/.claude/hooks/session_store.py (.claude-session store)${NC}"
+echo -e "${GREEN}✅ Installed: ~/.claude/hooks/workflow_memory.py (observation/archive index)${NC}"
 
 # Update statusline if exists
 if [[ -f "$STATUSLINE_SCRIPT" ]]; then
@@ -51,7 +67,7 @@ SETTINGS_FILE="$HOME/.claude/settings.json"
 if [[ ! -f "$SETTINGS_FILE" ]]; then
     echo -e "${YELLOW}⚠️  Warning: $SETTINGS_FILE not found${NC}"
     echo -e "${YELLOW}   Creating minimal settings.json...${NC}"
-    cat > "$SETTINGS_FILE" << 'EOF'
+    cat > "$SETTINGS_FILE" << EOF
 {
   "hooks": {
     "PostToolUse": [
@@ -60,7 +76,7 @@ if [[ ! -f "$SETTINGS_FILE" ]]; then
         "hooks": [
           {
             "type": "command",
-            "command": "~/.claude/hooks/todo-workflow-observer.py"
+            "command": "$HOOK_COMMAND"
           }
         ]
       }
@@ -98,7 +114,7 @@ try:
         for hook in settings['hooks']['PostToolUse']:
             if hook.get('matcher') == 'TodoWrite':
                 if 'hooks' in hook and len(hook['hooks']) > 0:
-                    hook['hooks'][0]['command'] = '~/.claude/hooks/todo-workflow-observer.py'
+                    hook['hooks'][0]['command'] = '$HOOK_COMMAND'
                     print("Updated TodoWrite hook command")
 
     with open(settings_file, 'w') as f:
@@ -136,7 +152,7 @@ try:
         "matcher": "TodoWrite",
         "hooks": [{
             "type": "command",
-            "command": "~/.claude/hooks/todo-workflow-observer.py"
+            "command": "$HOOK_COMMAND"
         }]
     })
 
@@ -171,7 +187,7 @@ try:
         "matcher": "TodoWrite",
         "hooks": [{
             "type": "command",
-            "command": "~/.claude/hooks/todo-workflow-observer.py"
+            "command": "$HOOK_COMMAND"
         }]
     }]
 
@@ -207,6 +223,8 @@ echo -e "   • Updates statusline with progress (e.g., 🛡️ Refactoring 3/6)
 echo ""
 echo -e "${YELLOW}🔄 Next steps:${NC}"
 echo -e "   • Restart Claude Code to activate the hook"
+echo -e "   • Optional: keep the observer resident for ~1ms hook calls"
+echo -e "     python3 ~/.claude/hooks/todo-observer-daemon.py start"
 echo -e "   • Create a todo list with TodoWrite"
 echo -e "   • Watch the observer enforce your workflow!"
 echo ""
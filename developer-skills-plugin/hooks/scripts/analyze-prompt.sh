@@ -33,23 +33,46 @@ MVP_PATTERN="mvp|prototype|poc|proof of concept|quick|fast|rapid|minimum viable|
 EXPLAIN_PATTERN="what does.*(function|class|method|code|file)|explain.*(function|class|method|code|file|module|middleware|handler)|how does.*(function|class|code|work)"
 PATTERN_RECALL="how did we|how do we|what's the pattern|what pattern|similar.*before|did we.*before|recall.*pattern"
 
-# Helper function to write active superflow to session file
+# .claude-session is shared with the TodoWrite observer and statusline;
+# session_store.py merges keys under a lock and writes atomically
+SESSION_STORE="$(dirname "${BASH_SOURCE[0]}")/session_store.py"
+
+# Session fields to write, flushed in one store call before exiting
+SESSION_UPDATES=()
+
+# Helper function to record the active superflow for the session file
 write_active_superflow() {
     local flow_indicator="$1"
     local workflow_key=$(echo "$flow_indicator" | tr ' ' '_' | tr -d '🛡️🐛🏗️🎨🔌✅🚀🔐⚡📦🎓')
+    workflow_key="${workflow_key#_}"  # Emoji prefix leaves a leading "_"
+
+    # Later matches win; "?=" keeps an existing violation count
+    SESSION_UPDATES+=(
+        "ACTIVE_SUPERFLOW=$flow_indicator"
+        "${workflow_key}_VIOLATIONS?=0"
+        "LAST_WORKFLOW_CHECK=$(date -Iseconds)"
+    )
+}
 
-    # Read existing session data
-    local violations=0
-    if [ -f .claude-session ]; then
-        violations=$(grep -oP "${workflow_key}_VIOLATIONS=\K\d+" .claude-session 2>/dev/null || echo "0")
+# Write the recorded fields, keeping the keys other hooks own (TODO_*, ...)
+flush_session_state() {
+    [ ${#SESSION_UPDATES[@]} -eq 0 ] && return
+
+    if command -v python3 &> /dev/null && [ -f "$SESSION_STORE" ]; then
+        python3 -I -S "$SESSION_STORE" set "${SESSION_UPDATES[@]}" 2>/dev/null && return
     fi
 
-    # Write to .claude-session
-    {
-        echo "ACTIVE_SUPERFLOW=$flow_indicator"
-        echo "${workflow_key}_VIOLATIONS=$violations"
-        echo "LAST_WORKFLOW_CHECK=$(date -Iseconds)"
-    } > .claude-session
+    # Fallback without python3: merge line by line with grep
+    local update key
+    for update in "${SESSION_UPDATES[@]}"; do
+        key="${update%%=*}"
+        if [[ "$key" == *\? ]]; then
+            key="${key%\?}"
+            grep -q "^${key}=" .claude-session 2>/dev/null && continue
+        fi
+        { grep -v "^${key}=" .claude-session 2>/dev/null; echo "${key}=${update#*=}"; } > .claude-session.tmp
+        mv .claude-session.tmp .claude-session
+    done
 }
 
 # Helper function to get enforcement level based on violations
@@ -58,8 +81,13 @@ get_enforcement_level() {
     local violations=0
 
     if [ -f .claude-session ]; then
-        violations=$(grep -oP "${workflow_key}_VIOLATIONS=\K\d+" .claude-session 2>/dev/null || echo "0")
+        if command -v python3 &> /dev/null && [ -f "$SESSION_STORE" ]; then
+            violations=$(python3 -I -S "$SESSION_STORE" get "${workflow_key}_VIOLATIONS" --default 0 2>/dev/null)
+        else
+            violations=$(grep -oP "${workflow_key}_VIOLATIONS=\K\d+" .claude-session 2>/dev/null)
+        fi
     fi
+    [[ "$violations" =~ ^[0-9]+$ ]] || violations=0
 
     # Return enforcement level: SUGGEST(0), WARN(1), REQUIRE(2), BLOCK(3+)
     if [ "$violations" -eq 0 ]; then
@@ -735,6 +763,8 @@ Actually run /explain-code and /recall-pattern for context.
 "
 fi
 
+flush_session_state
+
 # Output JSON with additionalContext if we have any context to inject
 if [ -n "$CONTEXT" ]; then
     # Escape the context for JSON (escape quotes and newlines)
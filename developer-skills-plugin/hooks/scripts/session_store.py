@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Shared store for .claude-session
+
+.claude-session is the key=value file the hooks and statusline share
+(ACTIVE_SUPERFLOW, TODO_PROGRESS, <workflow>_VIOLATIONS, ...). This module
+is the one place that reads and writes it:
+
+- Updates are read-modify-write under an exclusive flock on
+  .claude-session.lock, so concurrent hooks merge keys instead of
+  overwriting each other's
+- Writes go to a temp file that is renamed over .claude-session, so
+  readers (including `grep` in statusline.sh) never see a half-written file
+- Reads are parsed once and cached until the file's mtime/size/inode
+  changes, so the resident observer daemon skips rereads
+
+The file stays plain key=value lines: statusline.sh and older hooks keep
+reading it with grep.
+
+Usage (Python):
+    from session_store import get_store
+
+    store = get_store(root)
+    store.read()                       # {"ACTIVE_SUPERFLOW": "...", ...}
+    store.update({"TODO_PROGRESS": "2/5"})
+    with store.transaction() as data:  # Locked read-modify-write
+        data.setdefault("SESSION_START", now)
+
+Usage (shell, one process per call however many keys):
+    session_store.py get KEY [KEY ...]            # One value per line ("" if unset)
+    session_store.py get KEY --default 0
+    session_store.py set KEY=VALUE [KEY?=VALUE]   # "?=" only sets unset keys
+    session_store.py incr KEY [--by N]            # Prints the new value
+    session_store.py dump                         # Whole file, key=value
+    (all take --root DIR, default: current directory)
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, writes are still atomic
+    fcntl = None
+
+SESSION_FILE = ".claude-session"
+LOCK_SUFFIX = ".lock"
+
+
+def parse(text):
+    """key=value lines -> dict (later duplicates win, other lines ignored)"""
+    data = {}
+    for line in text.splitlines():
+        key, sep, value = line.partition("=")
+        if sep and key:
+            data[key] = value
+    return data
+
+
+def serialize(data):
+    """dict -> key=value lines (values are kept on one line)"""
+    return "".join(f"{key}={str(value).replace(chr(10), ' ')}\n" for key, value in data.items())
+
+
+class SessionStore:
+    """
+    .claude-session in one project directory
+
+    Use get_store() rather than constructing this directly, so every caller
+    in the process shares one parsed copy.
+    """
+
+    def __init__(self, root=Path(".")):
+        self.path = Path(root) / SESSION_FILE
+        self.lock_path = self.path.with_name(SESSION_FILE + LOCK_SUFFIX)
+        self._signature = None
+        self._data = {}
+
+    def _stat_signature(self):
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _load(self):
+        """Cached parsed data, reread only when the file changed"""
+        signature = self._stat_signature()
+        if signature is None:
+            self._signature, self._data = None, {}
+        elif signature != self._signature:
+            try:
+                text = self.path.read_text()
+            except OSError:
+                text = ""
+            self._signature, self._data = signature, parse(text)
+        return self._data
+
+    def read(self):
+        """All keys as a dict (a copy; change it through update/transaction)"""
+        return dict(self._load())
+
+    def get(self, key, default=None):
+        return self._load().get(key, default)
+
+    @contextmanager
+    def _locked(self):
+        if fcntl is None:
+            yield
+            return
+        with open(self.lock_path, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _write(self, data):
+        tmp_path = self.path.with_name(f"{SESSION_FILE}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(serialize(data))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            raise
+        self._signature, self._data = self._stat_signature(), dict(data)
+
+    @contextmanager
+    def transaction(self):
+        """
+        Locked read-modify-write: yields the current data as a dict and
+        writes it back atomically if it was changed
+        """
+        with self._locked():
+            data = self.read()
+            yield data
+            if data != self._data:
+                self._write(data)
+
+    def update(self, values=None, defaults=None):
+        """
+        Merge keys into the file
+
+        Args:
+            values: Keys to set
+            defaults: Keys to set only if not already present
+
+        Returns:
+            The data as written
+        """
+        with self.transaction() as data:
+            data.update(values or {})
+            for key, value in (defaults or {}).items():
+                data.setdefault(key, value)
+        return dict(data)
+
+    def increment(self, key, by=1):
+        """Add to an integer field (unset or non-numeric counts as 0)"""
+        with self.transaction() as data:
+            try:
+                value = int(data.get(key, 0)) + by
+            except ValueError:
+                value = by
+            data[key] = str(value)
+        return value
+
+
+# resolved project path -> SessionStore, shared by everything in the process
+_stores = {}
+
+
+def get_store(root=Path(".")):
+    """The process-wide SessionStore for a project directory"""
+    key = str(Path(root).resolve())
+    store = _stores.get(key)
+    if store is None:
+        store = _stores[key] = SessionStore(root)
+    return store
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Read and write .claude-session fields")
+    parser.add_argument("--root", default=".", help="Project directory holding .claude-session")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    get_cmd = commands.add_parser("get", help="Print values, one per line")
+    get_cmd.add_argument("keys", nargs="+")
+    get_cmd.add_argument("--default", default="", help="Printed for unset keys")
+
+    set_cmd = commands.add_parser("set", help="Set KEY=VALUE (or KEY?=VALUE if unset)")
+    set_cmd.add_argument("pairs", nargs="+")
+
+    incr_cmd = commands.add_parser("incr", help="Increment an integer field")
+    incr_cmd.add_argument("key")
+    incr_cmd.add_argument("--by", type=int, default=1)
+
+    commands.add_parser("dump", help="Print the whole file")
+
+    args = parser.parse_args(argv)
+    store = SessionStore(args.root)
+
+    if args.command == "get":
+        data = store.read()
+        for key in args.keys:
+            print(data.get(key, args.default))
+    elif args.command == "set":
+        values, defaults = {}, {}
+        for pair in args.pairs:
+            key, sep, value = pair.partition("=")
+            if not sep or not key.rstrip("?"):
+                parser.error(f"expected KEY=VALUE, got {pair!r}")
+            if key.endswith("?"):
+                defaults[key[:-1]] = value
+            else:
+                values[key] = value
+        store.update(values, defaults)
+    elif args.command == "incr":
+        print(store.increment(args.key, args.by))
+    else:
+        sys.stdout.write(serialize(store.read()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
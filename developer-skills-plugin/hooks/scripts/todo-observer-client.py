@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+TodoWrite observer hook shim
+
+Forwards the hook call to todo-observer-daemon.py over its Unix socket and
+prints the daemon's reply. Only socket/os/sys are imported, so the call
+costs little more than interpreter startup (run it with `python3 -I -S` to
+also skip site-packages). If the daemon is not running (the connect fails),
+todo-workflow-observer.py runs in this process instead, so the hook works
+the same either way. Once the daemon has accepted the call it is never
+rerun here: a send/receive failure or timeout is reported as a hook error
+instead, since the daemon may already have applied the call's side
+effects (.claude-session, snapshot, workflow memory).
+
+Usage (hook command):
+    python3 -I -S ~/.claude/hooks/todo-observer-client.py
+"""
+
+import os
+import socket
+import sys
+
+# Must match todo-observer-daemon.py
+SOCKET_ENV = "TODO_OBSERVER_SOCKET"
+DEFAULT_SOCKET = "~/.claude/todo-observer.sock"
+
+# Run in-process if the daemon does not accept the connection within this long (seconds)
+CONNECT_TIMEOUT = 2.0
+
+# Longest to wait for the daemon's answer once connected (it serves calls one at a time)
+REPLY_TIMEOUT = 30.0
+
+# Reported (exit code 1, like an observer crash) when the daemon fails after accepting a call
+FAILED_MESSAGE = "todo observer daemon failed mid-request ({}); not rerun in-process\n"
+
+
+def forward(raw_input):
+    """Send one hook call to the daemon: (exit code, stdout text), or None if it is not running"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(CONNECT_TIMEOUT)
+        try:
+            sock.connect(os.path.expanduser(os.environ.get(SOCKET_ENV, DEFAULT_SOCKET)))
+        except OSError:
+            return None
+
+        chunks = []
+        try:
+            sock.settimeout(REPLY_TIMEOUT)
+            sock.sendall(b"OBSERVE\n" + os.getcwd().encode() + b"\n" + raw_input)
+            sock.shutdown(socket.SHUT_WR)
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        except OSError as error:
+            return 1, FAILED_MESSAGE.format(str(error) or type(error).__name__)
+
+    code, newline, text = b"".join(chunks).partition(b"\n")
+    if not newline or not code.lstrip(b"-").isdigit():
+        return 1, FAILED_MESSAGE.format("no reply")
+    return int(code), text.decode()
+
+
+def run_in_process(raw_input):
+    """Run the observer here, feeding it the already-read stdin"""
+    import io
+    import runpy
+
+    sys.stdin = io.TextIOWrapper(io.BytesIO(raw_input), encoding="utf-8")
+    observer = os.path.join(os.path.dirname(os.path.abspath(__file__)), "todo-workflow-observer.py")
+    runpy.run_path(observer, run_name="__main__")
+
+
+def main():
+    raw_input = sys.stdin.buffer.read()
+
+    result = forward(raw_input)
+    if result is None:
+        run_in_process(raw_input)
+        return
+
+    code, text = result
+    (sys.stdout if code == 0 else sys.stderr).write(text)
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Resident daemon for the TodoWrite observer hook
+
+Keeps todo-workflow-observer.py loaded in one long-lived process behind a
+Unix socket, so a TodoWrite hook call costs a socket round trip instead of
+interpreter startup, imports and regex compilation. The observer module
+stays imported (its compiled patterns and cached .claude-session state
+with it) and is reloaded automatically when its source file, or one of
+the helper modules it imports, changes.
+
+The hook runs todo-observer-client.py, which forwards to this daemon and
+falls back to running the observer in-process when the daemon is down.
+
+Usage:
+    todo-observer-daemon.py start       # Start in the background
+    todo-observer-daemon.py status      # Check that it answers
+    todo-observer-daemon.py stop
+    todo-observer-daemon.py run         # Foreground (for debugging)
+
+Protocol (one request per connection, client closes its write side):
+    OBSERVE\\n<cwd>\\n<hook stdin>   ->  <exit code>\\n<hook stdout>
+    PING\\n                          ->  0\\npong <pid>\\n
+    STOP\\n                          ->  0\\nstopping\\n
+"""
+
+import importlib.util
+import json
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import time
+import traceback
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+OBSERVER_SCRIPT = SCRIPT_DIR / "todo-workflow-observer.py"
+
+# Sibling modules the observer imports; a change to any of them reloads it too
+OBSERVER_DEPENDENCIES = ("session_store", "workflow_memory")
+
+# Must match todo-observer-client.py
+SOCKET_ENV = "TODO_OBSERVER_SOCKET"
+DEFAULT_SOCKET = "~/.claude/todo-observer.sock"
+
+# Exit after this long without requests (seconds)
+DEFAULT_IDLE_TIMEOUT = 4 * 60 * 60
+
+# Longest a client may take to send its request (seconds)
+REQUEST_TIMEOUT = 2.0
+
+
+def socket_path():
+    return Path(os.path.expanduser(os.environ.get(SOCKET_ENV, DEFAULT_SOCKET)))
+
+
+class ObserverModule:
+    """todo-workflow-observer.py imported once, reloaded when it or a dependency changes"""
+
+    def __init__(self, path=OBSERVER_SCRIPT, dependencies=OBSERVER_DEPENDENCIES):
+        self.path = Path(path)
+        self.dependencies = dependencies
+        self.mtimes = None
+        self.module = None
+        self.loads = 0
+
+    def source_mtimes(self):
+        mtimes = [self.path.stat().st_mtime_ns]
+        for name in self.dependencies:
+            try:
+                mtimes.append(self.path.with_name(f"{name}.py").stat().st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
+
+    def get(self):
+        mtimes = self.source_mtimes()
+        if self.module is None or mtimes != self.mtimes:
+            # Drop the old helpers so the observer's imports load them afresh
+            for name in self.dependencies:
+                sys.modules.pop(name, None)
+            spec = importlib.util.spec_from_file_location("todo_workflow_observer", self.path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self.module, self.mtimes = module, mtimes
+            self.loads += 1
+        return self.module
+
+
+class ObserverHandler(socketserver.StreamRequestHandler):
+    timeout = REQUEST_TIMEOUT
+
+    def handle(self):
+        command = self.rfile.readline().strip().decode()
+
+        if command == "PING":
+            self.reply(0, f"pong {os.getpid()}\n")
+        elif command == "STOP":
+            self.server.stopping = True
+            self.reply(0, "stopping\n")
+        elif command == "OBSERVE":
+            cwd = self.rfile.readline().rstrip(b"\n").decode()
+            self.reply(*self.server.observe(cwd, self.rfile.read()))
+        else:
+            self.reply(2, f"unknown command {command!r}\n")
+
+    def reply(self, code, text):
+        self.wfile.write(f"{code}\n{text}".encode())
+
+
+class ObserverServer(socketserver.UnixStreamServer):
+    """
+    Serial Unix-socket server: requests run one at a time, in arrival order,
+    so concurrent hook calls never race on .claude-session
+    """
+
+    def __init__(self, path, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        self.observer = ObserverModule()
+        self.observer.get()  # Fail at startup, not on the first hook call
+        self.stopping = False
+        self.timeout = idle_timeout
+        self.requests = 0
+
+        # Socket is private to the user
+        old_umask = os.umask(0o077)
+        try:
+            super().__init__(str(path), ObserverHandler)
+        finally:
+            os.umask(old_umask)
+
+    def observe(self, cwd, raw_input):
+        """Run the observer for one hook call: (exit code, stdout text)"""
+        self.requests += 1
+        try:
+            input_data = json.loads(raw_input)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return 0, ""  # Silently pass if not valid JSON, like the hook
+
+        try:
+            output = self.observer.get().observe(input_data, Path(cwd))
+        except Exception:
+            return 1, traceback.format_exc()
+        return 0, json.dumps(output) + "\n" if output else ""
+
+    def handle_timeout(self):
+        self.stopping = True
+
+    def serve(self):
+        while not self.stopping:
+            self.handle_request()
+
+
+def request(command, timeout=2.0):
+    """Send a command to the running daemon and return its reply text (None if down)"""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(socket_path()))
+            sock.sendall(f"{command}\n".encode())
+            sock.shutdown(socket.SHUT_WR)
+            reply = b"".join(iter(lambda: sock.recv(65536), b""))
+    except OSError:
+        return None
+    return reply.decode().partition("\n")[2]
+
+
+def run(idle_timeout=DEFAULT_IDLE_TIMEOUT):
+    path = socket_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if path.exists():
+        if request("PING") is not None:
+            print(f"Daemon already running on {path}", file=sys.stderr)
+            return 1
+        path.unlink()  # Stale socket from a daemon that did not exit cleanly
+
+    server = ObserverServer(path, idle_timeout)
+    try:
+        server.serve()
+    finally:
+        server.server_close()
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+    return 0
+
+
+def start(idle_timeout=DEFAULT_IDLE_TIMEOUT):
+    if request("PING") is not None:
+        print(f"✅ Daemon already running on {socket_path()}")
+        return 0
+
+    subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve()), "run", "--idle-timeout", str(idle_timeout)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    deadline = time.monotonic() + 3
+    while time.monotonic() < deadline:
+        reply = request("PING")
+        if reply is not None:
+            print(f"✅ Daemon started ({reply.strip()}) on {socket_path()}")
+            return 0
+        time.sleep(0.05)
+
+    print("❌ Daemon did not come up; hooks keep running in-process", file=sys.stderr)
+    return 1
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Resident daemon for the TodoWrite observer hook")
+    parser.add_argument("command", choices=["start", "stop", "status", "run"])
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT,
+                        help="Exit after this many seconds without requests")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        return run(args.idle_timeout)
+    if args.command == "start":
+        return start(args.idle_timeout)
+
+    if args.command == "stop":
+        reply = request("STOP")
+        print("✅ Daemon stopped" if reply is not None else "Daemon not running")
+        return 0
+
+    reply = request("PING")
+    if reply is None:
+        print(f"Daemon not running ({socket_path()})")
+        return 1
+    print(f"✅ Daemon running ({reply.strip()}) on {socket_path()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
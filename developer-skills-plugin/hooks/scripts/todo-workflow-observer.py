@@ -5,13 +5,14 @@ Enforces workflow compliance and sequential execution
 
 Features:
 1. Detects active superflow from todo content
-2. Updates .claude-session with state
+2. Updates .claude-session with state (via session_store.py)
 3. Validates todos match workflow requirements
 4. Auto-corrects missing mandatory steps
 5. Enforces sequential execution (one in_progress at a time)
 6. Prevents random stopping with pending todos
 """
 
+import hashlib
 import json
 import sys
 import os
@@ -19,6 +20,13 @@ import re
 from datetime import datetime
 from pathlib import Path
 
+# session_store.py sits next to this script (not on sys.path under `python3 -I`
+# or when the daemon loads this file)
+SCRIPT_DIR = str(Path(__file__).resolve().parent)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+from session_store import get_store
+
 # === WORKFLOW DEFINITIONS ===
 
 WORKFLOWS = {
@@ -82,69 +90,134 @@ WORKFLOWS = {
     },
 }
 
+# === COMPILED MATCHER ===
+
+class WorkflowMatcher:
+    """
+    WORKFLOWS compiled once, evaluated against the todo text in one pass
+
+    The todo text is built once per call (todo contents joined with
+    spaces), so a pattern like "check.*test" can be satisfied by two todos
+    together, e.g. "check docs" followed by "write tests".
+
+    Each pattern is compiled on its own rather than merged into one
+    alternation per workflow: with re.IGNORECASE, CPython only applies its
+    literal-prefix search to single patterns, and merged alternations
+    measured 2-5x slower on long todo lists.
+    """
+
+    def __init__(self, workflows):
+        self.workflows = workflows
+
+        # (workflow name, trigger regexes) in priority order
+        self.triggers = [
+            (name, [re.compile(pattern, re.IGNORECASE) for pattern in flow_def.get("patterns", [])])
+            for name, flow_def in workflows.items()
+        ]
+
+        # workflow name -> ([(pattern, regex)] required, [(pattern, regex)] forbidden)
+        self.steps = {
+            name: tuple(
+                [(pattern, re.compile(pattern, re.IGNORECASE)) for pattern in flow_def.get(key, [])]
+                for key in ("required_steps", "forbidden")
+            )
+            for name, flow_def in workflows.items()
+        }
+
+        # Changes whenever WORKFLOWS does, so persisted results can be invalidated
+        self.fingerprint = hashlib.sha1(
+            json.dumps(workflows, sort_keys=True, ensure_ascii=False).encode()
+        ).hexdigest()[:16]
+
+    @staticmethod
+    def todo_text(todos):
+        """Lowercase todo contents joined with spaces"""
+        return " ".join(t.get("content", "").lower() for t in todos)
+
+    def detect(self, text):
+        """First workflow (in WORKFLOWS order) with a pattern matching text"""
+        for name, triggers in self.triggers:
+            for trigger in triggers:
+                if trigger.search(text):
+                    return name
+        return None
+
+    def validate(self, text, workflow):
+        """Compliance of text with a workflow's required and forbidden steps"""
+        if workflow not in self.workflows:
+            return {"valid": True, "missing": []}
+
+        required, forbidden = self.steps[workflow]
+        missing = [pattern for pattern, regex in required if not regex.search(text)]
+
+        # Check forbidden patterns
+        for pattern, regex in forbidden:
+            if regex.search(text):
+                return {
+                    "valid": False,
+                    "missing": [],
+                    "error": f"❌ Forbidden pattern detected: {pattern}"
+                }
+
+        return {
+            "valid": len(missing) == 0,
+            "missing": missing,
+            "suggested": self.workflows[workflow].get("suggested", [])
+        }
+
+    def evaluate(self, todos):
+        """
+        Detect the workflow and validate the todos against it
+
+        Returns:
+            (workflow name or None, compliance dict or None)
+        """
+        text = self.todo_text(todos)
+        workflow = self.detect(text)
+        return workflow, self.validate(text, workflow) if workflow else None
+
+MATCHER = WorkflowMatcher(WORKFLOWS)
+
 # === HELPER FUNCTIONS ===
 
 def detect_superflow(todos):
     """Detect active superflow from todo content"""
-    all_content = " ".join(t.get("content", "").lower() for t in todos)
-
-    for flow_name, flow_def in WORKFLOWS.items():
-        for pattern in flow_def["patterns"]:
-            if re.search(pattern, all_content, re.IGNORECASE):
-                return flow_name
-
-    return None
+    return MATCHER.detect(MATCHER.todo_text(todos))
 
 def validate_workflow_compliance(todos, workflow):
     """Check if todos contain required steps for the workflow"""
-    if workflow not in WORKFLOWS:
-        return {"valid": True, "missing": []}
-
-    flow_def = WORKFLOWS[workflow]
-    all_content = " ".join(t.get("content", "").lower() for t in todos)
-
-    missing = []
-
-    # Check required steps
-    for required_pattern in flow_def.get("required_steps", []):
-        if not re.search(required_pattern, all_content, re.IGNORECASE):
-            missing.append(required_pattern)
-
-    # Check forbidden patterns
-    for forbidden in flow_def.get("forbidden", []):
-        if re.search(forbidden, all_content, re.IGNORECASE):
-            return {
-                "valid": False,
-                "missing": [],
-                "error": f"❌ Forbidden pattern detected: {forbidden}"
-            }
+    return MATCHER.validate(MATCHER.todo_text(todos), workflow)
 
+def count_statuses(todos):
+    """Todo counts by status, taken once per call and shared by the checks"""
+    statuses = [t.get("status") for t in todos]
     return {
-        "valid": len(missing) == 0,
-        "missing": missing,
-        "suggested": flow_def.get("suggested", [])
+        "completed": statuses.count("completed"),
+        "pending": statuses.count("pending"),
+        "in_progress": statuses.count("in_progress"),
+        "total": len(statuses),
     }
 
-def check_sequential_execution(todos):
+def check_sequential_execution(todos, counts=None):
     """Validate one in_progress at a time"""
-    in_progress = [t for t in todos if t.get("status") == "in_progress"]
+    in_progress = (counts or count_statuses(todos))["in_progress"]
 
-    if len(in_progress) == 0:
+    if in_progress == 0:
         return {"valid": False, "message": "⚠️ No todo marked as in_progress. Mark current task."}
-    elif len(in_progress) > 1:
-        return {"valid": False, "message": f"❌ Multiple todos in_progress ({len(in_progress)}). Only one at a time."}
+    elif in_progress > 1:
+        return {"valid": False, "message": f"❌ Multiple todos in_progress ({in_progress}). Only one at a time."}
 
     return {"valid": True}
 
-def check_completion_blocker(todos):
+def check_completion_blocker(todos, counts=None):
     """Check if all todos are completed or if work should continue"""
-    statuses = [t.get("status") for t in todos]
+    counts = counts or count_statuses(todos)
 
-    completed = sum(1 for s in statuses if s == "completed")
-    pending = sum(1 for s in statuses if s == "pending")
-    in_progress = sum(1 for s in statuses if s == "in_progress")
+    completed = counts["completed"]
+    pending = counts["pending"]
+    in_progress = counts["in_progress"]
 
-    total = len(todos)
+    total = counts["total"]
 
     # If all completed, we're done
     if completed == total:
@@ -161,47 +234,152 @@ def check_completion_blocker(todos):
 
     return {"continue": False, "all_complete": False}
 
-def update_session_state(todos, workflow):
-    """Write state to .claude-session for statusline"""
-    session_file = Path(".claude-session")
+# === TODO SNAPSHOT ===
+
+SNAPSHOT_FILE = ".claude/todo-snapshot.json"
+
+# path -> (mtime_ns, size, snapshot); lets the resident daemon skip rereads
+_snapshot_cache = {}
+
+def todo_keys(contents):
+    """Content hash per todo ("<hash>#<n>" for the n-th repeat of the same content)"""
+    seen = {}
+    keys = []
+    for content in contents:
+        digest = hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=8).hexdigest()
+        repeat = seen.get(digest, 0)
+        seen[digest] = repeat + 1
+        keys.append(f"{digest}#{repeat}" if repeat else digest)
+    return keys
+
+def load_todo_snapshot(root=Path(".")):
+    """
+    Previous todo list: {"matcher", "text_hash", "todos": {key: status},
+    "result": [workflow, compliance]}
+    """
+    path = Path(root) / SNAPSHOT_FILE
+    try:
+        stat = path.stat()
+    except OSError:
+        return {}
+
+    key = str(path.resolve())
+    cached = _snapshot_cache.get(key)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    try:
+        snapshot = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    _snapshot_cache[key] = (stat.st_mtime_ns, stat.st_size, snapshot)
+    return snapshot
+
+def save_todo_snapshot(snapshot, root=Path(".")):
+    """Replace the snapshot atomically (silently skipped if it cannot be written)"""
+    path = Path(root) / SNAPSHOT_FILE
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(snapshot, separators=(",", ":")))
+        os.replace(tmp_path, path)
+        stat = path.stat()
+    except OSError:
+        return
+    _snapshot_cache[str(path.resolve())] = (stat.st_mtime_ns, stat.st_size, snapshot)
+
+def diff_todos(previous, current):
+    """
+    Delta between two {key: status} todo maps
+
+    Returns:
+        {"added": [keys], "removed": [keys], "transitions": {key: [old, new]}}
+    """
+    return {
+        "added": [key for key in current if key not in previous],
+        "removed": [key for key in previous if key not in current],
+        "transitions": {
+            key: [previous[key], status]
+            for key, status in current.items()
+            if key in previous and previous[key] != status
+        },
+    }
+
+def track_todos(todos, root=Path(".")):
+    """
+    Detect the workflow and check compliance against the previous TodoWrite
+
+    When the todo text is unchanged (the usual case: only statuses moved)
+    the stored result is reused without running the matcher. Otherwise the
+    whole todo text is matched again: patterns may span todos, so results
+    of single todos cannot be combined. The snapshot is rewritten only when
+    the text or a status changed.
+
+    Returns:
+        (workflow name or None, compliance dict or None)
+    """
+    snapshot = load_todo_snapshot(root)
+    if snapshot.get("matcher") != MATCHER.fingerprint:
+        snapshot = {}  # WORKFLOWS changed: the stored result is stale
 
+    contents = [str(t.get("content", "")) for t in todos]
     statuses = [t.get("status") for t in todos]
-    completed = sum(1 for s in statuses if s == "completed")
-    pending = sum(1 for s in statuses if s == "pending")
-    in_progress = sum(1 for s in statuses if s == "in_progress")
-    total = len(todos)
+    text_hash = hashlib.blake2b(json.dumps(contents).encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+    previous = snapshot.get("todos", {})
+
+    text_changed = text_hash != snapshot.get("text_hash")
+    if text_changed:
+        keys = todo_keys(contents)
+        workflow, compliance = MATCHER.evaluate(todos)
+    else:
+        keys = list(previous)
+        workflow, compliance = snapshot["result"]
+
+    current = dict(zip(keys, statuses))
+    delta = diff_todos(previous, current)
+    if text_changed or delta["added"] or delta["removed"] or delta["transitions"]:
+        save_todo_snapshot({
+            "matcher": MATCHER.fingerprint,
+            "text_hash": text_hash,
+            "todos": current,
+            "result": [workflow, compliance],
+        }, root)
+
+    return workflow, compliance
+
+def read_session_data(root=Path(".")):
+    """Parse .claude-session into a dict (cached until the file changes)"""
+    return get_store(root).read()
+
+def update_session_state(todos, workflow, root=Path("."), counts=None):
+    """Write state to .claude-session for statusline"""
+    counts = counts or count_statuses(todos)
+    completed = counts["completed"]
+    pending = counts["pending"]
+    in_progress = counts["in_progress"]
+    total = counts["total"]
 
     # Get current in_progress todo
     current_todo = next((t for t in todos if t.get("status") == "in_progress"), None)
     current_step = current_todo.get("activeForm", "Planning") if current_todo else "Planning"
 
-    # Read existing session data
-    session_data = {}
-    if session_file.exists():
-        for line in session_file.read_text().strip().split("\n"):
-            if "=" in line:
-                key, value = line.split("=", 1)
-                session_data[key] = value
-
-    # Update with new data
-    if workflow:
-        session_data["ACTIVE_SUPERFLOW"] = workflow
-
-    session_data.update({
-        "TODO_TOTAL": str(total),
-        "TODO_COMPLETED": str(completed),
-        "TODO_PENDING": str(pending),
-        "TODO_IN_PROGRESS": str(in_progress),
-        "TODO_PROGRESS": f"{completed}/{total}",
-        "TODO_CURRENT_STEP": current_step,
-    })
+    # Merge into the existing session data (locked, written atomically)
+    with get_store(root).transaction() as session_data:
+        if workflow:
+            session_data["ACTIVE_SUPERFLOW"] = workflow
 
-    # Create session start time if not exists
-    if "SESSION_START" not in session_data:
-        session_data["SESSION_START"] = datetime.now().isoformat()
+        session_data.update({
+            "TODO_TOTAL": str(total),
+            "TODO_COMPLETED": str(completed),
+            "TODO_PENDING": str(pending),
+            "TODO_IN_PROGRESS": str(in_progress),
+            "TODO_PROGRESS": f"{completed}/{total}",
+            "TODO_CURRENT_STEP": current_step,
+        })
 
-    # Write back
-    session_file.write_text("\n".join(f"{k}={v}" for k, v in session_data.items()) + "\n")
+        # Create session start time if not exists
+        if "SESSION_START" not in session_data:
+            session_data["SESSION_START"] = datetime.now().isoformat()
 
 def generate_missing_todos(missing_patterns, workflow):
     """Generate suggested todos for missing workflow steps"""
@@ -235,8 +413,8 @@ def generate_missing_todos(missing_patterns, workflow):
 
     return suggestions
 
-def write_workflow_observation(workflow, todos, session_data):
-    """Write completed workflow as an observation for future memory searches"""
+def write_workflow_observation(workflow, todos, session_data, root=Path(".")):
+    """Record completed workflow as an observation for future memory searches (returns its id)"""
     try:
         from datetime import datetime
 
@@ -264,50 +442,36 @@ def write_workflow_observation(workflow, todos, session_data):
             "concepts": [workflow.lower().replace(" ", "-"), "workflow-completion", "developer-skills"]
         }
 
-        # Write to observations file
-        obs_dir = Path(".claude/observations")
-        obs_dir.mkdir(parents=True, exist_ok=True)
+        # Append to the indexed workflow memory (sqlite3 is only imported here)
+        from workflow_memory import get_memory
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        obs_file = obs_dir / f"workflow_{timestamp}.json"
-
-        with open(obs_file, 'w') as f:
-            json.dump(observation, f, indent=2)
-
-        return obs_file
+        return get_memory(root).record("observation", observation)
     except Exception as e:
         # Silent fail - don't break the workflow if observation writing fails
         return None
 
-def check_context_compression_needed(todos):
+def check_context_compression_needed(todos, counts=None):
     """Check if completed todos should be archived to save context"""
-    completed = [t for t in todos if t.get("status") == "completed"]
-    pending = [t for t in todos if t.get("status") != "completed"]
+    counts = counts or count_statuses(todos)
+    completed = counts["completed"]
+    pending = counts["total"] - completed  # Everything not completed
 
     # If more than 8 completed todos and still have pending work, compress
-    if len(completed) > 8 and len(pending) > 0:
+    if completed > 8 and pending > 0:
         return {
             "compress": True,
-            "completed_count": len(completed),
-            "pending_count": len(pending)
+            "completed_count": completed,
+            "pending_count": pending
         }
 
     return {"compress": False}
 
-def archive_completed_todos(todos, workflow):
+def archive_completed_todos(todos, workflow, root=Path(".")):
     """Archive completed todos to free up context"""
     try:
         completed = [t for t in todos if t.get("status") == "completed"]
         pending = [t for t in todos if t.get("status") != "completed"]
 
-        # Create archive directory
-        archive_dir = Path(".claude/workflow-archive")
-        archive_dir.mkdir(parents=True, exist_ok=True)
-
-        # Write archive file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        archive_file = archive_dir / f"archive_{timestamp}.json"
-
         archive_data = {
             "timestamp": datetime.now().isoformat(),
             "workflow": workflow,
@@ -315,13 +479,17 @@ def archive_completed_todos(todos, workflow):
             "summary": f"Archived {len(completed)} completed steps"
         }
 
-        with open(archive_file, 'w') as f:
-            json.dump(archive_data, f, indent=2)
+        # Append to the indexed workflow memory; the same completed batch
+        # is archived on every TodoWrite until the list shrinks, so repeats
+        # resolve to the event already stored
+        from workflow_memory import get_memory
+
+        archive_id = get_memory(root).record("archive", archive_data, dedupe=True)
 
         # Create summary for context
         summary = {
             "archived_count": len(completed),
-            "archive_file": archive_file.name,
+            "archive_id": archive_id,
             "summary_text": "\n".join(f"✅ {t['content']}" for t in completed[:5])  # Show first 5
         }
 
@@ -334,30 +502,33 @@ def archive_completed_todos(todos, workflow):
 
 # === MAIN HOOK LOGIC ===
 
-def main():
-    # Read TodoWrite tool output from stdin
-    try:
-        input_data = json.load(sys.stdin)
-    except json.JSONDecodeError:
-        sys.exit(0)  # Silently pass if not valid JSON
+def observe(input_data, root=Path(".")):
+    """
+    Run all checks for one TodoWrite call
 
+    Args:
+        input_data: Hook input (parsed JSON from stdin)
+        root: Project directory holding .claude-session and .claude/
+
+    Returns:
+        Hook output dict to print, or None for no output
+    """
     # Extract todos from the tool result
     # PostToolUse hook receives the tool parameters, not the result
     todos = input_data.get("todos", [])
 
     if not todos:
-        sys.exit(0)  # Nothing to observe
+        return None  # Nothing to observe
 
-    # Detect active workflow
-    workflow = detect_superflow(todos)
+    # Detect active workflow and check compliance (matched only when the todo text changed)
+    workflow, compliance = track_todos(todos, root)
+    counts = count_statuses(todos)
 
     # Update session state (always do this)
-    update_session_state(todos, workflow)
+    update_session_state(todos, workflow, root, counts)
 
     # Validate workflow compliance
     if workflow:
-        compliance = validate_workflow_compliance(todos, workflow)
-
         if not compliance["valid"]:
             if "error" in compliance:
                 # Hard block - forbidden pattern detected
@@ -367,8 +538,7 @@ def main():
                         "additionalContext": f"\n\n{compliance['error']}\n\nWorkflow: {workflow}\n"
                     }
                 }
-                print(json.dumps(output))
-                sys.exit(0)  # Don't block, just warn
+                return output  # Don't block, just warn
 
             # Soft warning - missing required steps
             if compliance["missing"]:
@@ -393,11 +563,10 @@ def main():
                         "additionalContext": warning
                     }
                 }
-                print(json.dumps(output))
-                sys.exit(0)
+                return output
 
     # Check sequential execution
-    seq_check = check_sequential_execution(todos)
+    seq_check = check_sequential_execution(todos, counts)
     if not seq_check["valid"]:
         output = {
             "hookSpecificOutput": {
@@ -405,13 +574,12 @@ def main():
                 "additionalContext": f"\n\n{seq_check['message']}\n"
             }
         }
-        print(json.dumps(output))
-        sys.exit(0)
+        return output
 
     # Check if context compression is needed
-    compression_check = check_context_compression_needed(todos)
+    compression_check = check_context_compression_needed(todos, counts)
     if compression_check["compress"]:
-        summary = archive_completed_todos(todos, workflow)
+        summary = archive_completed_todos(todos, workflow, root)
 
         if summary:
             compression_msg = f"""
@@ -423,7 +591,7 @@ Archived {summary['archived_count']} completed steps to save context.
 **Summary of Archived Work:**
 {summary['summary_text']}
 
-Full details: `.claude/workflow-archive/{summary['archive_file']}`
+Full details: `python3 ~/.claude/hooks/workflow_memory.py show {summary['archive_id']}`
 
 **Active Work** ({compression_check['pending_count']} remaining):
 Continue with pending todos.
@@ -434,34 +602,27 @@ Continue with pending todos.
                     "additionalContext": compression_msg
                 }
             }
-            print(json.dumps(output))
-            sys.exit(0)
+            return output
 
     # Check if work should continue
-    blocker = check_completion_blocker(todos)
+    blocker = check_completion_blocker(todos, counts)
 
     # If workflow is complete, write observation
     if blocker.get("all_complete") and workflow:
         # Read session data for observation
-        session_file = Path(".claude-session")
-        session_data = {}
-        if session_file.exists():
-            for line in session_file.read_text().strip().split("\n"):
-                if "=" in line:
-                    key, value = line.split("=", 1)
-                    session_data[key] = value
+        session_data = read_session_data(root)
 
         # Write observation
-        obs_file = write_workflow_observation(workflow, todos, session_data)
+        obs_id = write_workflow_observation(workflow, todos, session_data, root)
 
-        if obs_file:
+        if obs_id:
             completion_msg = f"""
 
 🎉 **Workflow Complete!**
 
 ✅ {workflow} finished successfully
-📊 Steps completed: {len([t for t in todos if t.get('status') == 'completed'])}/{len(todos)}
-💾 Observation saved: {obs_file.name}
+📊 Steps completed: {counts['completed']}/{counts['total']}
+💾 Observation saved: #{obs_id} in .claude/workflow-memory.db
 
 This workflow has been recorded for future memory searches.
 """
@@ -471,8 +632,7 @@ This workflow has been recorded for future memory searches.
                     "additionalContext": completion_msg
                 }
             }
-            print(json.dumps(output))
-            sys.exit(0)
+            return output
 
     if blocker["continue"]:
         stats = blocker.get("stats", {})
@@ -489,10 +649,21 @@ This workflow has been recorded for future memory searches.
                 "additionalContext": reminder
             }
         }
-        print(json.dumps(output))
-        sys.exit(0)
+        return output
 
     # All checks passed
+    return None
+
+def main():
+    # Read TodoWrite tool output from stdin
+    try:
+        input_data = json.load(sys.stdin)
+    except json.JSONDecodeError:
+        sys.exit(0)  # Silently pass if not valid JSON
+
+    output = observe(input_data)
+    if output:
+        print(json.dumps(output))
     sys.exit(0)
 
 if __name__ == "__main__":
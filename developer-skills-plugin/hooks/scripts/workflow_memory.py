@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Indexed store for workflow observations and todo archives
+
+The TodoWrite observer records completed workflows ("observation") and
+archived todo batches ("archive") here instead of writing one JSON file
+per event. Everything lives in one SQLite database per project,
+.claude/workflow-memory.db:
+
+- events: append-only rows (kind, timestamp, workflow, type, title) plus
+  the full record as JSON
+- concepts: (concept, event) pairs, the inverted index for --concept
+- events_fts: FTS5 index over workflow, title, concepts and step text
+  (falls back to LIKE scans on SQLite builds without FTS5)
+
+so /recall-* lookups are index queries however many months of events
+have accumulated. Legacy .claude/observations/*.json and
+.claude/workflow-archive/*.json files are imported when the database is
+first created.
+
+Usage (Python):
+    from workflow_memory import get_memory
+
+    memory = get_memory(root)
+    event_id = memory.record("observation", observation)
+    memory.search("comments system", event_type="feature", limit=5)
+    memory.get(event_id)
+
+Usage (CLI, for the /recall-* commands):
+    workflow_memory.py search "comments system" [--type feature]
+        [--kind observation|archive] [--workflow NAME] [--concept TAG]
+        [--limit 10] [--json]
+    workflow_memory.py show ID [--json]
+    workflow_memory.py stats
+    workflow_memory.py import        # Re-import legacy JSON files
+    (all take --root DIR, default: current directory)
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import sys
+from pathlib import Path
+
+DB_FILE = ".claude/workflow-memory.db"
+
+# Per-event JSON files written before this store existed
+LEGACY_DIRS = {
+    "observation": ".claude/observations",
+    "archive": ".claude/workflow-archive",
+}
+
+KINDS = tuple(LEGACY_DIRS)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    workflow TEXT,
+    type TEXT,
+    title TEXT,
+    text TEXT NOT NULL,
+    digest TEXT UNIQUE,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_kind_time ON events (kind, timestamp);
+CREATE INDEX IF NOT EXISTS events_workflow ON events (workflow);
+CREATE TABLE IF NOT EXISTS concepts (
+    concept TEXT NOT NULL,
+    event_id INTEGER NOT NULL,
+    PRIMARY KEY (concept, event_id)
+) WITHOUT ROWID;
+"""
+
+# Contentless: the index only, rows are read back from events
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(
+    workflow, title, concepts, steps,
+    content='', tokenize='porter unicode61'
+)
+"""
+
+WORD = re.compile(r"\w+")
+
+# Text matches ranked per search, newest first: bm25 costs ~2us per match,
+# so words found in most events would otherwise make searches scale with
+# the whole history
+RANK_WINDOW = 1000
+
+
+def event_fields(kind, record):
+    """(workflow, type, title, concepts, step texts) of an observation or archive record"""
+    workflow = record.get("workflow") or ""
+    concepts = [str(c) for c in record.get("concepts", [])]
+
+    if kind == "observation":
+        steps = [str(s) for s in record.get("steps_completed", [])]
+        return workflow, record.get("type"), record.get("title", ""), concepts, steps
+
+    todos = record.get("completed_todos", [])
+    steps = [str(t.get("content", "")) if isinstance(t, dict) else str(t) for t in todos]
+    return workflow, "archive", record.get("summary", ""), concepts, steps
+
+
+def fts_query(text):
+    """Free text -> FTS5 query: any of the words, best matches ranked first"""
+    return " OR ".join(f'"{word}"' for word in WORD.findall(text.lower()))
+
+
+class WorkflowMemory:
+    """
+    .claude/workflow-memory.db in one project directory
+
+    Use get_memory() rather than constructing this directly, so the
+    resident daemon keeps one open connection per project.
+    """
+
+    def __init__(self, root=Path(".")):
+        self.root = Path(root)
+        self.path = self.root / DB_FILE
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        created = not self.path.exists()
+
+        self.conn = sqlite3.connect(str(self.path), timeout=5)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+            try:
+                self.conn.execute(FTS_SCHEMA)
+                self.fts = True
+            except sqlite3.OperationalError:
+                self.fts = False  # SQLite built without FTS5: search scans events.text
+
+        if created:
+            self.import_legacy()
+
+    def close(self):
+        self.conn.close()
+
+    def _insert(self, kind, record, digest=None):
+        workflow, event_type, title, concepts, steps = event_fields(kind, record)
+        text = "\n".join([workflow, title, " ".join(concepts)] + steps).lower()
+
+        cursor = self.conn.execute(
+            "INSERT OR IGNORE INTO events (kind, timestamp, workflow, type, title, text, digest, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (kind, record.get("timestamp", ""), workflow, event_type, title, text, digest,
+             json.dumps(record, ensure_ascii=False)),
+        )
+        if not cursor.rowcount:
+            row = self.conn.execute("SELECT id FROM events WHERE digest = ?", (digest,)).fetchone()
+            return row["id"]
+
+        event_id = cursor.lastrowid
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO concepts (concept, event_id) VALUES (?, ?)",
+            [(concept.lower(), event_id) for concept in concepts],
+        )
+        if self.fts:
+            self.conn.execute(
+                "INSERT INTO events_fts (rowid, workflow, title, concepts, steps) VALUES (?, ?, ?, ?, ?)",
+                (event_id, workflow, title, " ".join(concepts), "\n".join(steps)),
+            )
+        return event_id
+
+    def record(self, kind, record, dedupe=False):
+        """
+        Append one event
+
+        Args:
+            kind: "observation" or "archive"
+            record: The event as written to the legacy JSON files
+            dedupe: Return the existing event instead of appending when an
+                identical record (ignoring its timestamp) is already stored
+
+        Returns:
+            Event id
+        """
+        if kind not in KINDS:
+            raise ValueError(f"Unknown event kind: {kind}")
+
+        digest = None
+        if dedupe:
+            payload = {k: v for k, v in record.items() if k != "timestamp"}
+            digest = hashlib.sha1(
+                (kind + json.dumps(payload, sort_keys=True, ensure_ascii=False)).encode()
+            ).hexdigest()
+
+        with self.conn:
+            return self._insert(kind, record, digest)
+
+    def import_legacy(self):
+        """Import the per-event JSON files of older versions; returns the count"""
+        count = "SELECT COUNT(*) FROM events"
+        before = self.conn.execute(count).fetchone()[0]
+        with self.conn:
+            for kind, directory in LEGACY_DIRS.items():
+                for path in sorted((self.root / directory).glob("*.json")):
+                    try:
+                        record = json.loads(path.read_text())
+                    except (OSError, ValueError):
+                        continue
+                    # The file name keeps re-imports from duplicating events
+                    self._insert(kind, record, digest=f"legacy:{directory}/{path.name}")
+        return self.conn.execute(count).fetchone()[0] - before
+
+    def search(self, query=None, kind=None, event_type=None, workflow=None, concept=None, limit=10):
+        """
+        Find events, best text matches first (newest first without a query)
+
+        Text matches are ranked among the newest RANK_WINDOW events that
+        contain any of the query words and pass the other filters.
+
+        Args:
+            query: Free text matched against workflow, title, concepts and steps
+            kind: "observation" or "archive"
+            event_type: Observation type ("feature", "bugfix", "refactor", ...)
+            workflow: Workflow name, exact or without its emoji
+            concept: Concept tag (exact)
+            limit: Maximum number of events
+
+        Returns:
+            List of event dicts (the stored record plus "id" and "kind")
+        """
+        where, params = [], []
+        if kind:
+            where.append("events.kind = ?")
+            params.append(kind)
+        if event_type:
+            where.append("events.type = ?")
+            params.append(event_type)
+        if workflow:
+            where.append("(events.workflow = ? OR events.workflow LIKE ?)")
+            params.extend([workflow, f"% {workflow}"])
+        if concept:
+            where.append("events.id IN (SELECT event_id FROM concepts WHERE concept = ?)")
+            params.append(concept.lower())
+
+        order = "events.timestamp DESC, events.id DESC"
+        words = WORD.findall(query.lower()) if query else []
+        if words and self.fts:
+            # Filters go inside the window, so it holds the newest matching
+            # events that also pass them rather than any newest matches
+            sql = (
+                "SELECT events.id, events.kind, events.data FROM"
+                " (SELECT events.id AS id, bm25(events_fts) AS score"
+                " FROM events_fts JOIN events ON events.id = events_fts.rowid"
+                " WHERE " + " AND ".join(["events_fts MATCH ?", *where])
+                + " ORDER BY events_fts.rowid DESC LIMIT ?) AS hits"
+                " JOIN events ON events.id = hits.id"
+                f" ORDER BY hits.score, {order} LIMIT ?"
+            )
+            params = [fts_query(query), *params, RANK_WINDOW, limit]
+        else:
+            if words:
+                where.append("(" + " OR ".join("events.text LIKE ?" for _ in words) + ")")
+                params.extend(f"%{word}%" for word in words)
+            sql = (
+                "SELECT events.id, events.kind, events.data FROM events"
+                + (" WHERE " + " AND ".join(where) if where else "")
+                + f" ORDER BY {order} LIMIT ?"
+            )
+            params.append(limit)
+        return [self._event(row) for row in self.conn.execute(sql, params)]
+
+    def get(self, event_id):
+        """One event by id, or None"""
+        row = self.conn.execute(
+            "SELECT id, kind, data FROM events WHERE id = ?", (event_id,)
+        ).fetchone()
+        return self._event(row) if row else None
+
+    def stats(self):
+        """Event counts by kind and the most used concepts"""
+        kinds = dict(self.conn.execute("SELECT kind, COUNT(*) FROM events GROUP BY kind").fetchall())
+        concepts = self.conn.execute(
+            "SELECT concept, COUNT(*) AS n FROM concepts GROUP BY concept ORDER BY n DESC LIMIT 10"
+        ).fetchall()
+        return {
+            "events": sum(kinds.values()),
+            "by_kind": kinds,
+            "top_concepts": {row["concept"]: row["n"] for row in concepts},
+            "full_text_search": self.fts,
+        }
+
+    @staticmethod
+    def _event(row):
+        event = json.loads(row["data"])
+        event["id"] = row["id"]
+        event["kind"] = row["kind"]
+        return event
+
+
+# resolved project path -> WorkflowMemory, shared by everything in the process
+_memories = {}
+
+
+def get_memory(root=Path(".")):
+    """The process-wide WorkflowMemory for a project directory"""
+    key = str(Path(root).resolve())
+    memory = _memories.get(key)
+    if memory is None:
+        memory = _memories[key] = WorkflowMemory(root)
+    return memory
+
+
+def format_event(event, detail=False):
+    """Readable summary of one event"""
+    steps = event.get("steps_completed") or [
+        t.get("content", "") for t in event.get("completed_todos", []) if isinstance(t, dict)
+    ]
+    header = f"#{event['id']} {event.get('timestamp', '')[:16]} {event['kind']}: " \
+             f"{event.get('title') or event.get('summary', '')}"
+    if event.get("workflow") and event["workflow"] not in header:
+        header += f" [{event['workflow']}]"
+    if event.get("duration_minutes"):
+        header += f" ({event['duration_minutes']} min)"
+
+    shown = steps if detail else steps[:3]
+    lines = [header] + [f"    ✅ {step}" for step in shown]
+    if len(steps) > len(shown):
+        lines.append(f"    ... and {len(steps) - len(shown)} more steps")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Query workflow observations and todo archives")
+    parser.add_argument("--root", default=".", help="Project directory holding .claude/")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    search_cmd = commands.add_parser("search", help="Search events")
+    search_cmd.add_argument("query", nargs="?", help="Free text (omit to list newest events)")
+    search_cmd.add_argument("--kind", choices=KINDS)
+    search_cmd.add_argument("--type", help="feature, bugfix, refactor, change")
+    search_cmd.add_argument("--workflow")
+    search_cmd.add_argument("--concept")
+    search_cmd.add_argument("--limit", type=int, default=10)
+    search_cmd.add_argument("--json", action="store_true")
+
+    show_cmd = commands.add_parser("show", help="Show one event")
+    show_cmd.add_argument("id", type=int)
+    show_cmd.add_argument("--json", action="store_true")
+
+    commands.add_parser("stats", help="Event counts and top concepts")
+    commands.add_parser("import", help="Import legacy per-event JSON files")
+
+    args = parser.parse_args(argv)
+    memory = WorkflowMemory(args.root)
+
+    if args.command == "search":
+        events = memory.search(args.query, args.kind, args.type, args.workflow, args.concept, args.limit)
+        if args.json:
+            print(json.dumps(events, indent=2, ensure_ascii=False))
+        elif not events:
+            print("No matching workflow memory")
+        else:
+            print("\n".join(format_event(event) for event in events))
+    elif args.command == "show":
+        event = memory.get(args.id)
+        if event is None:
+            print(f"No event #{args.id}", file=sys.stderr)
+            return 1
+        print(json.dumps(event, indent=2, ensure_ascii=False) if args.json else format_event(event, detail=True))
+    elif args.command == "stats":
+        print(json.dumps(memory.stats(), indent=2, ensure_ascii=False))
+    else:
+        print(f"Imported {memory.import_legacy()} legacy events")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,962 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmarks
+
+Measures the hot paths of the 50kLinesPerHour data pipeline scripts and
+checks that optimized paths still produce the same results as the simple
+reference implementations.
+
+Usage:
+    python benchmark.py classifier
+    python benchmark.py classifier --lines 200000
+    python benchmark.py stream
+    python benchmark.py bytes --lines 200000
+    python benchmark.py cache --unique 0.2
+    python benchmark.py pool --workers 1 2 4 8
+    python benchmark.py debounce
+    python benchmark.py adaptive --jobs 20 --client-delay 0.02
+    python benchmark.py scan --files 20000
+    python benchmark.py load --lines 200000 --jobs 8
+    python benchmark.py load --rate 50 --lines 2000 --mix debug=0.6,progress=0.3,error=0.05,phase=0.05
+    python benchmark.py load --fixture speckit.log --min-rate 5000
+    python benchmark.py store --lines 200000
+    python benchmark.py queries --logs 600000
+    python benchmark.py watch --files 1000
+"""
+
+import asyncio
+import os
+import json
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from dashboard_state import DashboardStateManager, DashboardUpdate, JobState
+from db_pool import ReadOnlyPool
+from log_parser import BytesLogParser, LogParser, ParsedLog, parse_log_line, read_chunks
+from log_store import LogStore
+from parser_pool import ParserPool
+from pipeline_watch import PipelineWatcher
+from pipeline_queries import (
+    ARTIFACT_SAMPLES_SQL, ARTIFACT_STATS_SQL, LOG_SAMPLES_SQL, LOG_STATS_SQL, STREAM_ACTIVITY_SQL, STREAM_TYPES,
+    create_missing_indexes, log_stats, stream_activity,
+)
+from project_scanner import scan_incremental, scan_project
+from update_emitter import FrameFanout, UpdateEmitter, encode_frame
+
+
+# Representative speckit subprocess output
+SAMPLE_LINES = [
+    "DEBUG: aiosqlite executing functools.partial(<function connect at 0x7f3a>)",
+    "DEBUG: aiosqlite returning exception OperationalError",
+    'INFO:     127.0.0.1:54321 - "GET /api/jobs/12 HTTP/1.1" 200 OK',
+    "INFO:     uvicorn.access GET /streams/logs",
+    "Creating file: /mnt/c/Users/Bob/Documents/project/src/main.py",
+    "Writing /mnt/c/Users/Bob/Documents/project/plan.md",
+    "Installing dependencies...",
+    "ERROR: Failed to generate specification",
+    "Exception: ValueError in component renderer",
+    "WARNING: Deprecated option --fast",
+    "Implementing feature: User authentication (Step 3/5)",
+    "Step 4 of 12: generating tasks",
+    "[ 42%] Building target dashboard",
+    "Running tests for module auth",
+    "  File \"/usr/lib/python3/site-packages/fastapi/routing.py\", line 212",
+    "Traceback (most recent call last):",
+    "Reviewing generated code for consistency",
+    "Processing component Header and rendering output for display",
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod",
+    "Résumé généré pour l'étape de spécification",
+]
+
+
+def reference_parse(parser: LogParser, raw_line: str) -> ParsedLog:
+    """Original per-pattern implementation of LogParser.parse"""
+    sanitized = parser.sanitize_paths(raw_line.strip())
+
+    if parser.is_error(sanitized):
+        level = 'error'
+    elif 'WARNING:' in sanitized or 'WARN:' in sanitized:
+        level = 'warning'
+    elif 'DEBUG:' in sanitized:
+        level = 'debug'
+    else:
+        level = 'info'
+
+    if parser.should_hide(sanitized):
+        should_display = False
+    elif level == 'error':
+        should_display = True
+    elif level == 'debug':
+        should_display = False
+    else:
+        should_display = True
+
+    return ParsedLog(
+        message=sanitized,
+        level=level,
+        phase=parser.detect_phase(sanitized),
+        should_display=should_display,
+        is_progress=parser.is_progress_log(sanitized)
+    )
+
+
+def make_corpus(count: int, seed: int = 0) -> List[str]:
+    """Build a shuffled corpus of sample lines"""
+    rng = random.Random(seed)
+    return [rng.choice(SAMPLE_LINES) for _ in range(count)]
+
+
+def time_lines(func: Callable[[str], object], lines: List[str]) -> float:
+    """Return lines/sec for func over lines"""
+    start = time.perf_counter()
+    for line in lines:
+        func(line)
+    elapsed = time.perf_counter() - start
+    return len(lines) / elapsed if elapsed else float('inf')
+
+
+def bench_classifier(line_count: int):
+    """Compare LogParser.parse against the per-pattern reference path"""
+    parser = LogParser(cache_size=0)
+    lines = make_corpus(line_count)
+
+    # Results must be identical before speed matters
+    for line in SAMPLE_LINES:
+        expected = reference_parse(parser, line)
+        actual = parser.parse(line)
+        if expected != actual:
+            print(f"❌ Mismatch for {line!r}:\n   expected {expected}\n   actual   {actual}")
+            sys.exit(1)
+
+    reference_rate = time_lines(lambda line: reference_parse(parser, line), lines)
+    compiled_rate = time_lines(parser.parse, lines)
+
+    print(f"Classifier benchmark ({line_count} lines)")
+    print("-" * 40)
+    print(f"Reference (per-pattern): {reference_rate:>12,.0f} lines/sec")
+    print(f"Compiled classifier:     {compiled_rate:>12,.0f} lines/sec")
+    print(f"Speedup:                 {compiled_rate / reference_rate:>12.2f}x")
+
+
+def bench_cache(line_count: int, unique_ratio: float):
+    """Compare cached and uncached parsing on a corpus with repeated lines"""
+    lines = make_job_corpus(line_count, unique_ratio)
+
+    uncached = LogParser(cache_size=0)
+    cached = LogParser()
+
+    uncached_rate = time_lines(uncached.parse, lines)
+    cached_rate = time_lines(cached.parse, lines)
+    stats = cached.cache.stats()
+
+    print(f"Cache benchmark ({line_count} lines, {unique_ratio:.0%} unique)")
+    print("-" * 40)
+    print(f"Uncached:  {uncached_rate:>12,.0f} lines/sec")
+    print(f"Cached:    {cached_rate:>12,.0f} lines/sec")
+    print(f"Speedup:   {cached_rate / uncached_rate:>12.2f}x")
+    print(f"Hit rate:  {stats['hit_rate']:>12.1%} ({stats['hits']} hits, {stats['misses']} misses)")
+
+
+def make_job_corpus(count: int, unique_ratio: float = 0.2, seed: int = 1) -> List[str]:
+    """Corpus where a share of lines is unique, so caches do not hide parse cost"""
+    rng = random.Random(seed)
+    return [
+        f"{line} #{seed}.{i}" if rng.random() < unique_ratio else line
+        for i, line in enumerate(make_corpus(count, seed))
+    ]
+
+
+def bench_pool(line_count: int, jobs: int, batch_size: int, worker_counts: List[int]):
+    """Measure ParserPool throughput for many concurrent jobs"""
+    job_batches = []
+    for job_id in range(jobs):
+        lines = make_job_corpus(line_count // jobs, seed=job_id)
+        job_batches.append([lines[i:i + batch_size] for i in range(0, len(lines), batch_size)])
+    total = (line_count // jobs) * jobs
+
+    async def run_job(pool: ParserPool, job_id: int) -> int:
+        parsed = 0
+        for batch in job_batches[job_id]:
+            parsed += len(await pool.parse_batch(job_id, batch))
+        return parsed
+
+    async def run(workers: int) -> float:
+        async with ParserPool(workers=workers) as pool:
+            # Warm up worker processes before timing
+            await asyncio.gather(*(pool.parse_batch(shard, ['warm up'] * batch_size) for shard in range(workers)))
+
+            start = time.perf_counter()
+            counts = await asyncio.gather(*(run_job(pool, job_id) for job_id in range(jobs)))
+            elapsed = time.perf_counter() - start
+
+        if sum(counts) != total:
+            print(f"❌ Parsed {sum(counts)} lines, expected {total}")
+            sys.exit(1)
+        return total / elapsed
+
+    print(f"Pool benchmark ({total} lines, {jobs} jobs, batches of {batch_size})")
+    print("-" * 40)
+    print(f"{'In-process:':<14} {asyncio.run(run(0)):>12,.0f} lines/sec")
+    for workers in worker_counts:
+        print(f"{f'{workers} worker(s):':<14} {asyncio.run(run(workers)):>12,.0f} lines/sec")
+
+
+class ReferenceStateManager:
+    """Original datetime-based debouncing of DashboardStateManager (log/progress paths)"""
+
+    def __init__(self, debounce_intervals: Dict[str, float]):
+        self.last_updates: Dict[str, datetime] = {}
+        self.debounce_intervals = debounce_intervals
+
+    def _should_update_component(self, component: str, force: bool = False) -> bool:
+        if force:
+            return True
+        now = datetime.utcnow()
+        last_update = self.last_updates.get(component)
+        if not last_update:
+            return True
+        interval = self.debounce_intervals.get(component, 5)
+        return (now - last_update).total_seconds() >= interval
+
+    def _mark_updated(self, component: str):
+        self.last_updates[component] = datetime.utcnow()
+
+    def calculate_updates(self, job: JobState, event_type: str, force: bool = False) -> DashboardUpdate:
+        updates = DashboardUpdate()
+        if event_type == 'log':
+            if self._should_update_component('logs_panel', force):
+                updates.logs_panel = True
+                self._mark_updated('logs_panel')
+        elif event_type == 'progress':
+            if self._should_update_component('job_progress', force):
+                updates.job_progress = True
+                self._mark_updated('job_progress')
+            if self._should_update_component('metrics', force):
+                updates.metrics = True
+                self._mark_updated('metrics')
+        return updates
+
+
+def bench_debounce(event_count: int):
+    """Compare events/sec of the datetime and monotonic debouncers"""
+    job = JobState(job_id=1, status='in_progress', current_phase='implement')
+    events = ['log', 'log', 'log', 'progress'] * (event_count // 4)
+
+    manager = DashboardStateManager()
+    reference = ReferenceStateManager(manager.debounce_intervals)
+
+    def rate(target) -> float:
+        calculate = target.calculate_updates
+        start = time.perf_counter()
+        for event in events:
+            calculate(job, event)
+        return len(events) / (time.perf_counter() - start)
+
+    reference_rate = rate(reference)
+    monotonic_rate = rate(manager)
+
+    print(f"Debounce benchmark ({len(events)} events)")
+    print("-" * 40)
+    print(f"datetime.utcnow (before): {reference_rate:>12,.0f} events/sec")
+    print(f"monotonic_ns (after):     {monotonic_rate:>12,.0f} events/sec")
+    print(f"Speedup:                  {monotonic_rate / reference_rate:>12.2f}x")
+
+
+def _feed_reader(data: bytes) -> asyncio.StreamReader:
+    """Build a StreamReader preloaded with data, standing in for process.stdout"""
+    reader = asyncio.StreamReader(limit=1024 * 1024)
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+def bench_adaptive(duration: float, jobs: int, rate: float, client_delay: float):
+    """Fixed vs adaptive debounce intervals with one fast and one slow SSE client"""
+
+    async def simulate(adaptive: bool) -> Dict:
+        manager = DashboardStateManager()
+        controller = manager.enable_adaptive_debounce() if adaptive else None
+        fanout = FrameFanout(on_sample=controller.observe if controller else None)
+        emitter = UpdateEmitter(fanout.broadcast)
+        manager.enable_trailing_flush(emitter.submit)
+        queues = {}
+
+        async def client(name: str, delay: float):
+            with fanout.subscribe() as queue:
+                queues[name] = queue
+                async for _ in fanout.frames(queue):
+                    await asyncio.sleep(delay)
+
+        clients = [asyncio.create_task(client('fast', 0)), asyncio.create_task(client('slow', client_delay))]
+        job_states = [JobState(job_id=i + 1, status='in_progress', current_phase='implement') for i in range(jobs)]
+        rng = random.Random(0)
+        peak_logs_interval = manager.debounce_intervals['logs_panel']
+
+        async def produce(seconds: float, events_per_sec: float):
+            nonlocal peak_logs_interval
+            start = time.perf_counter()
+            sent = 0
+            while time.perf_counter() - start < seconds:
+                due = int((time.perf_counter() - start) * events_per_sec) + 1
+                for _ in range(due - sent):
+                    job = job_states[rng.randrange(jobs)]
+                    if rng.random() < 0.3:
+                        job.lines_written += 1
+                        emitter.submit(job, manager.calculate_updates(job, 'progress'))
+                    else:
+                        emitter.submit(job, manager.calculate_updates(job, 'log'))
+                sent = due
+                peak_logs_interval = max(peak_logs_interval, manager.debounce_intervals['logs_panel'])
+                await asyncio.sleep(0.01)
+
+        await produce(duration, rate)
+        busy = {
+            'fast': queues['fast'].delivered,
+            'slow': queues['slow'].delivered,
+            'slow_latency_ms': queues['slow'].mean_latency_ms(),
+            'max_depth': fanout.metrics()['max_queue_depth'],
+            'peak_logs_interval': peak_logs_interval,
+        }
+
+        # Quiet tail: once the slow client drains, intervals come back down
+        await produce(5.0, 5)
+        busy['quiet_logs_interval'] = manager.debounce_intervals['logs_panel']
+
+        for task in clients:
+            task.cancel()
+        await asyncio.gather(*clients, return_exceptions=True)
+        manager.flush_scheduler.close()
+        return busy
+
+    results = {name: asyncio.run(simulate(adaptive)) for name, adaptive in (('fixed', False), ('adaptive', True))}
+
+    print(f"Adaptive debounce benchmark ({rate:,.0f} events/sec for {duration:g}s, {jobs} jobs, "
+          f"slow client {client_delay * 1e3:g} ms/frame)")
+    print("-" * 40)
+    print(f"{'':<28}{'fixed':>12}{'adaptive':>12}")
+    for label, key, fmt in (
+        ('Frames to fast client', 'fast', '{:,}'),
+        ('Frames to slow client', 'slow', '{:,}'),
+        ('Max slow-client queue', 'max_depth', '{:,}'),
+        ('Slow-client latency (ms)', 'slow_latency_ms', '{:,.0f}'),
+        ('Peak logs_panel interval', 'peak_logs_interval', '{:.2f}s'),
+        ('logs_panel after 5s quiet', 'quiet_logs_interval', '{:.2f}s'),
+    ):
+        row = ''.join(f"{fmt.format(results[name][key]):>12}" for name in results)
+        print(f"{label + ':':<28}{row}")
+
+
+def bench_stream(line_count: int):
+    """Compare readline + parse_log_line against LogParser.parse_stream"""
+    parser = LogParser()
+    data = ''.join(f"{line}\n" for line in make_corpus(line_count)).encode()
+
+    async def per_line() -> int:
+        reader = _feed_reader(data)
+        count = 0
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            parse_log_line(line.decode())
+            count += 1
+        return count
+
+    async def streamed() -> int:
+        count = 0
+        async for _ in parser.parse_stream(read_chunks(_feed_reader(data))):
+            count += 1
+        return count
+
+    results = {}
+    for name, func in (('readline + parse_log_line', per_line), ('parse_stream', streamed)):
+        start = time.perf_counter()
+        count = asyncio.run(func())
+        results[name] = count / (time.perf_counter() - start)
+        if count != line_count:
+            print(f"❌ {name} parsed {count} lines, expected {line_count}")
+            sys.exit(1)
+
+    print(f"Stream benchmark ({line_count} lines)")
+    print("-" * 40)
+    for name, rate in results.items():
+        print(f"{name + ':':<26} {rate:>12,.0f} lines/sec")
+
+
+def bench_bytes(line_count: int):
+    """Compare LogParser.parse_stream + should_display against BytesLogParser"""
+    lines = [line for _, line in generate_load(line_count, 1, DEFAULT_LOAD_MIX)]
+    corpora = {
+        'repeated lines': lines,
+        # Timestamped output: every line is unique, so the parse cache never hits
+        'timestamped lines': [f"{i / 50:012.3f} {line}" for i, line in enumerate(lines)],
+    }
+
+    print(f"Bytes-mode benchmark ({line_count} lines)")
+    for corpus, corpus_lines in corpora.items():
+        data = ''.join(f"{line}\n" for line in corpus_lines).encode()
+        bytes_parser = BytesLogParser()
+
+        async def text_mode() -> List[ParsedLog]:
+            parser = LogParser()
+            return [
+                parsed async for parsed in parser.parse_stream(read_chunks(_feed_reader(data)))
+                if parsed.should_display
+            ]
+
+        async def bytes_mode() -> List[ParsedLog]:
+            return [parsed async for parsed in bytes_parser.parse_stream(read_chunks(_feed_reader(data)))]
+
+        results = {}
+        outputs = {}
+        for name, func in (('parse_stream (str)', text_mode), ('BytesLogParser', bytes_mode)):
+            start = time.perf_counter()
+            outputs[name] = asyncio.run(func())
+            results[name] = line_count / (time.perf_counter() - start)
+
+        if outputs['parse_stream (str)'] != outputs['BytesLogParser']:
+            print(f"❌ BytesLogParser output differs from the str parser on {corpus}")
+            sys.exit(1)
+
+        print("-" * 40)
+        print(f"{corpus} ({bytes_parser.decoded:,} of {bytes_parser.lines:,} decoded)")
+        for name, rate in results.items():
+            print(f"{name + ':':<26} {rate:>12,.0f} lines/sec")
+    print("✓ Displayed lines identical")
+
+def reference_scan(project_path: Path) -> Dict:
+    """check_script_output's original rglob walk (string skip test, second stat)"""
+    files = []
+    latest_mtime = None
+    for file_path in project_path.rglob('*'):
+        if file_path.is_file():
+            if any(skip in str(file_path) for skip in ['.git', 'node_modules', '__pycache__', '.specify']):
+                continue
+            files.append(str(file_path))
+            mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
+            if not latest_mtime or mtime > latest_mtime:
+                latest_mtime = mtime
+    return {'file_count': len(files), 'latest_mtime': latest_mtime}
+
+
+def make_project_tree(root: Path, file_count: int, vendored_ratio: float = 0.9):
+    """Generated-JS-project shape: a small src/ tree next to a large node_modules/"""
+    vendored = int(file_count * vendored_ratio)
+    for i in range(file_count):
+        if i < vendored:
+            directory = root / 'node_modules' / f'pkg_{i // 50}' / 'lib'
+        else:
+            directory = root / 'src' / f'module_{i // 20}'
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f'file_{i}.js').write_text('export {}\n')
+
+
+def bench_scan(file_count: int, worker_counts: List[int]):
+    """Compare rglob + string filtering against the pruned and incremental scanners"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / 'project'
+        make_project_tree(root, file_count)
+
+        # Age the tree past the racy-mtime window so rescans can trust it
+        an_hour_ago = time.time() - 3600
+        for directory, _, _ in os.walk(root):
+            os.utime(directory, (an_hour_ago, an_hour_ago))
+
+        start = time.perf_counter()
+        reference = reference_scan(root)
+        reference_time = time.perf_counter() - start
+
+        print(f"Scan benchmark ({file_count} files, {reference['file_count']} outside node_modules)")
+        print("-" * 40)
+        print(f"rglob (before):           {reference_time * 1000:>10.1f} ms")
+
+        for workers in worker_counts:
+            start = time.perf_counter()
+            result = scan_project(root, workers=workers)
+            elapsed = time.perf_counter() - start
+
+            if result.file_count != reference['file_count'] or result.latest_mtime != reference['latest_mtime']:
+                print(f"❌ workers={workers} found {result.file_count} files, "
+                      f"expected {reference['file_count']}")
+                sys.exit(1)
+
+            print(f"{f'scandir workers={workers}:':<26}{elapsed * 1000:>10.1f} ms "
+                  f"({reference_time / elapsed:.1f}x)")
+
+        # Incremental rescans: first run builds the manifest, later runs reuse it
+        manifest_path = Path(tmp) / '.pipeline-scan.json'
+        for label, trust in (('manifest build:', False), ('rescan (stat files):', False),
+                             ('rescan (dir mtimes):', True)):
+            start = time.perf_counter()
+            delta = scan_incremental(root, manifest_path, trust_dir_mtime=trust)
+            elapsed = time.perf_counter() - start
+            print(f"{label:<26}{elapsed * 1000:>10.1f} ms "
+                  f"({delta.dirs_listed} dirs listed, {delta.dirs_reused} reused)")
+
+
+# Line templates per kind for the synthetic load generator; {n} varies per
+# line so the parse cache sees a realistic share of unique lines
+LOAD_TEMPLATES = {
+    'debug': [
+        "DEBUG: aiosqlite executing functools.partial(<function connect at 0x{n:x}>)",
+        "DEBUG: aiosqlite operation functools.partial(<built-in method commit>) completed",
+        'INFO:     127.0.0.1:{n} - "GET /api/jobs/12 HTTP/1.1" 200 OK',
+        "INFO:     uvicorn.access GET /streams/logs",
+    ],
+    'info': [
+        "Processing component Header{n} and rendering output for display",
+        "Creating file: /mnt/c/Users/Bob/Documents/project/src/component_{n}.tsx",
+        "Installing dependencies...",
+    ],
+    'progress': [
+        "Writing src/module_{n}.py ({pct}%)",
+        "[{pct:3d}%] Building target dashboard",
+        "Step {step} of 12: generating code",
+    ],
+    'error': [
+        "ERROR: Failed to write src/module_{n}.py",
+        "Exception: ValueError in component renderer {n}",
+    ],
+    'phase': [
+        "Running /speckit.specify for feature {n}",
+        "Planning architecture in plan.md",
+        "Generating tasks for feature {n}",
+        "Implementing feature: module {n}",
+        "Running tests for module {n}",
+        "Reviewing generated code for module {n}",
+    ],
+}
+
+# Share of each kind in generated load (roughly a speckit implement run)
+DEFAULT_LOAD_MIX = {'debug': 0.45, 'info': 0.30, 'progress': 0.20, 'error': 0.02, 'phase': 0.03}
+
+# Production target: 50k lines per hour
+TARGET_LINES_PER_SEC = 50_000 / 3600
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """Parse 'debug=0.6,progress=0.3,...' into a mix (unlisted kinds get 0)"""
+    mix = dict.fromkeys(LOAD_TEMPLATES, 0.0)
+    for part in text.split(','):
+        kind, _, share = part.partition('=')
+        if kind.strip() not in LOAD_TEMPLATES:
+            raise ValueError(f"Unknown line kind {kind!r} (expected one of {', '.join(LOAD_TEMPLATES)})")
+        mix[kind.strip()] = float(share)
+    return mix
+
+
+def generate_load(count: int, jobs: int = 1, mix: Dict[str, float] = DEFAULT_LOAD_MIX, seed: int = 0) -> List[Tuple[int, str]]:
+    """Synthetic (job_id, line) stream with the given mix of line kinds"""
+    rng = random.Random(seed)
+    kinds = list(mix)
+    weights = [mix[kind] for kind in kinds]
+    load = []
+    for n, kind in enumerate(rng.choices(kinds, weights, k=count)):
+        template = rng.choice(LOAD_TEMPLATES[kind])
+        line = template.format(n=n, pct=n % 101, step=n % 12 + 1)
+        load.append((n % jobs + 1, line))
+    return load
+
+
+def load_fixture(path: Path, jobs: int = 1) -> List[Tuple[int, str]]:
+    """Recorded speckit output, spread round-robin over jobs"""
+    with open(path, encoding='utf-8', errors='replace') as f:
+        return [(n % jobs + 1, line.rstrip('\n')) for n, line in enumerate(f)]
+
+
+class StubBroadcaster:
+    """Stands in for stream_service: encodes frames and counts them"""
+
+    def __init__(self):
+        self.frames = 0
+        self.bytes = 0
+
+    def send(self, job: JobState, mask: int):
+        self.frames += 1
+        self.bytes += len(encode_frame(job, mask))
+
+
+def run_load(load: List[Tuple[int, str]], rate: float = 0.0) -> Dict:
+    """
+    Push load through parse → debounce → broadcast
+
+    Args:
+        rate: Lines per second to offer (0 = as fast as possible)
+
+    Returns:
+        Counts for the run: displayed lines and frames sent
+    """
+    parser = LogParser()
+    manager = DashboardStateManager()
+    broadcaster = StubBroadcaster()
+    jobs: Dict[int, JobState] = {}
+    displayed = 0
+
+    def handle(job_id: int, line: str):
+        nonlocal displayed
+        parsed = parser.parse(line)
+        if not parsed.should_display:
+            return
+        displayed += 1
+
+        job = jobs.get(job_id)
+        if job is None:
+            job = jobs[job_id] = JobState(job_id=job_id, status='in_progress', current_phase='specify')
+
+        if parsed.phase and parsed.phase != job.current_phase:
+            job.current_phase = parsed.phase
+            update = manager.calculate_updates(job, 'phase_change', force=True)
+        elif parsed.is_progress:
+            job.lines_written += 1
+            update = manager.calculate_updates(job, 'progress')
+        else:
+            update = manager.calculate_updates(job, 'log')
+
+        mask = update.to_mask()
+        if mask:
+            broadcaster.send(job, mask)
+
+    if rate <= 0:
+        for job_id, line in load:
+            handle(job_id, line)
+    else:
+        # Offer lines on a 10 ms tick, as many as the rate allows so far
+        start = time.perf_counter()
+        sent = 0
+        while sent < len(load):
+            due = min(len(load), int((time.perf_counter() - start) * rate) + 1)
+            for job_id, line in load[sent:due]:
+                handle(job_id, line)
+            sent = due
+            if sent < len(load):
+                time.sleep(0.01)
+
+    return {'displayed': displayed, 'frames': broadcaster.frames, 'frame_bytes': broadcaster.bytes}
+
+
+def bench_load(load: List[Tuple[int, str]], rate: float, measure_memory: bool = True, min_rate: float = 0.0):
+    """Throughput, CPU per line and peak memory of the parse → debounce → broadcast path"""
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    counts = run_load(load, rate)
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    cpu_per_line = cpu / len(load) if load else 0.0
+    capacity = 1 / cpu_per_line if cpu_per_line else float('inf')
+
+    print(f"Load benchmark ({len(load)} lines, {len({job for job, _ in load})} jobs, "
+          f"{'unpaced' if rate <= 0 else f'{rate:,.0f} lines/sec offered'})")
+    print("-" * 40)
+    print(f"Throughput:        {len(load) / wall:>12,.0f} lines/sec")
+    print(f"CPU per line:      {cpu_per_line * 1e6:>12.1f} µs")
+    print(f"CPU capacity:      {capacity:>12,.0f} lines/sec "
+          f"({capacity / TARGET_LINES_PER_SEC:,.0f}x the 50k lines/hour target)")
+    print(f"Displayed lines:   {counts['displayed']:>12,}")
+    print(f"Frames broadcast:  {counts['frames']:>12,} ({counts['frame_bytes']:,} bytes)")
+
+    if measure_memory:
+        # Separate pass: tracemalloc slows allocation and would skew the timings
+        tracemalloc.start()
+        run_load(load)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"Peak memory:       {peak / 1024:>12,.0f} KiB (pipeline allocations)")
+
+    if min_rate and capacity < min_rate:
+        print(f"❌ CPU capacity {capacity:,.0f} lines/sec is below --min-rate {min_rate:,.0f}")
+        sys.exit(1)
+
+
+def bench_store(line_count: int, jobs: int):
+    """Memory per retained line: parse_log_line dicts vs the columnar LogStore"""
+    parser = LogParser()
+    load = generate_load(line_count, jobs)
+    parsed = [(job_id, parser.parse(line)) for job_id, line in load]
+    messages = {id(p.message): p.message for _, p in parsed}
+    text_bytes = sum(sys.getsizeof(message) for message in messages.values())
+
+    def measure(build) -> Tuple[object, int]:
+        tracemalloc.start()
+        kept = build()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return kept, size
+
+    def build_dicts():
+        history: Dict[int, List[Dict]] = {}
+        for job_id, p in parsed:
+            history.setdefault(job_id, []).append({
+                'message': p.message, 'level': p.level, 'phase': p.phase,
+                'should_display': p.should_display, 'is_progress': p.is_progress,
+                'timestamp': time.time(),
+            })
+        return history
+
+    def build_store():
+        store = LogStore(capacity=line_count)
+        for job_id, p in parsed:
+            store.append(job_id, p)
+        return store
+
+    # Message strings already exist in both cases; only per-line overhead is counted
+    dicts, dict_bytes = measure(build_dicts)
+    store, store_bytes = measure(build_store)
+
+    start = time.perf_counter()
+    for job_id in range(1, jobs + 1):
+        store.tail(job_id, 100, levels={'error', 'warning'})
+        store.tail(job_id, 100, phase='implement')
+    query_time = (time.perf_counter() - start) / (2 * jobs)
+
+    print(f"Log store benchmark ({line_count} lines, {jobs} jobs, {text_bytes / line_count:.0f} bytes of text/line)")
+    print("-" * 40)
+    print(f"Dict per line (before):  {dict_bytes / line_count:>8.1f} bytes/line overhead")
+    print(f"LogStore (after):        {store_bytes / line_count:>8.1f} bytes/line overhead")
+    print(f"Reduction:               {dict_bytes / store_bytes:>8.1f}x")
+    print(f"Filtered tail(100):      {query_time * 1e3:>8.2f} ms")
+
+
+# Tables that must only be read through index seeks (SEARCH), never scanned
+LARGE_TABLES = ('log_entries', 'stream_messages', 'artifacts')
+
+
+def build_pipeline_db(path: Path, log_count: int, jobs: int, stream_count: int):
+    """Synthetic workflow.db with the backend's tables and the recommended indexes"""
+    rng = random.Random(12)
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.executescript("""
+            CREATE TABLE log_entries (id INTEGER PRIMARY KEY, job_id INTEGER, message TEXT, level TEXT, timestamp TEXT);
+            CREATE TABLE stream_messages (id INTEGER PRIMARY KEY, stream_type TEXT, payload TEXT, created_at TEXT);
+            CREATE TABLE artifacts (id INTEGER PRIMARY KEY, file_path TEXT, file_name TEXT, artifact_type TEXT, created_at TEXT);
+        """)
+        conn.executemany(
+            "INSERT INTO log_entries (job_id, message, level, timestamp) VALUES (?, ?, ?, ?)",
+            ((rng.randint(1, jobs), rng.choice(SAMPLE_LINES), 'info', f"2026-01-01T00:{i // 60000 % 60:02d}:{i // 1000 % 60:02d}.{i % 1000:03d}")
+             for i in range(log_count)),
+        )
+        conn.executemany(
+            "INSERT INTO stream_messages (stream_type, payload, created_at) VALUES (?, '{}', ?)",
+            ((rng.choice(STREAM_TYPES), f"2026-01-01T00:{i * 60 // stream_count:02d}:00.{i:06d}") for i in range(stream_count)),
+        )
+        conn.executemany(
+            "INSERT INTO artifacts (file_path, file_name, artifact_type, created_at) VALUES (?, ?, 'code', ?)",
+            ((f"/projects/job{i % jobs}/src/file{i}.py", f"file{i}.py", f"2026-01-01T00:00:{i % 60:02d}") for i in range(jobs * 20)),
+        )
+    conn.close()
+    create_missing_indexes(path)
+
+
+def check_query_plans(conn: sqlite3.Connection, statements: Dict[str, Tuple[str, Tuple]]) -> List[str]:
+    """EXPLAIN QUERY PLAN every statement; returns the full-scan steps on LARGE_TABLES"""
+    problems = []
+    for name, (sql, params) in statements.items():
+        for *_, detail in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params):
+            words = detail.split()
+            if words[:1] == ['SCAN'] and len(words) > 1 and words[1] in LARGE_TABLES:
+                problems.append(f"{name}: {detail}")
+    return problems
+
+
+def bench_queries(log_count: int, jobs: int, stream_count: int, sample_jobs: int):
+    """Grouped debugger queries vs the per-job loops they replace, plus a query plan gate"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "workflow.db"
+        build_pipeline_db(db_path, log_count, jobs, stream_count)
+        job_ids = list(range(1, sample_jobs + 1))
+        ids_param = json.dumps(job_ids)
+        since = "2026-01-01T00:55:00"
+        prefixes = json.dumps([[f"job{i}", f"/projects/job{i}/", f"/projects/job{i}0"] for i in range(sample_jobs)])
+
+        conn = sqlite3.connect(db_path)
+        problems = check_query_plans(conn, {
+            'LOG_STATS_SQL': (LOG_STATS_SQL, (ids_param,)),
+            'LOG_SAMPLES_SQL': (LOG_SAMPLES_SQL, (ids_param, 5)),
+            'STREAM_ACTIVITY_SQL': (STREAM_ACTIVITY_SQL, (json.dumps(STREAM_TYPES), since)),
+            'ARTIFACT_STATS_SQL': (ARTIFACT_STATS_SQL, (prefixes,)),
+            'ARTIFACT_SAMPLES_SQL': (ARTIFACT_SAMPLES_SQL, (prefixes, 5)),
+        })
+
+        def per_job():
+            for job_id in job_ids:
+                conn.execute("SELECT COUNT(*), MAX(timestamp) FROM log_entries WHERE job_id = ?", (job_id,)).fetchone()
+                conn.execute("SELECT message, level, timestamp FROM log_entries WHERE job_id = ? "
+                             "ORDER BY timestamp DESC LIMIT 5", (job_id,)).fetchall()
+            for stream_type in STREAM_TYPES:
+                conn.execute("SELECT COUNT(*) FROM stream_messages WHERE stream_type = ? AND created_at > ?",
+                             (stream_type, since)).fetchone()
+
+        async def grouped(pool: ReadOnlyPool):
+            await log_stats(pool, job_ids)
+            await stream_activity(pool, since)
+
+        def timed(run, repeats: int = 20) -> float:
+            start = time.perf_counter()
+            for _ in range(repeats):
+                run()
+            return (time.perf_counter() - start) / repeats
+
+        async def compare():
+            async with ReadOnlyPool(db_path) as pool:
+                await grouped(pool)
+                start = time.perf_counter()
+                for _ in range(20):
+                    await grouped(pool)
+                return (time.perf_counter() - start) / 20, await log_stats(pool, job_ids)
+
+        per_job_time = timed(per_job)
+        grouped_time, stats = asyncio.run(compare())
+
+        # Same samples as the per-job query
+        for job_id in job_ids:
+            expected = [f"[{level}] {message}" for message, level, _ in conn.execute(
+                "SELECT message, level, timestamp FROM log_entries WHERE job_id = ? ORDER BY timestamp DESC LIMIT 5",
+                (job_id,))]
+            assert stats[job_id]['sample_logs'] == expected, f"job {job_id} samples differ"
+        conn.close()
+
+    print(f"Pipeline query benchmark ({log_count} log rows, {stream_count} stream rows, {sample_jobs} jobs asked)")
+    print("-" * 40)
+    print(f"Per-job queries (before): {per_job_time * 1e3:>8.2f} ms")
+    print(f"Grouped queries (after):  {grouped_time * 1e3:>8.2f} ms")
+    if problems:
+        for problem in problems:
+            print(f"❌ Full scan: {problem}")
+        sys.exit(1)
+    print("✅ Query plans: index seeks only")
+
+
+def check_watch_ordering(file_count: int):
+    """File events and artifact rows in either order must match off without stalls"""
+    project = Path("/projects/app")
+    start = 1_700_000_000.0
+    failures = []
+
+    for order in ('file-first', 'row-first', 'interleaved'):
+        watcher = PipelineWatcher(Path("workflow.db"), project, stall_after=30)
+        events = []
+        for i in range(file_count):
+            path = str(project / "src" / f"file{i}.py")
+            written_at = start + i * 0.01
+            row = (i + 1, path, datetime.fromtimestamp(written_at + 0.2, timezone.utc).replace(tzinfo=None).isoformat())
+            file_event = ('file', path, written_at)
+            row_event = ('row', row)
+            row_first = order == 'row-first' or (order == 'interleaved' and i % 2)
+            events.extend([row_event, file_event] if row_first else [file_event, row_event])
+
+        for kind, *event in events:
+            if kind == 'file':
+                watcher.on_file_changed(*event, created=True)
+            else:
+                watcher.on_rows('artifacts', event)
+
+        matched = watcher.lags['file→artifact'].count
+        stalls = [stall for stall in watcher.stalls(start + 3600) if stall.startswith('artifact scanner')]
+        print(f"{order:<12} matched {matched}/{file_count}, pending files {len(watcher.pending_files)}")
+        if matched != file_count or watcher.pending_files or stalls:
+            failures.append(order)
+
+    if failures:
+        print(f"❌ False artifact scanner stalls: {', '.join(failures)}")
+        sys.exit(1)
+    print("✅ No false stalls in any event order")
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark the data pipeline scripts')
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    classifier_parser = subparsers.add_parser('classifier', help='Log line classification')
+    classifier_parser.add_argument('--lines', type=int, default=100_000, help='Lines to parse')
+
+    stream_parser = subparsers.add_parser('stream', help='Chunked pipe parsing')
+    stream_parser.add_argument('--lines', type=int, default=100_000, help='Lines to parse')
+
+    bytes_parser = subparsers.add_parser('bytes', help='Bytes-mode parsing that decodes displayed lines only')
+    bytes_parser.add_argument('--lines', type=int, default=100_000, help='Lines to parse')
+
+    cache_parser = subparsers.add_parser('cache', help='Parse cache for repeated lines')
+    cache_parser.add_argument('--lines', type=int, default=100_000, help='Lines to parse')
+    cache_parser.add_argument('--unique', type=float, default=0.2, help='Fraction of unique lines')
+
+    pool_parser = subparsers.add_parser('pool', help='Multi-process parser pool')
+    pool_parser.add_argument('--lines', type=int, default=400_000, help='Lines across all jobs')
+    pool_parser.add_argument('--jobs', type=int, default=16, help='Concurrent jobs')
+    pool_parser.add_argument('--batch', type=int, default=1000, help='Lines per batch')
+    pool_parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8], help='Worker counts')
+
+    debounce_parser = subparsers.add_parser('debounce', help='Dashboard debouncing')
+    debounce_parser.add_argument('--events', type=int, default=400_000, help='Events to process')
+
+    adaptive_parser = subparsers.add_parser('adaptive', help='Fixed vs adaptive debounce with a slow SSE client')
+    adaptive_parser.add_argument('--duration', type=float, default=3.0, help='Seconds of busy load')
+    adaptive_parser.add_argument('--jobs', type=int, default=20, help='Concurrent jobs')
+    adaptive_parser.add_argument('--rate', type=float, default=2000, help='Events per second while busy')
+    adaptive_parser.add_argument('--client-delay', type=float, default=0.02, help='Seconds the slow client spends per frame')
+
+    scan_parser = subparsers.add_parser('scan', help='Project tree scanning')
+    scan_parser.add_argument('--files', type=int, default=20_000, help='Files in the generated tree')
+    scan_parser.add_argument('--workers', type=int, nargs='+', default=[0, 4], help='Scanner thread counts')
+
+    load_parser = subparsers.add_parser('load', help='Parse → debounce → broadcast under synthetic or recorded load')
+    load_parser.add_argument('--lines', type=int, default=100_000, help='Synthetic lines to generate')
+    load_parser.add_argument('--jobs', type=int, default=4, help='Jobs the lines are spread over')
+    load_parser.add_argument('--mix', type=parse_mix, help='Line kind shares, e.g. debug=0.6,progress=0.3,error=0.1')
+    load_parser.add_argument('--fixture', type=Path, help='Replay recorded output instead of generating lines')
+    load_parser.add_argument('--rate', type=float, default=0.0, help='Lines/sec to offer (0 = unpaced)')
+    load_parser.add_argument('--no-memory', action='store_true', help='Skip the peak memory pass')
+    load_parser.add_argument('--min-rate', type=float, default=0.0, help='Fail if CPU capacity is below this')
+
+    store_parser = subparsers.add_parser('store', help='Columnar log store memory and queries')
+    store_parser.add_argument('--lines', type=int, default=200_000, help='Lines retained')
+    store_parser.add_argument('--jobs', type=int, default=4, help='Jobs the lines are spread over')
+
+    queries_parser = subparsers.add_parser('queries', help='Debugger SQL against an indexed synthetic database')
+    queries_parser.add_argument('--logs', type=int, default=600_000, help='log_entries rows')
+    queries_parser.add_argument('--jobs', type=int, default=200, help='Jobs the rows are spread over')
+    queries_parser.add_argument('--streams', type=int, default=200_000, help='stream_messages rows')
+    queries_parser.add_argument('--ask', type=int, default=20, help='Jobs asked about per call')
+
+    watch_parser = subparsers.add_parser('watch', help='Watch mode file/artifact matching in every event order')
+    watch_parser.add_argument('--files', type=int, default=1000, help='Files created')
+
+    args = parser.parse_args()
+
+    if args.benchmark == 'classifier':
+        bench_classifier(args.lines)
+    elif args.benchmark == 'stream':
+        bench_stream(args.lines)
+    elif args.benchmark == 'bytes':
+        bench_bytes(args.lines)
+    elif args.benchmark == 'cache':
+        bench_cache(args.lines, args.unique)
+    elif args.benchmark == 'pool':
+        bench_pool(args.lines, args.jobs, args.batch, args.workers)
+    elif args.benchmark == 'debounce':
+        bench_debounce(args.events)
+    elif args.benchmark == 'adaptive':
+        bench_adaptive(args.duration, args.jobs, args.rate, args.client_delay)
+    elif args.benchmark == 'scan':
+        bench_scan(args.files, args.workers)
+    elif args.benchmark == 'load':
+        if args.fixture:
+            load = load_fixture(args.fixture, args.jobs)
+        else:
+            load = generate_load(args.lines, args.jobs, args.mix or DEFAULT_LOAD_MIX)
+        bench_load(load, args.rate, not args.no_memory, args.min_rate)
+    elif args.benchmark == 'store':
+        bench_store(args.lines, args.jobs)
+    elif args.benchmark == 'queries':
+        bench_queries(args.logs, args.jobs, args.streams, args.ask)
+    elif args.benchmark == 'watch':
+        check_watch_ordering(args.files)
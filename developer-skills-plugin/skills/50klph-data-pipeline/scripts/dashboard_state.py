@@ -18,10 +18,20 @@ Usage:
     #     'insights': False,        # Don't update insights
     #     'artifacts': False,       # Don't scan artifacts yet
     # }
+
+    # Scale intervals with SSE backlog (samples from update_emitter.FrameFanout)
+    adaptive = manager.enable_adaptive_debounce()
+    adaptive.observe(queue_depth=3, latency=0.08)
+    adaptive.metrics()['intervals']
 """
 
+import asyncio
+import math
+import time
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Literal
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Awaitable, Callable, Dict, List, Optional, Literal, Tuple
 from dataclasses import dataclass, field
 
 
@@ -50,6 +60,381 @@ class DashboardUpdate:
     job_progress: bool = False
     metrics: bool = False
 
+    def to_mask(self) -> int:
+        """Pack the flags into a bitmask (bit i = COMPONENTS[i])"""
+        mask = 0
+        for index, name in enumerate(COMPONENTS):
+            if getattr(self, name):
+                mask |= 1 << index
+        return mask
+
+    @classmethod
+    def from_mask(cls, mask: int) -> 'DashboardUpdate':
+        """Unpack a bitmask produced by to_mask"""
+        return cls(**{name: bool(mask >> index & 1) for index, name in enumerate(COMPONENTS)})
+
+
+# Dashboard components in slot order (matches DashboardUpdate fields)
+COMPONENTS = (
+    'phase_indicator',
+    'kanban_board',
+    'logs_panel',
+    'insights_panel',
+    'artifacts_viewer',
+    'job_progress',
+    'metrics',
+)
+COMPONENT_INDEX = {name: index for index, name in enumerate(COMPONENTS)}
+
+PHASE_INDICATOR, KANBAN_BOARD, LOGS_PANEL, INSIGHTS_PANEL, ARTIFACTS_VIEWER, JOB_PROGRESS, METRICS = range(len(COMPONENTS))
+
+# Slot value for "never updated": far enough in the past that any interval has elapsed
+_NEVER = -(1 << 62)
+
+
+class DebounceIntervals(MutableMapping):
+    """
+    Debounce intervals in seconds per component, as a dict
+
+    Writes are passed to on_change so the Debouncer slot tables copied
+    from it stay in sync; deleting a component restores the default.
+    """
+
+    def __init__(self, intervals: Dict[str, float], on_change: Callable[[str, float], None], default_interval: float = 5):
+        self.data = dict(intervals)
+        self.on_change = on_change
+        self.default_interval = default_interval
+
+    def __getitem__(self, component: str) -> float:
+        return self.data[component]
+
+    def __setitem__(self, component: str, seconds: float):
+        self.data[component] = seconds
+        self.on_change(component, seconds)
+
+    def __delitem__(self, component: str):
+        del self.data[component]
+        self.on_change(component, self.default_interval)
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        return repr(self.data)
+
+
+class Debouncer:
+    """
+    Allocation-free debounce timers on the monotonic clock
+
+    One integer slot per component holds the last update time in
+    nanoseconds. Checking and marking a component is a list index and an
+    integer compare, and wall-clock jumps (NTP, DST) cannot freeze or
+    flood updates. Components outside COMPONENTS get extra slots on
+    first use.
+
+    The pending bitmask records components whose update was suppressed by
+    debouncing and has not been delivered since.
+    """
+
+    __slots__ = ('clock', 'default_interval_ns', 'names', 'index', 'intervals_ns', 'last_ns', 'pending')
+
+    def __init__(
+        self,
+        intervals: Dict[str, float],
+        default_interval: float = 5,
+        clock: Callable[[], int] = time.monotonic_ns
+    ):
+        """
+        Args:
+            intervals: Debounce interval in seconds per component
+            default_interval: Interval for components without one
+            clock: Nanosecond monotonic clock (injectable for testing)
+        """
+        self.clock = clock
+        self.default_interval_ns = int(default_interval * 1e9)
+        self.names: List[str] = list(COMPONENTS)
+        self.index: Dict[str, int] = dict(COMPONENT_INDEX)
+        self.intervals_ns: List[int] = [
+            int(intervals.get(name, default_interval) * 1e9) for name in COMPONENTS
+        ]
+        self.last_ns: List[int] = [_NEVER] * len(COMPONENTS)
+        self.pending = 0
+
+        for name, seconds in intervals.items():
+            if name not in COMPONENT_INDEX:
+                self.set_interval(name, seconds)
+
+    def slot(self, component: str) -> int:
+        """Slot index for a component, allocating one for unknown names"""
+        index = self.index.get(component)
+        if index is None:
+            index = self.index[component] = len(self.names)
+            self.names.append(component)
+            self.intervals_ns.append(self.default_interval_ns)
+            self.last_ns.append(_NEVER)
+        return index
+
+    def set_interval(self, component: str, seconds: float):
+        """Change a component's debounce interval"""
+        self.intervals_ns[self.slot(component)] = int(seconds * 1e9)
+
+    def ready(self, index: int, now: int) -> bool:
+        """True if the component's interval has elapsed at clock value now"""
+        return now - self.last_ns[index] >= self.intervals_ns[index]
+
+    def mark(self, index: int, now: int):
+        """Record an update at clock value now"""
+        self.last_ns[index] = now
+        self.pending &= ~(1 << index)
+
+    def suppress(self, index: int):
+        """Record that an update was held back by debouncing"""
+        self.pending |= 1 << index
+
+    def pending_components(self) -> List[str]:
+        """Names of components with suppressed, undelivered updates"""
+        return [name for index, name in enumerate(self.names) if self.pending >> index & 1]
+
+    def reset(self, index: int):
+        """Forget the last update so the next check passes"""
+        self.last_ns[index] = _NEVER
+
+    def remaining_ns(self, index: int, now: int) -> int:
+        """Nanoseconds until the component's interval elapses (0 if ready)"""
+        return max(0, self.intervals_ns[index] - (now - self.last_ns[index]))
+
+    def elapsed_ns(self, index: int, now: int) -> Optional[int]:
+        """Nanoseconds since the last update, or None if never updated"""
+        last = self.last_ns[index]
+        return None if last == _NEVER else now - last
+
+
+# Receives trailing updates: (latest job state, update) -> None or awaitable
+FlushCallback = Callable[[JobState, DashboardUpdate], Optional[Awaitable[None]]]
+
+
+class TrailingFlushScheduler:
+    """
+    Emits trailing-edge updates for debounced components
+
+    calculate_updates is leading-edge: the first event in a window goes
+    out, later ones are suppressed. When a component is suppressed, this
+    scheduler arms one asyncio timer for that job and component at the end
+    of its window. If no leading update delivered the component meanwhile,
+    the timer sends a trailing update with the job's latest JobState, so
+    final values always arrive without polling or extra messages.
+    """
+
+    def __init__(
+        self,
+        manager: 'DashboardStateManager',
+        on_flush: FlushCallback,
+        loop: Optional[asyncio.AbstractEventLoop] = None
+    ):
+        """
+        Args:
+            manager: State manager whose timers are flushed
+            on_flush: Called with (job, update) for each trailing update;
+                coroutines are scheduled as tasks
+            loop: Event loop for timers (defaults to the running loop)
+        """
+        self.manager = manager
+        self.on_flush = on_flush
+        self.loop = loop or asyncio.get_running_loop()
+
+        # (job_id, component slot) -> armed timer
+        self.timers: Dict[Tuple[int, int], asyncio.TimerHandle] = {}
+
+        # Latest state of jobs with armed timers
+        self.latest_jobs: Dict[int, JobState] = {}
+
+        self.flushed = 0
+
+    def arm(self, job: JobState, index: int, debouncer: Debouncer, now: int):
+        """Arm the trailing timer for a suppressed component (no-op if armed)"""
+        self.latest_jobs[job.job_id] = job
+
+        key = (job.job_id, index)
+        if key not in self.timers:
+            delay = debouncer.remaining_ns(index, now) / 1e9
+            self.timers[key] = self.loop.call_later(delay, self._fire, key)
+
+    def _fire(self, key: Tuple[int, int]):
+        del self.timers[key]
+        job_id, index = key
+
+        debouncer = self.manager.job_debouncers.get(job_id)
+        if debouncer is not None and debouncer.pending >> index & 1:
+            now = self.manager.clock()
+            if not debouncer.ready(index, now):
+                # Window restarted by a leading update; wait for it to close
+                delay = max(debouncer.remaining_ns(index, now) / 1e9, 0.001)
+                self.timers[key] = self.loop.call_later(delay, self._fire, key)
+                return
+
+            debouncer.mark(index, now)
+            update = DashboardUpdate()
+            setattr(update, COMPONENTS[index], True)
+            self.flushed += 1
+
+            result = self.on_flush(self.latest_jobs[job_id], update)
+            if asyncio.iscoroutine(result):
+                self.loop.create_task(result)
+
+        if not any(armed_job == job_id for armed_job, _ in self.timers):
+            self.latest_jobs.pop(job_id, None)
+
+    def cancel_job(self, job_id: int):
+        """Cancel all armed timers of a job"""
+        for key in [key for key in self.timers if key[0] == job_id]:
+            self.timers.pop(key).cancel()
+        self.latest_jobs.pop(job_id, None)
+
+    def close(self):
+        """Cancel every armed timer"""
+        for handle in self.timers.values():
+            handle.cancel()
+        self.timers.clear()
+        self.latest_jobs.clear()
+
+
+# Adaptive debounce bounds in seconds: component -> (min, max)
+DEFAULT_INTERVAL_BOUNDS = {
+    'logs_panel': (0.1, 5),
+    'job_progress': (0.25, 10),
+    'metrics': (2, 60),
+    'phase_indicator': (0.5, 10),
+    'kanban_board': (1, 30),
+}
+
+
+class AdaptiveDebounce:
+    """
+    Scales debounce intervals with how far behind SSE clients are
+
+    Load is the larger of queue depth / target_depth and broadcast latency
+    / target_latency, each smoothed over time_constant seconds. At load 1
+    every bounded component uses its configured interval; intervals scale
+    linearly with load and are clamped to their (min, max) bounds. An idle
+    dashboard therefore gets updates at the min interval, and a backlogged
+    one at up to the max interval, so slow clients receive fewer, merged
+    updates instead of a growing queue.
+
+    Samples are smoothed by elapsed time, not by count: each sample is
+    assumed to hold until the next one, so a burst of samples within a
+    millisecond weighs no more than one, and a drained queue (last sample
+    0) keeps pulling the load down while no new samples arrive.
+    calculate_updates calls tick() so intervals relax even without traffic.
+    """
+
+    def __init__(
+        self,
+        manager: 'DashboardStateManager',
+        bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+        target_depth: float = 4,
+        target_latency: float = 0.25,
+        time_constant: float = 1.0,
+        adjust_interval: float = 0.25
+    ):
+        """
+        Args:
+            manager: State manager whose intervals are adjusted
+            bounds: (min, max) seconds per adjusted component
+                (defaults to DEFAULT_INTERVAL_BOUNDS)
+            target_depth: Queued frames per client considered normal
+            target_latency: Broadcast latency in seconds considered normal
+            time_constant: Smoothing time constant for samples, in seconds
+            adjust_interval: Minimum seconds between interval changes
+        """
+        self.manager = manager
+        self.bounds = dict(DEFAULT_INTERVAL_BOUNDS if bounds is None else bounds)
+        for component, (low, high) in self.bounds.items():
+            if not 0 <= low <= high:
+                raise ValueError(f"Invalid bounds for {component}: ({low}, {high})")
+
+        # Intervals at load 1 (the configured ones)
+        self.base_intervals = {component: manager.debounce_intervals[component] for component in self.bounds}
+
+        self.target_depth = target_depth
+        self.target_latency = target_latency
+        self.time_constant_ns = time_constant * 1e9
+        self.adjust_interval_ns = int(adjust_interval * 1e9)
+
+        # Smoothed samples, and the latest raw sample (held until the next)
+        self.queue_depth = 0.0
+        self.latency = 0.0
+        self.last_depth = 0.0
+        self.last_latency = 0.0
+        self.last_sample_ns: Optional[int] = None
+        self.last_adjust_ns = _NEVER
+
+        # Counters for metrics
+        self.samples = 0
+        self.adjustments = 0
+
+    @property
+    def load(self) -> float:
+        """Smoothed backlog relative to the targets (1 = normal)"""
+        return max(self.queue_depth / self.target_depth, self.latency / self.target_latency)
+
+    def _advance(self, now: int):
+        """Move the smoothed values to now, holding the latest sample"""
+        if self.last_sample_ns is not None:
+            weight = 1 - math.exp((self.last_sample_ns - now) / self.time_constant_ns)
+            self.queue_depth += weight * (self.last_depth - self.queue_depth)
+            self.latency += weight * (self.last_latency - self.latency)
+        self.last_sample_ns = now
+
+    def observe(self, queue_depth: float, latency: float):
+        """
+        Record one backlog sample and adjust intervals if due
+
+        Args:
+            queue_depth: Frames waiting for the slowest client
+            latency: Seconds the oldest undelivered frame has waited
+        """
+        now = self.manager.clock()
+        self._advance(now)
+        self.last_depth = queue_depth
+        self.last_latency = latency
+        self.samples += 1
+        self.tick(now)
+
+    def tick(self, now: int):
+        """Adjust intervals if adjust_interval has passed since the last change"""
+        if now - self.last_adjust_ns >= self.adjust_interval_ns:
+            self.adjust(now)
+
+    def adjust(self, now: Optional[int] = None):
+        """Apply the intervals for the current load"""
+        if now is None:
+            now = self.manager.clock()
+        self._advance(now)
+
+        load = self.load
+        intervals = self.manager.debounce_intervals
+        for component, (low, high) in self.bounds.items():
+            interval = min(high, max(low, self.base_intervals[component] * load))
+            if abs(interval - intervals[component]) > 0.01 * intervals[component]:
+                self.manager.set_debounce_interval(component, interval)
+                self.adjustments += 1
+        self.last_adjust_ns = now
+
+    def metrics(self) -> Dict:
+        """Current load and effective intervals (seconds) for dashboards"""
+        return {
+            'load': round(self.load, 3),
+            'queue_depth': round(self.queue_depth, 2),
+            'broadcast_latency_ms': round(self.latency * 1000, 1),
+            'intervals': {component: round(self.manager.debounce_intervals[component], 3) for component in self.bounds},
+            'samples': self.samples,
+            'adjustments': self.adjustments,
+        }
+
 
 class DashboardStateManager:
     """
@@ -57,14 +442,27 @@ class DashboardStateManager:
 
     Prevents overwhelming the frontend with too many updates
     while ensuring critical updates are delivered immediately.
-    """
 
-    def __init__(self):
-        # Track last update time per component
-        self.last_updates: Dict[str, datetime] = {}
+    Each job gets its own debounce timers, so a noisy job cannot starve
+    the updates of other jobs. Finished jobs are evicted after
+    finished_ttl seconds, and at most max_jobs tables are kept (least
+    recently active evicted first), so memory stays bounded.
+    """
 
-        # Debounce intervals (in seconds)
-        self.debounce_intervals = {
+    def __init__(
+        self,
+        max_jobs: int = 1000,
+        finished_ttl: float = 300,
+        clock: Callable[[], int] = time.monotonic_ns
+    ):
+        """
+        Args:
+            max_jobs: Maximum number of per-job timer tables kept
+            finished_ttl: Seconds to keep a completed/failed job's timers
+            clock: Nanosecond monotonic clock (injectable for testing)
+        """
+        # Debounce intervals (in seconds); assigning to a key updates every timer table
+        self.debounce_intervals = DebounceIntervals({
             'phase_indicator': 2,     # Update phase every 2s max
             'kanban_board': 5,        # Update kanban every 5s max
             'logs_panel': 0.5,        # Logs update fast (500ms)
@@ -72,7 +470,7 @@ class DashboardStateManager:
             'artifacts_viewer': 30,   # Artifacts every 30s
             'job_progress': 1,        # Progress every 1s
             'metrics': 10,            # Metrics every 10s
-        }
+        }, self._apply_debounce_interval)
 
         # Phase transition matrix - what components update on phase change
         self.phase_components = {
@@ -86,13 +484,153 @@ class DashboardStateManager:
             'deploy': ['phase_indicator', 'kanban_board', 'job_progress'],
         }
 
-    def _should_update_component(self, component: str, force: bool = False) -> bool:
+        # Phase transition matrix as slot indices
+        self.phase_component_slots = {
+            phase: tuple(COMPONENT_INDEX[c] for c in components)
+            for phase, components in self.phase_components.items()
+        }
+
+        self.clock = clock
+        self.max_jobs = max_jobs
+        self.finished_ttl_ns = int(finished_ttl * 1e9)
+
+        # Timers for updates not tied to a job
+        self.debouncer = Debouncer(self.debounce_intervals, clock=clock)
+
+        # Per-job timers, least recently active first
+        self.job_debouncers: 'OrderedDict[int, Debouncer]' = OrderedDict()
+
+        # job_id -> clock value when the job completed or failed
+        self.finished_jobs: Dict[int, int] = {}
+
+        # Trailing-edge flushing (see enable_trailing_flush)
+        self.flush_scheduler: Optional[TrailingFlushScheduler] = None
+
+        # Load-driven intervals (see enable_adaptive_debounce)
+        self.adaptive: Optional[AdaptiveDebounce] = None
+
+    def enable_trailing_flush(self, on_flush: FlushCallback) -> TrailingFlushScheduler:
+        """
+        Send trailing updates when a debounce window closes after suppressed events
+
+        Must be called from a running event loop.
+
+        Args:
+            on_flush: Called with (latest job state, update) per trailing update
+        """
+        if self.flush_scheduler is not None:
+            self.flush_scheduler.close()
+        self.flush_scheduler = TrailingFlushScheduler(self, on_flush)
+        return self.flush_scheduler
+
+    def enable_adaptive_debounce(self, bounds: Optional[Dict[str, Tuple[float, float]]] = None, **options) -> AdaptiveDebounce:
+        """
+        Scale debounce intervals with client backlog between min/max bounds
+
+        Feed it samples with adaptive.observe(queue_depth, latency), e.g.
+        FrameFanout(on_sample=adaptive.observe). Calling it again restarts
+        from the configured intervals.
+
+        Args:
+            bounds: (min, max) seconds per component (see DEFAULT_INTERVAL_BOUNDS)
+            **options: Passed to AdaptiveDebounce
+        """
+        if self.adaptive is not None:
+            for component, seconds in self.adaptive.base_intervals.items():
+                self.set_debounce_interval(component, seconds)
+        self.adaptive = AdaptiveDebounce(self, bounds, **options)
+        return self.adaptive
+
+    def set_debounce_interval(self, component: str, seconds: float):
+        """Change a component's interval for the shared and all per-job timers"""
+        self.debounce_intervals[component] = seconds
+
+    def _apply_debounce_interval(self, component: str, seconds: float):
+        for debouncer in [self.debouncer, *self.job_debouncers.values()]:
+            debouncer.set_interval(component, seconds)
+
+    def debouncer_for(self, job_id: Optional[int]) -> Debouncer:
+        """Timer table for a job (the shared table if job_id is None)"""
+        if job_id is None:
+            return self.debouncer
+
+        debouncer = self.job_debouncers.get(job_id)
+        if debouncer is None:
+            debouncer = self.job_debouncers[job_id] = Debouncer(self.debounce_intervals, clock=self.clock)
+            self.evict_jobs()
+        else:
+            self.job_debouncers.move_to_end(job_id)
+        return debouncer
+
+    def evict_jobs(self, now: Optional[int] = None) -> List[int]:
+        """
+        Drop timers of jobs finished more than finished_ttl ago, then the
+        least recently active jobs beyond max_jobs
+
+        Returns:
+            Evicted job IDs
+        """
+        if now is None:
+            now = self.clock()
+
+        evicted = [
+            job_id for job_id, finished_at in self.finished_jobs.items()
+            if now - finished_at >= self.finished_ttl_ns
+        ]
+        for job_id in evicted:
+            self.forget_job(job_id)
+
+        while len(self.job_debouncers) > self.max_jobs:
+            job_id = next(iter(self.job_debouncers))
+            self.forget_job(job_id)
+            evicted.append(job_id)
+
+        return evicted
+
+    def forget_job(self, job_id: int):
+        """Drop all state kept for a job"""
+        self.job_debouncers.pop(job_id, None)
+        self.finished_jobs.pop(job_id, None)
+        if self.flush_scheduler is not None:
+            self.flush_scheduler.cancel_job(job_id)
+
+    def pending_updates(self) -> Dict[int, List[str]]:
+        """
+        Aggregate view of jobs with updates held back by debouncing
+
+        Returns:
+            job_id -> names of components with undelivered updates
+        """
+        return {
+            job_id: debouncer.pending_components()
+            for job_id, debouncer in self.job_debouncers.items()
+            if debouncer.pending
+        }
+
+    @property
+    def last_updates(self) -> Dict[str, datetime]:
+        """Approximate wall-clock time of each component's latest update across all jobs (for inspection)"""
+        now = self.clock()
+        wall_now = datetime.utcnow()
+        latest: Dict[str, int] = {}
+        for debouncer in [self.debouncer, *self.job_debouncers.values()]:
+            for name, index in debouncer.index.items():
+                elapsed = debouncer.elapsed_ns(index, now)
+                if elapsed is not None and elapsed < latest.get(name, elapsed + 1):
+                    latest[name] = elapsed
+        return {
+            name: wall_now - timedelta(microseconds=elapsed // 1000)
+            for name, elapsed in latest.items()
+        }
+
+    def _should_update_component(self, component: str, force: bool = False, job_id: Optional[int] = None) -> bool:
         """
         Check if component should be updated based on debounce interval
 
         Args:
             component: Component name (e.g., 'phase_indicator')
             force: If True, ignore debouncing (for critical updates)
+            job_id: Job whose timers to check (None for the shared timers)
 
         Returns:
             True if component should be updated
@@ -100,21 +638,13 @@ class DashboardStateManager:
         if force:
             return True
 
-        now = datetime.utcnow()
-        last_update = self.last_updates.get(component)
+        debouncer = self.debouncer_for(job_id)
+        return debouncer.ready(debouncer.slot(component), self.clock())
 
-        if not last_update:
-            # Never updated, allow update
-            return True
-
-        interval = self.debounce_intervals.get(component, 5)
-        elapsed = (now - last_update).total_seconds()
-
-        return elapsed >= interval
-
-    def _mark_updated(self, component: str):
+    def _mark_updated(self, component: str, job_id: Optional[int] = None):
         """Mark component as updated"""
-        self.last_updates[component] = datetime.utcnow()
+        debouncer = self.debouncer_for(job_id)
+        debouncer.mark(debouncer.slot(component), self.clock())
 
     def calculate_updates(
         self,
@@ -134,47 +664,75 @@ class DashboardStateManager:
             DashboardUpdate with flags for each component
         """
         updates = DashboardUpdate()
+        debouncer = self.debouncer_for(job.job_id)
+        now = self.clock()
+        scheduler = self.flush_scheduler
+        if self.adaptive is not None:
+            self.adaptive.tick(now)
 
         if event_type == 'log':
             # Log events only update logs panel (with debouncing)
-            if self._should_update_component('logs_panel', force):
+            if force or debouncer.ready(LOGS_PANEL, now):
                 updates.logs_panel = True
-                self._mark_updated('logs_panel')
+                debouncer.mark(LOGS_PANEL, now)
+            else:
+                debouncer.suppress(LOGS_PANEL)
+                if scheduler is not None:
+                    scheduler.arm(job, LOGS_PANEL, debouncer, now)
 
         elif event_type == 'phase_change':
             # Phase changes trigger multiple components (forced)
-            components = self.phase_components.get(job.current_phase, [])
-
-            for component in components:
-                if self._should_update_component(component, force=True):
-                    setattr(updates, component, True)
-                    self._mark_updated(component)
+            for index in self.phase_component_slots.get(job.current_phase, ()):
+                setattr(updates, COMPONENTS[index], True)
+                debouncer.mark(index, now)
 
             # Always update metrics on phase change
             updates.metrics = True
-            self._mark_updated('metrics')
+            debouncer.mark(METRICS, now)
 
         elif event_type == 'status_change':
             # Status changes (pending -> in_progress -> completed)
             # Update everything (forced)
-            for component in ['phase_indicator', 'kanban_board', 'job_progress', 'metrics']:
-                setattr(updates, component, True)
-                self._mark_updated(component)
+            updates.phase_indicator = True
+            updates.kanban_board = True
+            updates.job_progress = True
+            updates.metrics = True
+            for index in (PHASE_INDICATOR, KANBAN_BOARD, JOB_PROGRESS, METRICS):
+                debouncer.mark(index, now)
 
             # If completed, scan artifacts
             if job.status == 'completed':
                 updates.artifacts_viewer = True
-                self._mark_updated('artifacts_viewer')
+                debouncer.mark(ARTIFACTS_VIEWER, now)
+
+            # Finished jobs become eligible for eviction
+            if job.status in ('completed', 'failed'):
+                self.finished_jobs[job.job_id] = now
+                self.evict_jobs(now)
+            else:
+                self.finished_jobs.pop(job.job_id, None)
 
         elif event_type == 'progress':
             # Progress updates (lines written, etc.)
-            if self._should_update_component('job_progress', force):
+            if force or debouncer.ready(JOB_PROGRESS, now):
                 updates.job_progress = True
-                self._mark_updated('job_progress')
+                debouncer.mark(JOB_PROGRESS, now)
+            else:
+                debouncer.suppress(JOB_PROGRESS)
+                if scheduler is not None:
+                    scheduler.arm(job, JOB_PROGRESS, debouncer, now)
 
-            if self._should_update_component('metrics', force):
+            if force or debouncer.ready(METRICS, now):
                 updates.metrics = True
-                self._mark_updated('metrics')
+                debouncer.mark(METRICS, now)
+            else:
+                debouncer.suppress(METRICS)
+                if scheduler is not None:
+                    scheduler.arm(job, METRICS, debouncer, now)
+
+        if scheduler is not None and job.job_id in scheduler.latest_jobs:
+            # Trailing updates carry the newest state
+            scheduler.latest_jobs[job.job_id] = job
 
         return updates
 
@@ -182,14 +740,22 @@ class DashboardStateManager:
         """
         Determine if an insight should be generated for observer agent
 
-        Uses 15-minute debouncing as requested
+        Uses 15-minute debouncing per job as requested
+        """
+        return self._should_update_component('insights_panel', force=False, job_id=job.job_id)
+
+    def reset_component_timer(self, component: str, job_id: Optional[int] = None):
+        """Reset debounce timer for a component (useful for testing)
+
+        Resets the component for every job unless job_id is given.
         """
-        return self._should_update_component('insights_panel', force=False)
+        if job_id is not None:
+            debouncers = [self.debouncer_for(job_id)]
+        else:
+            debouncers = [self.debouncer, *self.job_debouncers.values()]
 
-    def reset_component_timer(self, component: str):
-        """Reset debounce timer for a component (useful for testing)"""
-        if component in self.last_updates:
-            del self.last_updates[component]
+        for debouncer in debouncers:
+            debouncer.reset(debouncer.slot(component))
 
 
 # Example usage
@@ -220,3 +786,11 @@ if __name__ == '__main__':
 
     print("Should generate insight?")
     print(f"  {manager.should_generate_insight(job)}")
+
+    print("\nAdaptive intervals after 2s with 12 frames queued / 600 ms behind:")
+    clock_ns = [0]
+    adaptive = DashboardStateManager(clock=lambda: clock_ns[0]).enable_adaptive_debounce()
+    adaptive.observe(queue_depth=12, latency=0.6)
+    clock_ns[0] += 2_000_000_000
+    adaptive.adjust()
+    print(f"  {adaptive.metrics()}")
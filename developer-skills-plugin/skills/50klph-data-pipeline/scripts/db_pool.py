@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Read-Only SQLite Pool
+
+Shared, read-only access to workflow.db for the pipeline debugger.
+Queries run on a small thread pool so they never block the event loop
+and independent stage checks can run in parallel.
+
+Each worker thread opens its connection once (mode=ro, query_only) and
+keeps it for the life of the pool, so repeated diagnoses pay connection
+setup once per thread instead of once per check. SQL strings are reused
+verbatim, so sqlite3's per-connection statement cache serves them as
+prepared statements after the first call.
+
+Usage:
+    from db_pool import ReadOnlyPool
+
+    async with ReadOnlyPool(db_path) as pool:
+        rows = await pool.fetchall("SELECT COUNT(*) FROM log_entries WHERE job_id = ?", (job_id,))
+"""
+
+import asyncio
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple
+
+
+class ReadOnlyPool:
+    """Thread pool with one read-only SQLite connection per worker"""
+
+    def __init__(self, db_path: Path, size: int = 4, timeout: float = 5.0, cached_statements: int = 128):
+        """
+        Args:
+            db_path: Path to the SQLite database
+            size: Worker threads (and at most as many connections)
+            timeout: Seconds to wait on a locked database
+            cached_statements: Prepared statements kept per connection
+        """
+        self.db_path = Path(db_path)
+        self.timeout = timeout
+        self.cached_statements = cached_statements
+        self.executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix='ro-sqlite')
+
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Connection owned by the calling worker thread"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # mode=ro never creates the file and never takes write locks,
+            # so readers can run alongside the backend's WAL writer
+            conn = sqlite3.connect(
+                f"{self.db_path.resolve().as_uri()}?mode=ro",
+                uri=True,
+                timeout=self.timeout,
+                check_same_thread=False,
+                cached_statements=self.cached_statements,
+            )
+            conn.execute("PRAGMA query_only = ON")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _fetchall(self, sql: str, params: Sequence[Any]) -> List[Tuple]:
+        return self._connect().execute(sql, params).fetchall()
+
+    async def fetchall(self, sql: str, params: Sequence[Any] = ()) -> List[Tuple]:
+        """Run a query on a worker thread and return all rows"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self._fetchall, sql, params)
+
+    async def fetchone(self, sql: str, params: Sequence[Any] = ()) -> Optional[Tuple]:
+        """Run a query on a worker thread and return the first row"""
+        rows = await self.fetchall(sql, params)
+        return rows[0] if rows else None
+
+    async def scalar(self, sql: str, params: Sequence[Any] = ()) -> Any:
+        """Run a query on a worker thread and return the first column of the first row"""
+        row = await self.fetchone(sql, params)
+        return row[0] if row else None
+
+    def close(self):
+        """Stop the worker threads and close every connection"""
+        self.executor.shutdown(wait=True)
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+
+    async def __aenter__(self) -> 'ReadOnlyPool':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
@@ -8,25 +8,79 @@ Script → Backend → Database → SSE → Frontend
 Usage:
     python debug_pipeline.py --job-id 123
     python debug_pipeline.py --check-all
+    python debug_pipeline.py --check-all --limit 500 --json
+    python debug_pipeline.py --job-id 123 --incremental
+    python debug_pipeline.py --watch --job-id 123
+    python debug_pipeline.py --create-indexes
 """
 
 import asyncio
+import json
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional
+
+try:
+    from .db_pool import ReadOnlyPool
+    from .pipeline_queries import artifact_stats, create_missing_indexes, log_stats, missing_indexes, stream_activity
+    from .pipeline_watch import PipelineWatcher
+    from .project_scanner import scan_incremental, scan_project
+except ImportError:  # Run as a script, or with scripts/ itself on sys.path
+    from db_pool import ReadOnlyPool
+    from pipeline_queries import artifact_stats, create_missing_indexes, log_stats, missing_indexes, stream_activity
+    from pipeline_watch import PipelineWatcher
+    from project_scanner import scan_incremental, scan_project
+
+
+STREAM_TYPES = ['logs', 'insights', 'knowledge']
+
+# Per-project scan manifests for --incremental, relative to the workspace
+SCAN_MANIFEST_DIR = ".pipeline-scan"
+RECENT_JOBS_SQL = """
+    SELECT jobs.id, jobs.status, jobs.current_phase, projects.name
+    FROM jobs LEFT JOIN projects ON projects.id = jobs.project_id
+    ORDER BY jobs.id DESC LIMIT ?
+"""
+JOB_PROJECT_SQL = """
+    SELECT projects.name
+    FROM jobs JOIN projects ON projects.id = jobs.project_id
+    WHERE jobs.id = ?
+"""
 
 
-async def check_script_output(job_id: int, project_path: Path) -> Dict:
+@asynccontextmanager
+async def _use_pool(db_path: Path, pool: Optional[ReadOnlyPool]) -> AsyncIterator[ReadOnlyPool]:
+    """Yield the shared pool, or a one-off pool when called standalone"""
+    if pool is not None:
+        yield pool
+    else:
+        async with ReadOnlyPool(db_path) as own_pool:
+            yield own_pool
+
+
+async def check_script_output(
+    job_id: int,
+    project_path: Path,
+    workers: int = 0,
+    manifest_path: Optional[Path] = None
+) -> Dict:
     """
     Check if script generated files
 
+    Args:
+        workers: Threads for scanning top-level subdirectories in parallel
+        manifest_path: Scan incrementally against this manifest and report
+            changes since the previous run (workers is then ignored)
+
     Returns:
         {
             'files_exist': bool,
             'file_count': int,
             'latest_mtime': datetime,
-            'files': List[str]
+            'files': List[str],
+            'changes': {'added': [...], 'modified': [...], 'deleted': [...]}  # incremental only
         }
     """
     if not project_path.exists():
@@ -37,31 +91,26 @@ async def check_script_output(job_id: int, project_path: Path) -> Dict:
             'files': []
         }
 
-    # Find all generated files (excluding .git, node_modules, etc.)
-    files = []
-    latest_mtime = None
-
-    for file_path in project_path.rglob('*'):
-        if file_path.is_file():
-            # Skip unwanted directories
-            if any(skip in str(file_path) for skip in ['.git', 'node_modules', '__pycache__', '.specify']):
-                continue
-
-            files.append(str(file_path))
-            mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-
-            if not latest_mtime or mtime > latest_mtime:
-                latest_mtime = mtime
-
-    return {
-        'files_exist': len(files) > 0,
-        'file_count': len(files),
-        'latest_mtime': latest_mtime,
-        'files': files[:10]  # Show first 10
+    # Find all generated files (excluding .git, node_modules, etc.) off the event loop
+    if manifest_path is not None:
+        delta = await asyncio.to_thread(scan_incremental, project_path, manifest_path, sample_size=10)
+        result = delta.result
+    else:
+        delta = None
+        result = await asyncio.to_thread(scan_project, project_path, sample_size=10, workers=workers)
+
+    script_result = {
+        'files_exist': result.file_count > 0,
+        'file_count': result.file_count,
+        'latest_mtime': result.latest_mtime,
+        'files': result.samples  # Show first 10
     }
+    if delta is not None:
+        script_result['changes'] = {'added': delta.added, 'modified': delta.modified, 'deleted': delta.deleted}
+    return script_result
 
 
-async def check_backend_logs(job_id: int, db_path: Path) -> Dict:
+async def check_backend_logs(job_id: int, db_path: Path, pool: Optional[ReadOnlyPool] = None) -> Dict:
     """
     Check if backend stored logs in database
 
@@ -73,8 +122,6 @@ async def check_backend_logs(job_id: int, db_path: Path) -> Dict:
             'sample_logs': List[str]
         }
     """
-    import sqlite3
-
     if not db_path.exists():
         return {
             'logs_exist': False,
@@ -83,41 +130,18 @@ async def check_backend_logs(job_id: int, db_path: Path) -> Dict:
             'sample_logs': []
         }
 
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    async with _use_pool(db_path, pool) as db:
+        stats = (await log_stats(db, [job_id]))[job_id]
 
-    # Check log_entries table
-    cursor.execute(
-        "SELECT COUNT(*) FROM log_entries WHERE job_id = ?",
-        (job_id,)
-    )
-    count = cursor.fetchone()[0]
+    return {'logs_exist': stats['log_count'] > 0, **stats}
 
-    # Get latest timestamp
-    cursor.execute(
-        "SELECT MAX(timestamp) FROM log_entries WHERE job_id = ?",
-        (job_id,)
-    )
-    latest = cursor.fetchone()[0]
 
-    # Get sample logs
-    cursor.execute(
-        "SELECT message, level, timestamp FROM log_entries WHERE job_id = ? ORDER BY timestamp DESC LIMIT 5",
-        (job_id,)
-    )
-    sample_logs = cursor.fetchall()
-
-    conn.close()
-
-    return {
-        'logs_exist': count > 0,
-        'log_count': count,
-        'latest_timestamp': datetime.fromisoformat(latest) if latest else None,
-        'sample_logs': [f"[{level}] {msg}" for msg, level, _ in sample_logs]
-    }
-
-
-async def check_artifacts_scanned(job_id: int, db_path: Path, project_path: Path) -> Dict:
+async def check_artifacts_scanned(
+    job_id: int,
+    db_path: Path,
+    project_path: Path,
+    pool: Optional[ReadOnlyPool] = None
+) -> Dict:
     """
     Check if artifact scanner found and tracked files
 
@@ -128,8 +152,6 @@ async def check_artifacts_scanned(job_id: int, db_path: Path, project_path: Path
             'sample_artifacts': List[str]
         }
     """
-    import sqlite3
-
     if not db_path.exists():
         return {
             'artifacts_exist': False,
@@ -137,34 +159,14 @@ async def check_artifacts_scanned(job_id: int, db_path: Path, project_path: Path
             'sample_artifacts': []
         }
 
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
     # Check artifacts table for files in this project's directory
-    project_str = str(project_path)
-    cursor.execute(
-        "SELECT COUNT(*) FROM artifacts WHERE file_path LIKE ?",
-        (f"{project_str}%",)
-    )
-    count = cursor.fetchone()[0]
-
-    # Get sample artifacts
-    cursor.execute(
-        "SELECT file_name, artifact_type, created_at FROM artifacts WHERE file_path LIKE ? ORDER BY created_at DESC LIMIT 5",
-        (f"{project_str}%",)
-    )
-    sample_artifacts = cursor.fetchall()
-
-    conn.close()
+    async with _use_pool(db_path, pool) as db:
+        stats = (await artifact_stats(db, {job_id: project_path}))[job_id]
 
-    return {
-        'artifacts_exist': count > 0,
-        'artifact_count': count,
-        'sample_artifacts': [f"{name} ({type_})" for name, type_, _ in sample_artifacts]
-    }
+    return {'artifacts_exist': stats['artifact_count'] > 0, **stats}
 
 
-async def check_sse_streams(db_path: Path) -> Dict:
+async def check_sse_streams(db_path: Path, pool: Optional[ReadOnlyPool] = None) -> Dict:
     """
     Check if SSE streams have recent messages
 
@@ -175,8 +177,6 @@ async def check_sse_streams(db_path: Path) -> Dict:
             'knowledge_stream_active': bool
         }
     """
-    import sqlite3
-
     if not db_path.exists():
         return {
             'logs_stream_active': False,
@@ -184,26 +184,147 @@ async def check_sse_streams(db_path: Path) -> Dict:
             'knowledge_stream_active': False
         }
 
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
     # Check stream_messages table for recent activity (last 5 minutes)
     five_mins_ago = (datetime.utcnow() - timedelta(minutes=5)).isoformat()
 
-    result = {}
-    for stream_type in ['logs', 'insights', 'knowledge']:
-        cursor.execute(
-            "SELECT COUNT(*) FROM stream_messages WHERE stream_type = ? AND created_at > ?",
-            (stream_type, five_mins_ago)
+    async with _use_pool(db_path, pool) as db:
+        activity = await stream_activity(db, five_mins_ago, STREAM_TYPES)
+
+    return {
+        f'{stream_type}_stream_active': activity[stream_type]['count'] > 0
+        for stream_type in STREAM_TYPES
+    }
+
+
+def find_issues(script_result: Dict, logs_result: Dict, artifacts_result: Dict, streams_result: Dict) -> List[str]:
+    """Pipeline issues implied by the four stage results, in pipeline order"""
+    issues = []
+
+    if not script_result['files_exist']:
+        issues.append("Script did not generate files")
+
+    if not logs_result['logs_exist']:
+        issues.append("Logs not captured by backend")
+
+    if script_result['files_exist'] and not artifacts_result['artifacts_exist']:
+        issues.append("Artifact scanner not finding files (path mismatch?)")
+
+    if not any(streams_result.values()):
+        issues.append("No SSE stream activity")
+
+    return issues
+
+
+def stuck_stage(script_result: Dict, logs_result: Dict, artifacts_result: Dict, streams_result: Dict) -> str:
+    """First pipeline stage where data stops, or 'healthy'"""
+    if not script_result['files_exist']:
+        return 'script'
+    if not logs_result['logs_exist']:
+        return 'backend_logs'
+    if not artifacts_result['artifacts_exist']:
+        return 'artifact_scanner'
+    if not any(streams_result.values()):
+        return 'sse_streams'
+    return 'healthy'
+
+
+async def diagnose_all(
+    limit: int = 200,
+    concurrency: int = 16,
+    as_json: bool = False,
+    scan_workers: int = 0,
+    incremental: bool = False
+):
+    """
+    Diagnose the most recent jobs concurrently
+
+    Reads the job list from workflow.db, answers the database stages for
+    every job with one grouped query each, and scans each project directory
+    once (at most `concurrency` scans in flight), then prints a compact
+    table or JSON.
+    """
+    workspace_root = Path.cwd()
+    db_path = workspace_root / "workflow.db"
+    projects_root = workspace_root / "generated_projects"
+    manifest_root = workspace_root / SCAN_MANIFEST_DIR
+
+    if not db_path.exists():
+        print(f"❌ Database not found: {db_path}")
+        return
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def scan_one(project_path: Path) -> Dict:
+        async with semaphore:
+            manifest_path = manifest_root / f"{project_path.name}.json" if incremental else None
+            return await check_script_output(0, project_path, scan_workers, manifest_path)
+
+    async with ReadOnlyPool(db_path) as pool:
+        jobs = await pool.fetchall(RECENT_JOBS_SQL, (limit,))
+        project_names = sorted({name for _, _, _, name in jobs if name})
+        project_paths = {name: projects_root / name for name in project_names}
+
+        # SSE activity is global, check it once for all jobs
+        streams_result, log_results, artifact_results, *scans = await asyncio.gather(
+            check_sse_streams(db_path, pool),
+            log_stats(pool, [job_id for job_id, *_ in jobs], sample_size=0),
+            artifact_stats(pool, project_paths, sample_size=0),
+            *(scan_one(path) for path in project_paths.values()),
+        )
+
+    script_results = dict(zip(project_names, scans))
+
+    # Job without a project row: nothing on disk or in artifacts to check
+    no_files = {'files_exist': False, 'file_count': 0, 'latest_mtime': None, 'files': []}
+    no_artifacts = {'artifact_count': 0, 'sample_artifacts': []}
+
+    results = []
+    for job_id, status, phase, project_name in jobs:
+        script_result = script_results.get(project_name, no_files)
+        logs_result = {'logs_exist': log_results[job_id]['log_count'] > 0, **log_results[job_id]}
+        artifacts = artifact_results.get(project_name, no_artifacts)
+        artifacts_result = {'artifacts_exist': artifacts['artifact_count'] > 0, **artifacts}
+        results.append({
+            'job_id': job_id,
+            'status': status,
+            'phase': phase,
+            'project': project_name,
+            'file_count': script_result['file_count'],
+            'log_count': logs_result['log_count'],
+            'artifact_count': artifacts_result['artifact_count'],
+            'latest_log': logs_result['latest_timestamp'],
+            'stuck_at': stuck_stage(script_result, logs_result, artifacts_result, streams_result),
+            'issues': find_issues(script_result, logs_result, artifacts_result, streams_result),
+        })
+        if 'changes' in script_result:
+            results[-1]['file_changes'] = {kind: len(paths) for kind, paths in script_result['changes'].items()}
+
+    if as_json:
+        print(json.dumps({'streams': streams_result, 'jobs': results}, indent=2, default=str))
+        return
+
+    print(f"\n{'='*88}")
+    print(f"Pipeline Diagnosis for {len(results)} recent jobs")
+    print(f"{'='*88}\n")
+    print(f"{'Job':>6}  {'Status':<12} {'Phase':<10} {'Files':>7} {'Logs':>8} {'Artifacts':>9}  {'Stuck at':<16}")
+    print("-" * 88)
+    for row in results:
+        marker = "✅" if row['stuck_at'] == 'healthy' else "❌"
+        print(
+            f"{row['job_id']:>6}  {str(row['status']):<12} {str(row['phase']):<10} "
+            f"{row['file_count']:>7} {row['log_count']:>8} {row['artifact_count']:>9}  "
+            f"{marker} {row['stuck_at']}"
         )
-        count = cursor.fetchone()[0]
-        result[f'{stream_type}_stream_active'] = count > 0
 
-    conn.close()
-    return result
+    stuck = [row for row in results if row['stuck_at'] != 'healthy']
+    print()
+    active = [name.replace('_stream_active', '') for name, value in streams_result.items() if value]
+    print(f"SSE streams active: {', '.join(active) if active else 'none'}")
+    print(f"{len(stuck)} of {len(results)} jobs have issues")
+    print()
 
 
-async def diagnose_job(job_id: int):
+async def diagnose_job(job_id: int, scan_workers: int = 0, incremental: bool = False):
     """
     Diagnose data pipeline for a specific job
 
@@ -226,17 +347,34 @@ async def diagnose_job(job_id: int):
         return
 
     project_path = project_dirs[0]  # Use first project for demo
+    manifest_path = workspace_root / SCAN_MANIFEST_DIR / f"{project_path.name}.json" if incremental else None
 
     print(f"📂 Project Path: {project_path}")
     print(f"🗄️  Database Path: {db_path}\n")
 
+    # Run all stage checks concurrently over one shared read-only pool.
+    # Database checks go first so their queries are already running on
+    # worker threads while the filesystem scan runs.
+    async with ReadOnlyPool(db_path) as pool:
+        logs_result, artifacts_result, streams_result, script_result = await asyncio.gather(
+            check_backend_logs(job_id, db_path, pool),
+            check_artifacts_scanned(job_id, db_path, project_path, pool),
+            check_sse_streams(db_path, pool),
+            check_script_output(job_id, project_path, scan_workers, manifest_path),
+        )
+
     # Stage 1: Check if script generated files
     print("Stage 1: Script Output")
     print("-" * 40)
-    script_result = await check_script_output(job_id, project_path)
     if script_result['files_exist']:
         print(f"✅ Files found: {script_result['file_count']}")
         print(f"   Latest modification: {script_result['latest_mtime']}")
+        if 'changes' in script_result:
+            changes = script_result['changes']
+            print(f"   Since last scan: +{len(changes['added'])} "
+                  f"~{len(changes['modified'])} -{len(changes['deleted'])}")
+            for path in (changes['added'] + changes['modified'])[:3]:
+                print(f"     • {path}")
     else:
         print(f"❌ No files found - Script may not have run or failed")
     print()
@@ -244,7 +382,6 @@ async def diagnose_job(job_id: int):
     # Stage 2: Check backend logs
     print("Stage 2: Backend Logs")
     print("-" * 40)
-    logs_result = await check_backend_logs(job_id, db_path)
     if logs_result['logs_exist']:
         print(f"✅ Logs stored: {logs_result['log_count']}")
         print(f"   Latest log: {logs_result['latest_timestamp']}")
@@ -259,7 +396,6 @@ async def diagnose_job(job_id: int):
     # Stage 3: Check artifact scanner
     print("Stage 3: Artifact Scanner")
     print("-" * 40)
-    artifacts_result = await check_artifacts_scanned(job_id, db_path, project_path)
     if artifacts_result['artifacts_exist']:
         print(f"✅ Artifacts scanned: {artifacts_result['artifact_count']}")
         if artifacts_result['sample_artifacts']:
@@ -273,7 +409,6 @@ async def diagnose_job(job_id: int):
     # Stage 4: Check SSE streams
     print("Stage 4: SSE Streams (Last 5 minutes)")
     print("-" * 40)
-    streams_result = await check_sse_streams(db_path)
     for stream, active in streams_result.items():
         status = "✅" if active else "⚠️ "
         print(f"{status} {stream.replace('_', ' ').title()}: {'Active' if active else 'No recent activity'}")
@@ -282,19 +417,7 @@ async def diagnose_job(job_id: int):
     # Summary
     print("Summary")
     print("-" * 40)
-    issues = []
-
-    if not script_result['files_exist']:
-        issues.append("Script did not generate files")
-
-    if not logs_result['logs_exist']:
-        issues.append("Logs not captured by backend")
-
-    if script_result['files_exist'] and not artifacts_result['artifacts_exist']:
-        issues.append("Artifact scanner not finding files (path mismatch?)")
-
-    if not any(streams_result.values()):
-        issues.append("No SSE stream activity")
+    issues = find_issues(script_result, logs_result, artifacts_result, streams_result)
 
     if issues:
         print("⚠️  Issues detected:")
@@ -306,17 +429,78 @@ async def diagnose_job(job_id: int):
     print()
 
 
+async def watch_pipeline(job_id: Optional[int] = None, duration: Optional[float] = None, poll_interval: float = 0.25):
+    """
+    Follow the pipeline live instead of diagnosing once
+
+    Watches the job's project directory (or all of generated_projects when
+    no job is given) and prints per-stage lag and stalls until interrupted.
+    """
+    workspace_root = Path.cwd()
+    db_path = workspace_root / "workflow.db"
+    watch_path = workspace_root / "generated_projects"
+
+    if not db_path.exists():
+        print(f"❌ Database not found: {db_path}")
+        return
+
+    if job_id is not None:
+        async with ReadOnlyPool(db_path, size=1) as pool:
+            project_name = await pool.scalar(JOB_PROJECT_SQL, (job_id,))
+        if project_name and (watch_path / project_name).exists():
+            watch_path = watch_path / project_name
+
+    watcher = PipelineWatcher(db_path, watch_path, job_id=job_id, poll_interval=poll_interval)
+    await watcher.run(duration)
+
+
 if __name__ == '__main__':
     import argparse
 
     parser = argparse.ArgumentParser(description='Debug the data pipeline')
     parser.add_argument('--job-id', type=int, help='Job ID to diagnose')
     parser.add_argument('--check-all', action='store_true', help='Check all recent jobs')
+    parser.add_argument('--limit', type=int, default=200, help='Recent jobs to check with --check-all')
+    parser.add_argument('--concurrency', type=int, default=16, help='Jobs checked at once with --check-all')
+    parser.add_argument('--json', action='store_true', help='Print --check-all results as JSON')
+    parser.add_argument('--scan-workers', type=int, default=0, help='Threads per project directory scan')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Reuse the last scan manifest (.pipeline-scan/) and report file changes')
+    parser.add_argument('--watch', action='store_true', help='Follow the pipeline live and report stage lag')
+    parser.add_argument('--duration', type=float, help='Stop --watch after this many seconds')
+    parser.add_argument('--poll-interval', type=float, default=0.25, help='Seconds between database polls in --watch')
+    parser.add_argument('--create-indexes', action='store_true', help='Create missing indexes on workflow.db')
 
     args = parser.parse_args()
 
-    if args.job_id:
-        asyncio.run(diagnose_job(args.job_id))
+    db_path = Path.cwd() / "workflow.db"
+    if args.create_indexes:
+        if not db_path.exists():
+            print(f"❌ Database not found: {db_path}")
+            sys.exit(1)
+        created = create_missing_indexes(db_path)
+        for ddl in created:
+            print(f"✅ {ddl}")
+        if not created:
+            print("✅ All recommended indexes exist")
+        if not (args.job_id or args.check_all or args.watch):
+            sys.exit(0)
+    elif db_path.exists() and not args.json:
+        for ddl in missing_indexes(db_path):
+            print(f"💡 Missing index (run with --create-indexes): {ddl}")
+
+    if args.watch:
+        try:
+            asyncio.run(watch_pipeline(args.job_id, args.duration, args.poll_interval))
+        except KeyboardInterrupt:
+            pass
+    elif args.job_id:
+        asyncio.run(diagnose_job(args.job_id, args.scan_workers, args.incremental))
+    elif args.check_all:
+        asyncio.run(diagnose_all(args.limit, args.concurrency, args.json, args.scan_workers, args.incremental))
     else:
         print("Usage: python debug_pipeline.py --job-id 123")
+        print("       python debug_pipeline.py --check-all")
+        print("       python debug_pipeline.py --watch [--job-id 123]")
+        print("       python debug_pipeline.py --create-indexes")
         sys.exit(1)
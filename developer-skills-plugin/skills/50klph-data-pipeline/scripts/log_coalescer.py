@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Progress Log Coalescer
+
+Sits on top of LogParser and collapses bursts of progress lines
+("42%", "3/5", "Step N of M", "Writing ...") into one record per phase
+per window, so the database and SSE streams only see the latest value.
+
+Errors and phase changes are never delayed: they flush any held progress
+first (to keep ordering) and are emitted immediately.
+
+Usage:
+    from log_parser import LogParser, read_chunks
+    from log_coalescer import ProgressCoalescer
+
+    parser = LogParser()
+    coalescer = ProgressCoalescer(window=1.0)
+
+    async for parsed in coalescer.coalesce(parser.parse_stream(read_chunks(process.stdout))):
+        if parsed.should_display:
+            save_log(parsed.message, parsed.level)
+"""
+
+import asyncio
+import time
+from typing import AsyncIterable, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+try:
+    from .log_parser import ParsedLog
+except ImportError:  # Run as a script, or with scripts/ itself on sys.path
+    from log_parser import ParsedLog
+
+
+class ProgressCoalescer:
+    """
+    Keeps only the latest progress line per phase within a time window
+
+    The first progress line of a phase opens a window; later progress lines
+    in the same phase replace it. When the window closes, the latest line is
+    emitted as the merged record for the whole burst.
+    """
+
+    def __init__(self, window: float = 1.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            window: Seconds to hold progress lines per phase
+            clock: Monotonic time source (injectable for testing)
+        """
+        self.window = window
+        self.clock = clock
+
+        # Held progress per phase: phase -> (window deadline, latest log)
+        self.pending: Dict[Optional[str], Tuple[float, ParsedLog]] = {}
+
+        # Phase of the most recent log that carried one
+        self.current_phase: Optional[str] = None
+
+        # Counters for metrics
+        self.received = 0
+        self.emitted = 0
+        self.coalesced = 0
+
+    def _is_coalescible(self, parsed: ParsedLog) -> bool:
+        """Only visible, non-error progress lines are held back"""
+        return parsed.is_progress and parsed.should_display and parsed.level != 'error'
+
+    def push(self, parsed: ParsedLog) -> List[ParsedLog]:
+        """
+        Feed one parsed log line
+
+        Returns:
+            Logs to emit now, in order (may be empty while progress is held)
+        """
+        self.received += 1
+        now = self.clock()
+        out = self.flush(now)
+
+        phase_changed = parsed.phase is not None and parsed.phase != self.current_phase
+        if parsed.phase is not None:
+            self.current_phase = parsed.phase
+
+        if phase_changed or parsed.level == 'error':
+            # Flush held progress first so the critical line keeps its place
+            out.extend(self.flush(now, force=True))
+            out.append(parsed)
+            self.emitted += 1
+            return out
+
+        if not self._is_coalescible(parsed):
+            out.append(parsed)
+            self.emitted += 1
+            return out
+
+        phase = self.current_phase
+        held = self.pending.get(phase)
+        if held is None:
+            self.pending[phase] = (now + self.window, parsed)
+        else:
+            self.pending[phase] = (held[0], parsed)
+            self.coalesced += 1
+
+        return out
+
+    def flush(self, now: Optional[float] = None, force: bool = False) -> List[ParsedLog]:
+        """
+        Emit held progress whose window has closed
+
+        Args:
+            now: Current clock value (defaults to clock())
+            force: Emit everything held, regardless of windows
+
+        Returns:
+            Merged progress records, oldest window first
+        """
+        if not self.pending:
+            return []
+
+        if now is None:
+            now = self.clock()
+
+        due = sorted(
+            (deadline, phase)
+            for phase, (deadline, _) in self.pending.items()
+            if force or deadline <= now
+        )
+        self.emitted += len(due)
+        return [self.pending.pop(phase)[1] for _, phase in due]
+
+    def next_deadline(self) -> Optional[float]:
+        """Clock value at which the next window closes, or None if nothing is held"""
+        if not self.pending:
+            return None
+        return min(deadline for deadline, _ in self.pending.values())
+
+    async def coalesce(self, logs: AsyncIterable[ParsedLog]) -> AsyncIterator[ParsedLog]:
+        """
+        Coalesce an async stream of parsed logs
+
+        Held progress is emitted when its window closes even if the source
+        goes quiet, and everything held is flushed when the source ends.
+        """
+        source = logs.__aiter__()
+        next_log = asyncio.ensure_future(source.__anext__())
+
+        try:
+            while True:
+                deadline = self.next_deadline()
+                timeout = None if deadline is None else max(0.0, deadline - self.clock())
+
+                done, _ = await asyncio.wait({next_log}, timeout=timeout)
+
+                if not done:
+                    # Window closed while the source was quiet
+                    for parsed in self.flush():
+                        yield parsed
+                    continue
+
+                try:
+                    parsed = next_log.result()
+                except StopAsyncIteration:
+                    break
+
+                next_log = asyncio.ensure_future(source.__anext__())
+                for out in self.push(parsed):
+                    yield out
+        finally:
+            if not next_log.done():
+                next_log.cancel()
+
+        for parsed in self.flush(force=True):
+            yield parsed
+
+
+# Example usage
+if __name__ == '__main__':
+    from log_parser import LogParser
+
+    parser = LogParser()
+    coalescer = ProgressCoalescer(window=0.05)
+
+    async def burst():
+        yield parser.parse("Implementing feature: User authentication")
+        for i in range(1, 101):
+            yield parser.parse(f"Writing src/module_{i}.py ({i}%)")
+        yield parser.parse("ERROR: Failed to write src/module_101.py")
+        for i in range(101, 201):
+            yield parser.parse(f"Writing src/module_{i}.py ({i // 2}%)")
+        await asyncio.sleep(0.1)
+        yield parser.parse("Running tests for module auth")
+
+    async def main():
+        async for parsed in coalescer.coalesce(burst()):
+            print(f"[{parsed.level}] ({parsed.phase}) {parsed.message}")
+        print(f"\nReceived: {coalescer.received}, emitted: {coalescer.emitted}, "
+              f"coalesced: {coalescer.coalesced}")
+
+    asyncio.run(main())
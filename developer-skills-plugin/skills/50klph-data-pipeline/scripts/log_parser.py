@@ -12,12 +12,27 @@ Usage:
     if should_show_to_user(result):
         # Send to dashboard
         save_log(result['message'], result['level'])
+
+    # Parse subprocess output straight from the pipe
+    async for parsed in _parser.parse_stream(read_chunks(process.stdout)):
+        if parsed.should_display:
+            save_log(parsed.message, parsed.level)
+
+    # Bytes mode: hidden lines are filtered without being decoded
+    async for parsed in BytesLogParser().parse_stream(read_chunks(process.stdout)):
+        save_log(parsed.message, parsed.level)
 """
 
+import asyncio
+import hashlib
 import re
-from typing import Optional, Dict, Literal
+from collections import OrderedDict
+from typing import AsyncIterable, AsyncIterator, Iterable, Optional, Dict, List, Literal, Tuple, Union
 from dataclasses import dataclass
 
+# Characters that end a literal run inside a regex pattern
+_REGEX_META = set('.^$*+?{}[]|()')
+
 
 @dataclass
 class ParsedLog:
@@ -29,10 +44,332 @@ class ParsedLog:
     is_progress: bool  # True if this is a progress indicator
 
 
+def _unescape_literal(pattern: str) -> Optional[str]:
+    """Return the text a pattern matches if it is a plain literal, else None"""
+    literal = ''
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            if i + 1 >= len(pattern) or pattern[i + 1].isalnum():
+                return None  # \d, \s, \b, ... are not literals
+            literal += pattern[i + 1]
+            i += 2
+        elif char in _REGEX_META:
+            return None
+        else:
+            literal += char
+            i += 1
+    return literal
+
+
+def _literal_runs(pattern: str) -> Optional[List[str]]:
+    """
+    Split a regex pattern into the literal runs required at its top level
+
+    Groups and optional characters are skipped (they end the current run).
+    Returns None if the pattern uses a top-level alternation, character class
+    or backslash class, since no single literal is then guaranteed.
+    """
+    runs = []
+    current = ''
+    depth = 0
+    i = 0
+
+    while i < len(pattern):
+        char = pattern[i]
+
+        if char == '\\':
+            escaped = pattern[i + 1:i + 2]
+            i += 2
+            if depth > 0:
+                continue
+            if not escaped or escaped.isalnum():
+                return None
+            current += escaped
+        elif char == '(':
+            depth += 1
+            i += 1
+        elif char == ')':
+            depth -= 1
+            runs.append(current)
+            current = ''
+            i += 1
+        elif depth > 0:
+            i += 1
+        elif char in '|[':
+            return None
+        elif char in _REGEX_META:
+            if char in '?*{':
+                current = current[:-1]  # Preceding character is optional
+            if char == '{':
+                i = pattern.find('}', i) + 1 or len(pattern)
+            else:
+                i += 1
+            runs.append(current)
+            current = ''
+        else:
+            current += char
+            i += 1
+
+    runs.append(current)
+    return [run for run in runs if run]
+
+
+def _pure_alternatives(pattern: str) -> Optional[List[str]]:
+    """
+    Return the literals of a pattern that is a plain literal or a
+    non-capturing alternation of plain literals, e.g. ``(?:planning|plan\\.md)``.
+
+    Returns None if the pattern contains any other regex syntax.
+    """
+    if pattern.startswith('(?:') and pattern.endswith(')'):
+        pattern = pattern[3:-1]
+
+    alternatives = []
+    for branch in re.split(r'(?<!\\)\|', pattern):
+        literal = _unescape_literal(branch)
+        if not literal:
+            return None
+        alternatives.append(literal)
+    return alternatives
+
+
+class _PatternCheck:
+    """One compiled pattern plus the literals used to prefilter it"""
+
+    __slots__ = ('pattern', 'literals', 'fold', 'exact')
+
+    def __init__(self, pattern: re.Pattern):
+        self.pattern = pattern
+        self.fold = bool(pattern.flags & re.IGNORECASE)
+
+        alternatives = None
+        runs = None
+        if not pattern.flags & re.VERBOSE:
+            alternatives = _pure_alternatives(pattern.pattern)
+            if alternatives is None:
+                runs = _literal_runs(pattern.pattern)
+
+        if alternatives is not None:
+            # Literal alternation: a substring hit is the match itself
+            literals = alternatives
+            self.exact = True
+        else:
+            # Regex with a required literal: substring miss rules it out,
+            # substring hit still has to be confirmed by the regex
+            literals = [max(runs, key=len)] if runs else []
+            self.exact = False
+
+        if self.fold:
+            literals = [literal.lower() for literal in literals]
+        if not all(literal.isascii() for literal in literals):
+            literals = []
+        self.literals: Tuple[str, ...] = tuple(literals)
+
+    def search(self, text: str, folded: Optional[str]) -> bool:
+        """
+        Check the pattern against text
+
+        Args:
+            text: Sanitized log line
+            folded: text.lower() if text is pure ASCII, else None
+        """
+        if not self.literals or (self.fold and folded is None):
+            # No usable prefilter, defer to the regex
+            return self.pattern.search(text) is not None
+
+        haystack = folded if self.fold else text
+        for literal in self.literals:
+            if literal in haystack:
+                break
+        else:
+            return False
+
+        return self.exact or self.pattern.search(text) is not None
+
+
+class _PatternGroup:
+    """
+    A set of patterns where any match counts (one category or one phase)
+
+    Exact literal checks from all patterns are flattened into two tuples so
+    the common miss costs a handful of substring tests and no method calls.
+    """
+
+    __slots__ = ('literals', 'folded_literals', 'folded_patterns', 'gated')
+
+    def __init__(self, patterns: List[re.Pattern]):
+        literals = []
+        folded_literals = []
+        self.folded_patterns = []
+        self.gated = []
+
+        for pattern in patterns:
+            check = _PatternCheck(pattern)
+            if not (check.exact and check.literals):
+                self.gated.append(check)
+            elif check.fold:
+                folded_literals.extend(check.literals)
+                self.folded_patterns.append(pattern)
+            else:
+                literals.extend(check.literals)
+
+        self.literals = tuple(literals)
+        self.folded_literals = tuple(folded_literals)
+
+    def search(self, text: str, folded: Optional[str]) -> bool:
+        """True if any pattern in the group matches text"""
+        for literal in self.literals:
+            if literal in text:
+                return True
+
+        if folded is None:
+            for pattern in self.folded_patterns:
+                if pattern.search(text):
+                    return True
+        else:
+            for literal in self.folded_literals:
+                if literal in folded:
+                    return True
+
+        for check in self.gated:
+            if check.search(text, folded):
+                return True
+        return False
+
+
+class CompiledClassifier:
+    """
+    Single-pass classifier built from a LogParser's pattern tables
+
+    Every pattern is reduced to the literal substrings it needs to match.
+    A line is lower-cased once, and substring checks (which run at memchr
+    speed) rule out almost every pattern before any regex is executed.
+    Plain literal patterns never touch the regex engine at all; the rest
+    only run their regex once their literal has been found.
+
+    Results are identical to the per-pattern search loops in LogParser.
+    Merging all patterns into one big alternation was measured to be
+    slower than the separate searches, because alternations defeat the
+    regex engine's literal fast paths.
+
+    The classifier snapshots the parser's patterns at construction time;
+    rebuild it after editing the pattern tables.
+    """
+
+    def __init__(self, parser: 'LogParser'):
+        self.error_group = _PatternGroup(parser.error_patterns)
+        self.hide_group = _PatternGroup(parser.hide_patterns)
+        self.progress_group = _PatternGroup(parser.progress_patterns)
+        self.phase_groups = [
+            (phase, _PatternGroup([pattern]))
+            for phase, pattern in parser.phase_patterns.items()
+        ]
+
+    def classify(self, text: str) -> Tuple[bool, bool, bool, Optional[str]]:
+        """
+        Classify a sanitized log line in one pass
+
+        Returns:
+            (is_error, should_hide, is_progress, phase)
+        """
+        # IGNORECASE and str.lower() only agree on ASCII text
+        folded = text.lower() if text.isascii() else None
+
+        phase = None
+        for name, group in self.phase_groups:
+            if group.search(text, folded):
+                phase = name
+                break
+
+        return (
+            self.error_group.search(text, folded),
+            self.hide_group.search(text, folded),
+            self.progress_group.search(text, folded),
+            phase,
+        )
+
+
+class ParseCache:
+    """
+    Bounded LRU cache of parse results keyed on the raw line
+
+    Speckit output repeats many lines word for word (uvicorn access lines,
+    "Installing ...", aiosqlite debug noise), so a hit replaces sanitization
+    and classification with a dict lookup. Lines longer than hash_threshold
+    are keyed by a 128-bit BLAKE2 digest instead of the line itself, so long
+    lines are not held in memory twice.
+
+    Cached ParsedLog objects are shared between hits; treat them as read-only.
+    """
+
+    def __init__(self, maxsize: int = 4096, hash_threshold: Optional[int] = 512):
+        """
+        Args:
+            maxsize: Maximum number of cached lines
+            hash_threshold: Lines longer than this are keyed by content hash
+                (None keys every line by its text)
+        """
+        self.maxsize = maxsize
+        self.hash_threshold = hash_threshold
+        self.entries: 'OrderedDict[Union[str, bytes], ParsedLog]' = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key_for(self, raw_line: str) -> Union[str, bytes]:
+        """Cache key for a raw line"""
+        if self.hash_threshold is not None and len(raw_line) > self.hash_threshold:
+            return hashlib.blake2b(raw_line.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        return raw_line
+
+    def get(self, key: Union[str, bytes]) -> Optional[ParsedLog]:
+        """Look up a key, refreshing its recency on a hit"""
+        parsed = self.entries.get(key)
+        if parsed is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return parsed
+
+    def put(self, key: Union[str, bytes], parsed: ParsedLog):
+        """Store a result, evicting the least recently used entry when full"""
+        self.entries[key] = parsed
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Drop all entries and reset counters"""
+        self.entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict:
+        """Hit/miss counters for metrics"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self.entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+
 class LogParser:
     """Parser for AgenticSpecKit subprocess logs"""
 
-    def __init__(self):
+    def __init__(self, cache_size: int = 4096, cache_hash_threshold: Optional[int] = 512):
+        """
+        Args:
+            cache_size: Lines kept in the parse cache (0 disables caching)
+            cache_hash_threshold: Lines longer than this are cached by content hash
+        """
         # Path sanitization - remove absolute paths
         self.path_pattern = re.compile(r'/mnt/c/Users/[^/]+/Documents/[^/\s]+/')
 
@@ -76,6 +413,12 @@ class LogParser:
             re.compile(r'Error', re.IGNORECASE),
         ]
 
+        # Prefiltered single-pass engine over the tables above
+        self.classifier = CompiledClassifier(self)
+
+        # Memoized results for repeated lines
+        self.cache = ParseCache(cache_size, cache_hash_threshold) if cache_size > 0 else None
+
     def sanitize_paths(self, text: str) -> str:
         """Remove absolute paths to hide implementation details"""
         return self.path_pattern.sub('', text)
@@ -112,17 +455,34 @@ class LogParser:
         """
         Parse a raw log line into a structured ParsedLog
 
+        Repeated lines are served from the parse cache when enabled.
+
         Args:
             raw_line: Raw log output from speckit subprocess
 
         Returns:
             ParsedLog with classification and filtering applied
         """
+        cache = self.cache
+        if cache is None:
+            return self.parse_uncached(raw_line)
+
+        key = cache.key_for(raw_line)
+        parsed = cache.get(key)
+        if parsed is None:
+            parsed = self.parse_uncached(raw_line)
+            cache.put(key, parsed)
+        return parsed
+
+    def parse_uncached(self, raw_line: str) -> ParsedLog:
+        """Parse a raw log line, bypassing the parse cache"""
         # Sanitize paths first
         sanitized = self.sanitize_paths(raw_line.strip())
 
+        is_error, hide, is_progress, phase = self.classifier.classify(sanitized)
+
         # Detect level
-        if self.is_error(sanitized):
+        if is_error:
             level = 'error'
         elif 'WARNING:' in sanitized or 'WARN:' in sanitized:
             level = 'warning'
@@ -131,11 +491,8 @@ class LogParser:
         else:
             level = 'info'
 
-        # Detect phase
-        phase = self.detect_phase(sanitized)
-
         # Determine if should display
-        if self.should_hide(sanitized):
+        if hide:
             should_display = False
         elif level == 'error':
             should_display = True  # Always show errors
@@ -144,9 +501,6 @@ class LogParser:
         else:
             should_display = True
 
-        # Check if progress indicator
-        is_progress = self.is_progress_log(sanitized)
-
         return ParsedLog(
             message=sanitized,
             level=level,
@@ -155,6 +509,209 @@ class LogParser:
             is_progress=is_progress
         )
 
+    def parse_batch(self, lines: Iterable[str]) -> List[ParsedLog]:
+        """
+        Parse many raw log lines at once
+
+        Args:
+            lines: Raw log lines (trailing newlines are stripped)
+
+        Returns:
+            ParsedLog per line, in input order
+        """
+        parse = self.parse
+        return [parse(line) for line in lines]
+
+    async def parse_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        encoding: str = 'utf-8',
+        errors: str = 'replace'
+    ) -> AsyncIterator[ParsedLog]:
+        """
+        Parse subprocess output as it arrives
+
+        Being an async generator, the next chunk is only read once the
+        consumer is ready. See split_lines() for how chunks become lines.
+
+        Args:
+            chunks: Raw bytes, e.g. read_chunks(process.stdout)
+            encoding: Output encoding of the subprocess
+            errors: Decode error handling (default replaces bad bytes)
+
+        Yields:
+            ParsedLog per line, in stream order
+        """
+        parse = self.parse
+        async for lines in split_lines(chunks, encoding, errors):
+            for line in lines:
+                yield parse(line)
+
+
+async def split_lines(
+    chunks: AsyncIterable[bytes],
+    encoding: str = 'utf-8',
+    errors: str = 'replace'
+) -> AsyncIterator[List[str]]:
+    """
+    Split a byte stream into lines, one list per chunk
+
+    Chunks may split lines (and multi-byte characters) anywhere. Complete
+    lines are decoded once per chunk; the trailing partial line is held
+    back until its newline arrives or the stream ends.
+    """
+    buffer = bytearray()
+
+    async for chunk in chunks:
+        buffer += chunk
+        cut = buffer.rfind(b'\n')
+        if cut < 0:
+            continue
+
+        text = buffer[:cut].decode(encoding, errors)
+        del buffer[:cut + 1]
+        yield text.split('\n')
+
+    if buffer:
+        yield [buffer.decode(encoding, errors)]
+
+
+async def read_chunks(reader: asyncio.StreamReader, size: int = 64 * 1024) -> AsyncIterator[bytes]:
+    """Read a subprocess pipe in chunks until EOF (input for LogParser.parse_stream)"""
+    while True:
+        chunk = await reader.read(size)
+        if not chunk:
+            break
+        yield chunk
+
+
+class BytesLogParser:
+    """
+    Parses subprocess output as bytes and decodes only displayed lines
+
+    Hidden lines (DEBUG:, tracebacks, site-packages, ... - most of the
+    volume) are located in the raw read buffer with bytes.find() on the
+    hide literals and cut out before decoding, so they are never decoded,
+    split into str objects or classified. The remaining lines are decoded
+    once per chunk and go through the wrapped LogParser, so their ParsedLog
+    is identical to the str path.
+
+    A hide literal found in the raw bytes is also in the decoded, stripped
+    line, as long as the encoding maps ASCII bytes only to ASCII characters
+    (UTF-8, Latin-1). Lines with a path to sanitize are left to the str
+    path, since removing the path can remove or create a match. If any
+    hide pattern is not a plain literal, nothing is filtered early.
+
+    Hidden lines produce no ParsedLog at all, so phases are only detected
+    from displayed lines; use LogParser.parse_stream if that matters.
+    """
+
+    def __init__(self, parser: Optional[LogParser] = None, encoding: str = 'utf-8', errors: str = 'replace'):
+        """
+        Args:
+            parser: Parser for displayed lines (defaults to a new LogParser)
+            encoding: Output encoding of the subprocess (ASCII-compatible)
+            errors: Decode error handling (default replaces bad bytes)
+        """
+        self.parser = parser or LogParser()
+        self.encoding = encoding
+        self.errors = errors
+        self.path_prefix = b'/mnt/c/Users/'
+
+        hide_group = self.parser.classifier.hide_group
+        if hide_group.gated or hide_group.folded_patterns or not hide_group.literals:
+            self.hide_literals: Tuple[bytes, ...] = ()
+        else:
+            self.hide_literals = tuple(literal.encode('ascii') for literal in hide_group.literals)
+
+        # Counters for metrics
+        self.lines = 0
+        self.dropped = 0  # Hidden lines cut out without decoding
+        self.decoded = 0
+
+    def _hidden_spans(self, data: Union[bytes, bytearray], end: int) -> List[Tuple[int, int]]:
+        """Sorted [start, stop) spans of hidden lines in data[:end], newline included"""
+        spans: Dict[int, int] = {}
+        find, rfind = data.find, data.rfind
+        path_prefix = self.path_prefix if find(self.path_prefix, 0, end) >= 0 else None
+
+        for literal in self.hide_literals:
+            pos = find(literal, 0, end)
+            while pos >= 0:
+                start = rfind(b'\n', 0, pos) + 1
+                stop = find(b'\n', pos, end) + 1
+                if path_prefix is None or find(path_prefix, start, stop) < 0:
+                    spans[start] = stop
+                pos = find(literal, stop, end)
+
+        return sorted(spans.items())
+
+    def parse_lines(self, data: Union[bytes, bytearray], end: Optional[int] = None) -> List[ParsedLog]:
+        """
+        Parse the complete lines in data[:end], returning the displayed ones
+
+        Args:
+            data: Buffer of whole lines, each ending in a newline
+            end: Where the lines stop (default: end of data)
+        """
+        if end is None:
+            end = len(data)
+        total = data.count(b'\n', 0, end)
+
+        # Copy out only the runs of lines between hidden ones
+        kept = bytearray()
+        pos = 0
+        with memoryview(data) as view:
+            for start, stop in self._hidden_spans(data, end):
+                kept += view[pos:start]
+                pos = stop
+            kept += view[pos:end]
+
+        remaining = kept.count(b'\n')
+        self.lines += total
+        self.dropped += total - remaining
+        self.decoded += remaining
+        if not remaining:
+            return []
+
+        parse = self.parser.parse
+        displayed = []
+        for line in kept[:-1].decode(self.encoding, self.errors).split('\n'):
+            parsed = parse(line)
+            if parsed.should_display:
+                displayed.append(parsed)
+        return displayed
+
+    def parse_buffer(self, data: bytes) -> List[ParsedLog]:
+        """Parse a complete output buffer (last line may lack a newline)"""
+        if data and not data.endswith(b'\n'):
+            data += b'\n'
+        return self.parse_lines(data)
+
+    async def parse_stream(self, chunks: AsyncIterable[bytes]) -> AsyncIterator[ParsedLog]:
+        """
+        Parse subprocess output as it arrives, yielding displayed lines only
+
+        Complete lines are filtered in place in the read buffer; the
+        trailing partial line waits for its newline.
+        """
+        buffer = bytearray()
+
+        async for chunk in chunks:
+            buffer += chunk
+            cut = buffer.rfind(b'\n')
+            if cut < 0:
+                continue
+
+            displayed = self.parse_lines(buffer, cut + 1)
+            del buffer[:cut + 1]
+            for parsed in displayed:
+                yield parsed
+
+        if buffer:
+            for parsed in self.parse_buffer(bytes(buffer)):
+                yield parsed
+
 
 # Singleton instance
 _parser = LogParser()
@@ -201,3 +758,7 @@ if __name__ == '__main__':
         print(f"\nInput: {log}")
         print(f"Output: {result}")
         print(f"Show?: {should_show_to_user(result)}")
+
+    bytes_parser = BytesLogParser()
+    displayed = bytes_parser.parse_buffer('\n'.join(test_logs).encode())
+    print(f"\nBytes mode: {len(displayed)} displayed, {bytes_parser.dropped} dropped before decoding")
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Columnar Log Store
+
+Keeps recent parsed logs per job for the logs panel in compact form:
+level and phase as one byte each in array('B'), timestamps in
+array('d'), and the message strings in a bounded deque. Each job is a
+fixed-size ring, so hours of history cost a few bytes per line on top of
+the message text instead of a dict per line.
+
+Usage:
+    from log_parser import LogParser
+    from log_store import LogStore
+
+    parser = LogParser()
+    store = LogStore(capacity=50_000)
+
+    parsed = parser.parse(raw_line)
+    if parsed.should_display:
+        store.append(job_id, parsed)
+
+    recent_errors = store.tail(job_id, 100, levels={'error', 'warning'})
+    implement_logs = store.tail(job_id, 50, phase='implement')
+"""
+
+import time
+from array import array
+from collections import deque
+from typing import Deque, Dict, Iterable, List, NamedTuple, Optional
+
+try:
+    from .log_parser import ParsedLog
+except ImportError:  # Run as a script, or with scripts/ itself on sys.path
+    from log_parser import ParsedLog
+
+
+LEVELS = ('debug', 'info', 'warning', 'error')
+LEVEL_CODES = {level: code for code, level in enumerate(LEVELS)}
+
+# Phase code 0 means "no phase"; others are assigned on first use
+KNOWN_PHASES = ('specify', 'plan', 'tasks', 'implement', 'test', 'review', 'deploy')
+
+
+class StoredLog(NamedTuple):
+    """One log line read back from the store"""
+    message: str
+    level: str
+    phase: Optional[str]
+    timestamp: float
+
+
+class JobLogBuffer:
+    """Ring of the most recent log lines for one job"""
+
+    __slots__ = ('capacity', 'levels', 'phases', 'timestamps', 'messages', 'total')
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        # Columns grow until they reach capacity, then wrap around
+        self.levels = array('B')
+        self.phases = array('B')
+        self.timestamps = array('d')
+        self.messages: Deque[str] = deque(maxlen=capacity)
+        self.total = 0  # Lines ever appended; the next slot is total % capacity
+
+    def append(self, message: str, level_code: int, phase_code: int, timestamp: float):
+        if self.total < self.capacity:
+            self.levels.append(level_code)
+            self.phases.append(phase_code)
+            self.timestamps.append(timestamp)
+        else:
+            slot = self.total % self.capacity
+            self.levels[slot] = level_code
+            self.phases[slot] = phase_code
+            self.timestamps[slot] = timestamp
+        self.messages.append(message)
+        self.total += 1
+
+    def __len__(self) -> int:
+        return len(self.messages)
+
+
+class LogStore:
+    """
+    Per-job columnar ring buffers with filtered tail queries
+
+    Message strings are stored as given. Repeated lines parsed through
+    LogParser's cache already share one string object, so they are not
+    interned again here (that would cost a dict entry per unique line).
+    """
+
+    def __init__(self, capacity: int = 10_000, max_jobs: int = 1000):
+        """
+        Args:
+            capacity: Lines kept per job (oldest dropped first)
+            max_jobs: Jobs kept; the least recently written job is dropped first
+        """
+        self.capacity = capacity
+        self.max_jobs = max_jobs
+        self.jobs: Dict[int, JobLogBuffer] = {}
+
+        self.phase_names: List[Optional[str]] = [None, *KNOWN_PHASES]
+        self.phase_codes: Dict[Optional[str], int] = {name: code for code, name in enumerate(self.phase_names)}
+
+    def _phase_code(self, phase: Optional[str]) -> int:
+        code = self.phase_codes.get(phase)
+        if code is None:
+            if len(self.phase_names) > 255:
+                raise ValueError(f"Too many distinct phases to store {phase!r}")
+            code = self.phase_codes[phase] = len(self.phase_names)
+            self.phase_names.append(phase)
+        return code
+
+    def append(self, job_id: int, parsed: ParsedLog, timestamp: Optional[float] = None):
+        """Store one parsed line for a job (timestamp defaults to now, epoch seconds)"""
+        buffer = self.jobs.pop(job_id, None)
+        if buffer is None:
+            buffer = JobLogBuffer(self.capacity)
+            if len(self.jobs) >= self.max_jobs:
+                del self.jobs[next(iter(self.jobs))]
+        # Re-inserted so dict order tracks the least recently written job
+        self.jobs[job_id] = buffer
+
+        buffer.append(
+            parsed.message,
+            LEVEL_CODES[parsed.level],
+            self._phase_code(parsed.phase),
+            time.time() if timestamp is None else timestamp,
+        )
+
+    def tail(
+        self,
+        job_id: int,
+        count: int = 100,
+        levels: Optional[Iterable[str]] = None,
+        phase: Optional[str] = None,
+        since: Optional[float] = None
+    ) -> List[StoredLog]:
+        """
+        Last `count` lines for a job, oldest first
+
+        Args:
+            levels: Only these levels (None = all)
+            phase: Only lines tagged with this phase (None = all)
+            since: Only lines with a timestamp after this (epoch seconds;
+                assumes lines are appended in timestamp order)
+        """
+        buffer = self.jobs.get(job_id)
+        if buffer is None or count <= 0:
+            return []
+
+        level_mask = 0xFF if levels is None else sum(1 << LEVEL_CODES[level] for level in levels)
+        phase_code = None if phase is None else self.phase_codes.get(phase, -1)
+
+        levels_col, phases_col, times_col = buffer.levels, buffer.phases, buffer.timestamps
+        capacity = buffer.capacity
+        slot = buffer.total % capacity
+
+        matches = []
+        # Walk newest to oldest; the deque and the ring slots move together
+        for message in reversed(buffer.messages):
+            slot = slot - 1 if slot else capacity - 1
+            if since is not None and times_col[slot] <= since:
+                break
+            if not level_mask >> levels_col[slot] & 1:
+                continue
+            if phase_code is not None and phases_col[slot] != phase_code:
+                continue
+            matches.append(StoredLog(message, LEVELS[levels_col[slot]], self.phase_names[phases_col[slot]], times_col[slot]))
+            if len(matches) == count:
+                break
+
+        matches.reverse()
+        return matches
+
+    def count(self, job_id: int) -> int:
+        """Lines currently held for a job"""
+        buffer = self.jobs.get(job_id)
+        return len(buffer) if buffer is not None else 0
+
+    def forget_job(self, job_id: int):
+        """Drop a job's history"""
+        self.jobs.pop(job_id, None)
+
+
+# Example usage
+if __name__ == '__main__':
+    from log_parser import LogParser
+
+    parser = LogParser()
+    store = LogStore(capacity=1000)
+
+    lines = [
+        "Implementing feature: User authentication",
+        "Writing src/auth.py (40%)",
+        "WARNING: Deprecated option --fast",
+        "ERROR: Failed to write src/session.py",
+        "Running tests for module auth",
+        "ERROR: 2 tests failed",
+    ] * 500
+
+    for line in lines:
+        parsed = parser.parse(line)
+        if parsed.should_display:
+            store.append(1, parsed)
+
+    print(f"Job 1 holds {store.count(1)} of {len(lines)} lines (capacity {store.capacity})")
+    for log in store.tail(1, 3, levels={'error'}):
+        print(f"  [{log.level}] ({log.phase}) {log.message}")
+    for log in store.tail(1, 2, phase='test'):
+        print(f"  [{log.level}] ({log.phase}) {log.message}")
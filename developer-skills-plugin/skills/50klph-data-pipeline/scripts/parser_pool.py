@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Log Parser Worker Pool
+
+Moves log parsing off the event loop thread when many jobs stream output
+at once. Jobs are sharded by job_id onto single-process workers, so every
+job's batches are parsed by the same worker in submission order.
+
+Small batches are parsed in-process by default (shipping a handful of lines
+to another process costs more than parsing them); the policy is pluggable.
+
+Usage:
+    from parser_pool import ParserPool
+
+    async with ParserPool(workers=4) as pool:
+        async for parsed in pool.parse_stream(job_id, read_chunks(process.stdout)):
+            if parsed.should_display:
+                save_log(parsed.message, parsed.level)
+"""
+
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import AsyncIterable, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+try:
+    from .log_parser import LogParser, ParsedLog, split_lines
+except ImportError:  # Run as a script, or with scripts/ itself on sys.path
+    from log_parser import LogParser, ParsedLog, split_lines
+
+
+# (message, level, phase, should_display, is_progress) - cheaper to pickle than ParsedLog
+ParsedRow = Tuple[str, str, Optional[str], bool, bool]
+
+# Decides whether a batch goes to a worker: (batch_size, active_jobs) -> offload?
+OffloadPolicy = Callable[[int, int], bool]
+
+# Parser owned by each worker process, created on first use
+_worker_parser: Optional[LogParser] = None
+
+
+def _parse_in_worker(lines: List[str]) -> List[ParsedRow]:
+    """Parse a batch inside a worker process"""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = LogParser()
+
+    return [
+        (p.message, p.level, p.phase, p.should_display, p.is_progress)
+        for p in _worker_parser.parse_batch(lines)
+    ]
+
+
+def default_offload_policy(min_batch: int = 256) -> OffloadPolicy:
+    """Offload batches of at least min_batch lines, parse smaller ones inline"""
+    def policy(batch_size: int, active_jobs: int) -> bool:
+        return batch_size >= min_batch
+    return policy
+
+
+class ParserPool:
+    """
+    Shards log parsing across worker processes by job_id
+
+    Each shard is its own single-worker executor, so a job always lands on
+    the same process and its batches run FIFO. A per-job lock keeps results
+    in order even when inline and offloaded batches of one job interleave.
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        offload_policy: Optional[OffloadPolicy] = None,
+        executor_factory: Callable[[], Executor] = lambda: ProcessPoolExecutor(max_workers=1),
+    ):
+        """
+        Args:
+            workers: Number of shards (worker processes)
+            offload_policy: Decides inline vs worker parsing per batch
+            executor_factory: Builds one single-worker executor per shard
+        """
+        self.workers = workers
+        self.offload_policy = offload_policy or default_offload_policy()
+        self.executors: List[Executor] = [executor_factory() for _ in range(workers)]
+        self.local_parser = LogParser()
+
+        # Per-job ordering locks; entry removed once the job is idle
+        self.job_locks: Dict[int, asyncio.Lock] = {}
+        self.job_waiters: Dict[int, int] = {}
+
+        # Counters for metrics
+        self.inline_batches = 0
+        self.offloaded_batches = 0
+
+    def shard_for(self, job_id: int) -> int:
+        """Worker index that owns a job"""
+        return hash(job_id) % self.workers
+
+    async def parse_batch(self, job_id: int, lines: List[str]) -> List[ParsedLog]:
+        """
+        Parse one batch of lines for a job
+
+        Concurrent calls for the same job return in submission order.
+        """
+        if not lines:
+            return []
+
+        lock = self.job_locks.get(job_id)
+        if lock is None:
+            lock = self.job_locks[job_id] = asyncio.Lock()
+        self.job_waiters[job_id] = self.job_waiters.get(job_id, 0) + 1
+
+        try:
+            async with lock:
+                if not self.workers or not self.offload_policy(len(lines), len(self.job_locks)):
+                    self.inline_batches += 1
+                    return self.local_parser.parse_batch(lines)
+
+                self.offloaded_batches += 1
+                loop = asyncio.get_running_loop()
+                rows = await loop.run_in_executor(
+                    self.executors[self.shard_for(job_id)], _parse_in_worker, lines
+                )
+                return [ParsedLog(*row) for row in rows]
+        finally:
+            self.job_waiters[job_id] -= 1
+            if not self.job_waiters[job_id]:
+                del self.job_waiters[job_id]
+                del self.job_locks[job_id]
+
+    async def parse_stream(
+        self,
+        job_id: int,
+        chunks: AsyncIterable[bytes],
+        encoding: str = 'utf-8',
+        errors: str = 'replace'
+    ) -> AsyncIterator[ParsedLog]:
+        """Parse a job's subprocess output, one batch per chunk read from the pipe"""
+        async for lines in split_lines(chunks, encoding, errors):
+            for parsed in await self.parse_batch(job_id, lines):
+                yield parsed
+
+    def close(self, wait: bool = True):
+        """Shut down all worker processes"""
+        for executor in self.executors:
+            executor.shutdown(wait=wait)
+
+    async def __aenter__(self) -> 'ParserPool':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+
+# Example usage
+if __name__ == '__main__':
+    async def main():
+        async with ParserPool(workers=2) as pool:
+            lines = [
+                "Implementing feature: User authentication (Step 3/5)",
+                "DEBUG: aiosqlite executing functools.partial",
+                "ERROR: Failed to generate specification",
+            ] * 200
+
+            results = await asyncio.gather(*(pool.parse_batch(job_id, lines) for job_id in range(4)))
+            for job_id, parsed in enumerate(results):
+                shown = sum(1 for p in parsed if p.should_display)
+                print(f"Job {job_id} (worker {pool.shard_for(job_id)}): {len(parsed)} parsed, {shown} shown")
+
+            print(f"\nInline batches: {pool.inline_batches}, offloaded: {pool.offloaded_batches}")
+
+    asyncio.run(main())
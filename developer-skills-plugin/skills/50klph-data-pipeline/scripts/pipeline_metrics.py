@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+Pipeline Latency Instrumentation
+
+Per-hop timing for log lines moving through the pipeline:
+
+    subprocess read → parse → DB insert → SSE broadcast
+
+Each line carries a trace through the hops and every hop duration goes
+into an HDR-style histogram (log-linear buckets, ~1.5% relative error,
+constant memory), so p50/p95/p99 stay cheap at 50k lines/hour. The report
+names the hop that dominates per-line time: parse-, DB- or SSE-bound.
+
+Two sources:
+- replay: drives lines from a subprocess through LogParser, a SQLite
+  insert and DashboardStateManager + a queue standing in for SSE
+- db: reads stored timestamps from workflow.db and measures how long
+  logs waited for their stream message
+
+Usage:
+    python pipeline_metrics.py replay --input speckit.log
+    python pipeline_metrics.py replay --lines 50000 --db /tmp/scratch.db --json metrics.json
+    python pipeline_metrics.py db --job-id 123
+
+    from pipeline_metrics import PipelineTracer
+
+    tracer = PipelineTracer()
+    trace = tracer.begin()
+    line = await process.stdout.readline()
+    tracer.hop(trace, 'read')
+    parsed = parser.parse(line.decode())
+    tracer.hop(trace, 'parse')
+    ...
+    tracer.finish(trace)
+    print(tracer.report())
+"""
+
+import asyncio
+import json
+import sqlite3
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+try:
+    from .dashboard_state import DashboardStateManager, JobState
+    from .db_pool import ReadOnlyPool
+    from .log_parser import LogParser
+except ImportError:  # Run as a script, or with scripts/ itself on sys.path
+    from dashboard_state import DashboardStateManager, JobState
+    from db_pool import ReadOnlyPool
+    from log_parser import LogParser
+
+
+# Hops a log line passes through, in pipeline order
+HOPS = ('read', 'parse', 'db_insert', 'broadcast')
+END_TO_END = 'end_to_end'
+
+# What being bound by each hop means
+BOUND_BY = {
+    'read': 'source-bound (waiting on the subprocess)',
+    'parse': 'parse-bound',
+    'db_insert': 'DB-bound',
+    'broadcast': 'SSE-bound',
+}
+
+
+class LatencyHistogram:
+    """
+    HDR-style histogram of nanosecond durations
+
+    Values below 2**sub_bucket_bits are counted exactly; above that each
+    power of two is split into 2**(sub_bucket_bits - 1) linear buckets, so
+    a recorded value is off by at most 1 / 2**(sub_bucket_bits - 1).
+    """
+
+    def __init__(self, sub_bucket_bits: int = 7):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.sub_bucket_count = 1 << sub_bucket_bits
+        self.half_count = self.sub_bucket_count >> 1
+        self.counts: List[int] = []
+
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def _index(self, value: int) -> int:
+        if value < self.sub_bucket_count:
+            return value
+        shift = value.bit_length() - self.sub_bucket_bits
+        return self.sub_bucket_count + (shift - 1) * self.half_count + (value >> shift) - self.half_count
+
+    def _value(self, index: int) -> int:
+        """Midpoint of a bucket"""
+        if index < self.sub_bucket_count:
+            return index
+        shift, offset = divmod(index - self.sub_bucket_count, self.half_count)
+        shift += 1
+        return ((offset + self.half_count) << shift) + (1 << shift >> 1)
+
+    def record(self, value: int):
+        """Record one duration in nanoseconds"""
+        value = max(0, value)
+        index = self._index(value)
+        if index >= len(self.counts):
+            self.counts.extend([0] * (index + 1 - len(self.counts)))
+        self.counts[index] += 1
+
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def percentile(self, percent: float) -> int:
+        """Value at or below which percent% of recordings fall (0 if empty)"""
+        if not self.count:
+            return 0
+        target = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= target:
+                return min(self._value(index), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def merge(self, other: 'LatencyHistogram'):
+        """Add another histogram's recordings (same sub_bucket_bits)"""
+        if len(other.counts) > len(self.counts):
+            self.counts.extend([0] * (len(other.counts) - len(self.counts)))
+        for index, bucket in enumerate(other.counts):
+            self.counts[index] += bucket
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    def to_dict(self) -> Dict:
+        """Summary in milliseconds"""
+        ms = 1e6
+        return {
+            'count': self.count,
+            'mean_ms': self.mean / ms,
+            'min_ms': (self.min or 0) / ms,
+            'p50_ms': self.percentile(50) / ms,
+            'p95_ms': self.percentile(95) / ms,
+            'p99_ms': self.percentile(99) / ms,
+            'max_ms': (self.max or 0) / ms,
+            'total_ms': self.total / ms,
+        }
+
+
+class EventTrace:
+    """Timestamps of one log line as it moves through the hops"""
+
+    __slots__ = ('started_ns', 'last_ns')
+
+    def __init__(self, now_ns: int):
+        self.started_ns = now_ns
+        self.last_ns = now_ns
+
+
+class PipelineTracer:
+    """Per-hop and end-to-end latency histograms for traced events"""
+
+    def __init__(self, hops=HOPS, clock=time.perf_counter_ns):
+        """
+        Args:
+            hops: Hop names, in pipeline order
+            clock: Nanosecond clock (injectable for testing)
+        """
+        self.clock = clock
+        self.histograms: Dict[str, LatencyHistogram] = {hop: LatencyHistogram() for hop in hops}
+        self.histograms[END_TO_END] = LatencyHistogram()
+
+    def begin(self) -> EventTrace:
+        """Start tracing one event"""
+        return EventTrace(self.clock())
+
+    def hop(self, trace: EventTrace, stage: str):
+        """Record the time since the previous hop (or begin) under stage"""
+        now = self.clock()
+        self.histograms[stage].record(now - trace.last_ns)
+        trace.last_ns = now
+
+    def finish(self, trace: EventTrace):
+        """Record the event's end-to-end time"""
+        self.histograms[END_TO_END].record(self.clock() - trace.started_ns)
+
+    @contextmanager
+    def timed(self, stage: str) -> Iterator[None]:
+        """Time a block as one recording of stage, outside any trace"""
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.histograms[stage].record(self.clock() - start)
+
+    def bottleneck(self) -> Optional[str]:
+        """Hop with the largest share of total time, or None before any recording"""
+        totals = {stage: h.total for stage, h in self.histograms.items() if stage != END_TO_END and h.count}
+        return max(totals, key=totals.get) if totals else None
+
+    def to_dict(self) -> Dict:
+        hops = {stage: h.to_dict() for stage, h in self.histograms.items()}
+        bottleneck = self.bottleneck()
+        return {'hops': hops, 'bottleneck': bottleneck, 'bound_by': BOUND_BY.get(bottleneck)}
+
+    def dump_json(self, path: Path):
+        """Write to_dict() as JSON"""
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2))
+
+    def report(self) -> str:
+        """Table of per-hop percentiles in milliseconds"""
+        lines = [
+            f"{'Hop':<12} {'Count':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'Max':>9} {'Share':>7}",
+            "-" * 70,
+        ]
+        hop_total = sum(h.total for stage, h in self.histograms.items() if stage != END_TO_END) or 1
+        for stage, histogram in self.histograms.items():
+            summary = histogram.to_dict()
+            share = '' if stage == END_TO_END else f"{histogram.total / hop_total:.0%}"
+            lines.append(
+                f"{stage:<12} {summary['count']:>9} {summary['p50_ms']:>9.3f} {summary['p95_ms']:>9.3f} "
+                f"{summary['p99_ms']:>9.3f} {summary['max_ms']:>9.3f} {share:>7}"
+            )
+
+        bottleneck = self.bottleneck()
+        if bottleneck in BOUND_BY:
+            lines.append(f"\nBottleneck: {bottleneck} → {BOUND_BY[bottleneck]}")
+        return '\n'.join(lines)
+
+
+LOG_INSERT_SQL = "INSERT INTO log_entries (job_id, message, level, timestamp) VALUES (?, ?, ?, ?)"
+
+# Copies a file to stdout, standing in for a speckit subprocess
+_CAT_SCRIPT = "import shutil, sys; shutil.copyfileobj(open(sys.argv[1], 'rb'), sys.stdout.buffer)"
+
+
+async def replay(
+    command: List[str],
+    tracer: PipelineTracer,
+    db: sqlite3.Connection,
+    job_id: int = 1
+) -> int:
+    """
+    Trace every line a subprocess prints through parse, insert and broadcast
+
+    Lines are handled the way the executor does (readline, parse, one
+    committed insert per displayed line). Broadcasts go through
+    DashboardStateManager and an asyncio.Queue; the broadcast hop ends
+    when the consumer (the SSE side) takes the message off the queue.
+
+    Returns:
+        Lines read
+    """
+    parser = LogParser()
+    manager = DashboardStateManager()
+    job = JobState(job_id=job_id, status='in_progress', current_phase='specify')
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def consume():
+        while True:
+            trace = await queue.get()
+            tracer.hop(trace, 'broadcast')
+            tracer.finish(trace)
+            queue.task_done()
+
+    consumer = asyncio.create_task(consume())
+    process = await asyncio.create_subprocess_exec(*command, stdout=asyncio.subprocess.PIPE)
+    count = 0
+
+    while True:
+        trace = tracer.begin()
+        raw = await process.stdout.readline()
+        if not raw:
+            break
+        count += 1
+        tracer.hop(trace, 'read')
+
+        parsed = parser.parse(raw.decode('utf-8', errors='replace'))
+        tracer.hop(trace, 'parse')
+        if not parsed.should_display:
+            tracer.finish(trace)
+            continue
+
+        with db:
+            db.execute(LOG_INSERT_SQL, (job_id, parsed.message, parsed.level, datetime.utcnow().isoformat()))
+        tracer.hop(trace, 'db_insert')
+
+        if parsed.phase:
+            job.current_phase = parsed.phase
+        if manager.calculate_updates(job, 'log').logs_panel:
+            queue.put_nowait(trace)
+            # readline() does not yield while the pipe has buffered data, so
+            # yield here to let the consumer take each message as it is sent
+            await asyncio.sleep(0)
+        else:
+            tracer.finish(trace)
+
+    await process.wait()
+    await queue.join()
+    consumer.cancel()
+    return count
+
+
+def open_scratch_db(path: str) -> sqlite3.Connection:
+    """Database for replay inserts (never the live workflow.db)"""
+    db = sqlite3.connect(path)
+    db.execute("PRAGMA journal_mode = WAL")
+    db.execute(
+        "CREATE TABLE IF NOT EXISTS log_entries "
+        "(id INTEGER PRIMARY KEY, job_id INTEGER, message TEXT, level TEXT, timestamp)"
+    )
+    return db
+
+
+STORED_LAG_SQL = """
+    SELECT log_entries.timestamp, (
+        SELECT MIN(stream_messages.created_at) FROM stream_messages
+        WHERE stream_messages.stream_type = 'logs' AND stream_messages.created_at >= log_entries.timestamp
+    )
+    FROM log_entries
+    WHERE ? IS NULL OR log_entries.job_id = ?
+    ORDER BY log_entries.rowid DESC LIMIT ?
+"""
+
+
+async def stored_broadcast_lag(db_path: Path, job_id: Optional[int] = None, limit: int = 10_000) -> LatencyHistogram:
+    """
+    Log row → logs stream message lag from timestamps already in workflow.db
+
+    Rows never followed by a stream message are left out (the debugger
+    reports those as an SSE stage failure).
+    """
+    histogram = LatencyHistogram()
+    async with ReadOnlyPool(db_path, size=1) as pool:
+        rows = await pool.fetchall(STORED_LAG_SQL, (job_id, job_id, limit))
+
+    for logged, broadcast in rows:
+        if logged and broadcast:
+            seconds = (datetime.fromisoformat(broadcast) - datetime.fromisoformat(logged)).total_seconds()
+            histogram.record(int(seconds * 1e9))
+    return histogram
+
+
+if __name__ == '__main__':
+    import argparse
+    import tempfile
+
+    parser = argparse.ArgumentParser(description='Measure per-hop pipeline latency')
+    subparsers = parser.add_subparsers(dest='source', required=True)
+
+    replay_parser = subparsers.add_parser('replay', help='Trace lines from a log file through the pipeline')
+    replay_parser.add_argument('--input', type=Path, help='Recorded speckit output (default: synthetic)')
+    replay_parser.add_argument('--lines', type=int, default=20_000, help='Synthetic lines when no --input')
+    replay_parser.add_argument('--db', default=':memory:', help='Scratch database for inserts')
+    replay_parser.add_argument('--json', type=Path, help='Also write the metrics to this file')
+
+    db_parser = subparsers.add_parser('db', help='Stored log → stream lag from workflow.db')
+    db_parser.add_argument('--job-id', type=int, help='Only this job')
+    db_parser.add_argument('--limit', type=int, default=10_000, help='Most recent log rows to check')
+    db_parser.add_argument('--json', type=Path, help='Also write the metrics to this file')
+
+    args = parser.parse_args()
+
+    if args.source == 'replay':
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = args.input
+            if input_path is None:
+                from benchmark import make_corpus
+                input_path = Path(tmp) / 'speckit.log'
+                input_path.write_text(''.join(f"{line}\n" for line in make_corpus(args.lines)))
+
+            tracer = PipelineTracer()
+            db = open_scratch_db(args.db)
+            count = asyncio.run(replay([sys.executable, '-c', _CAT_SCRIPT, str(input_path)], tracer, db))
+            db.close()
+
+        print(f"Replayed {count} lines from {args.input or 'synthetic corpus'}\n")
+        print(tracer.report())
+        if args.json:
+            tracer.dump_json(args.json)
+
+    elif args.source == 'db':
+        db_path = Path.cwd() / "workflow.db"
+        if not db_path.exists():
+            print(f"❌ Database not found: {db_path}")
+            sys.exit(1)
+
+        histogram = asyncio.run(stored_broadcast_lag(db_path, args.job_id, args.limit))
+        summary = histogram.to_dict()
+        print(f"Log → logs stream lag ({summary['count']} logs with a later stream message)")
+        print(f"  p50 {summary['p50_ms']:.1f} ms  p95 {summary['p95_ms']:.1f} ms  "
+              f"p99 {summary['p99_ms']:.1f} ms  max {summary['max_ms']:.1f} ms")
+        if args.json:
+            args.json.write_text(json.dumps({'log_to_stream': summary}, indent=2))
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Aggregate Pipeline Queries
+
+Bulk versions of the debugger's stage queries. Instead of one COUNT(*)
+per job or per stream type, each function answers for many jobs (or all
+stream types) with one grouped statement. Job IDs and project prefixes
+are passed as a single JSON parameter (json_each), so the SQL text is
+constant and stays prepared no matter how many jobs are asked about.
+
+Also checks for the covering indexes these queries rely on and can
+create them; without them every query is a full table scan.
+
+Usage:
+    from db_pool import ReadOnlyPool
+    from pipeline_queries import log_stats, stream_activity, missing_indexes
+
+    async with ReadOnlyPool(db_path) as pool:
+        stats = await log_stats(pool, [101, 102, 103])
+        streams = await stream_activity(pool, since_iso)
+
+    for ddl in missing_indexes(db_path):
+        print(f"Recommended: {ddl}")
+"""
+
+import json
+import os
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    from .db_pool import ReadOnlyPool
+except ImportError:  # Run as a script, or with scripts/ itself on sys.path
+    from db_pool import ReadOnlyPool
+
+
+# Covering indexes for the statements below: (name, table, columns)
+RECOMMENDED_INDEXES = [
+    ('idx_log_entries_job_timestamp', 'log_entries', ('job_id', 'timestamp')),
+    ('idx_stream_messages_type_created', 'stream_messages', ('stream_type', 'created_at')),
+    ('idx_artifacts_file_path', 'artifacts', ('file_path',)),
+]
+
+# Stream types the backend publishes
+STREAM_TYPES = ('logs', 'insights', 'knowledge')
+
+LOG_STATS_SQL = """
+    SELECT job_id, COUNT(*), MAX(timestamp)
+    FROM log_entries
+    WHERE job_id IN (SELECT value FROM json_each(?))
+    GROUP BY job_id
+"""
+
+# Newest rows per job via one bounded (job_id, timestamp) index seek each;
+# a window function over the jobs' rows would read and sort all of them
+LOG_SAMPLES_SQL = """
+    SELECT ids.value, log_entries.message, log_entries.level, log_entries.timestamp
+    FROM (SELECT DISTINCT value FROM json_each(?1)) AS ids
+    JOIN log_entries ON log_entries.rowid IN (
+        SELECT rowid FROM log_entries
+        WHERE job_id = ids.value
+        ORDER BY timestamp DESC
+        LIMIT ?2
+    )
+    ORDER BY ids.value, log_entries.timestamp DESC
+"""
+
+# One (stream_type, created_at) range seek per stream type: a range on
+# created_at alone cannot use that index and scans the whole table
+STREAM_ACTIVITY_SQL = """
+    SELECT types.value,
+           (SELECT COUNT(*) FROM stream_messages
+            WHERE stream_type = types.value AND created_at > ?2),
+           (SELECT MAX(created_at) FROM stream_messages
+            WHERE stream_type = types.value AND created_at > ?2)
+    FROM (SELECT DISTINCT value FROM json_each(?1)) AS types
+"""
+
+# Prefix match as a range on file_path so the index is used (LIKE is not)
+ARTIFACT_STATS_SQL = """
+    WITH prefixes(name, low, high) AS (
+        SELECT json_extract(value, '$[0]'), json_extract(value, '$[1]'), json_extract(value, '$[2]')
+        FROM json_each(?)
+    )
+    SELECT prefixes.name, COUNT(artifacts.file_path)
+    FROM prefixes
+    LEFT JOIN artifacts ON artifacts.file_path >= prefixes.low AND artifacts.file_path < prefixes.high
+    GROUP BY prefixes.name
+"""
+
+ARTIFACT_SAMPLES_SQL = """
+    WITH prefixes(name, low, high) AS (
+        SELECT json_extract(value, '$[0]'), json_extract(value, '$[1]'), json_extract(value, '$[2]')
+        FROM json_each(?)
+    )
+    SELECT name, file_name, artifact_type, created_at FROM (
+        SELECT prefixes.name AS name, artifacts.file_name, artifacts.artifact_type, artifacts.created_at,
+               ROW_NUMBER() OVER (PARTITION BY prefixes.name ORDER BY artifacts.created_at DESC) AS rank
+        FROM prefixes
+        JOIN artifacts ON artifacts.file_path >= prefixes.low AND artifacts.file_path < prefixes.high
+    )
+    WHERE rank <= ?
+    ORDER BY name, created_at DESC
+"""
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _prefix_range(project_path: Path) -> Tuple[str, str]:
+    """[low, high) string range covering every path inside project_path"""
+    low = f"{project_path}{os.sep}"
+    high = low[:-1] + chr(ord(low[-1]) + 1)
+    return low, high
+
+
+async def log_stats(pool: ReadOnlyPool, job_ids: Iterable[int], sample_size: int = 5) -> Dict[int, Dict]:
+    """
+    Log count, latest timestamp and newest samples for many jobs
+
+    Returns:
+        job_id -> {'log_count': int, 'latest_timestamp': datetime, 'sample_logs': List[str]}
+        (every requested job is present, with zero counts if it has no logs)
+    """
+    job_ids = list(job_ids)
+    ids_param = json.dumps(job_ids)
+
+    stats = {
+        job_id: {'log_count': 0, 'latest_timestamp': None, 'sample_logs': []}
+        for job_id in job_ids
+    }
+
+    for job_id, count, latest in await pool.fetchall(LOG_STATS_SQL, (ids_param,)):
+        stats[job_id]['log_count'] = count
+        stats[job_id]['latest_timestamp'] = _parse_timestamp(latest)
+
+    if sample_size > 0:
+        for job_id, message, level, _ in await pool.fetchall(LOG_SAMPLES_SQL, (ids_param, sample_size)):
+            stats[job_id]['sample_logs'].append(f"[{level}] {message}")
+
+    return stats
+
+
+async def stream_activity(pool: ReadOnlyPool, since: str, stream_types: Iterable[str] = STREAM_TYPES) -> Dict[str, Dict]:
+    """
+    Message count and latest message time per stream type since an ISO timestamp
+
+    Returns:
+        stream_type -> {'count': int, 'latest': datetime}
+        (every requested stream type is present, with zero counts if idle)
+    """
+    types_param = json.dumps(list(stream_types))
+    return {
+        stream_type: {'count': count, 'latest': _parse_timestamp(latest)}
+        for stream_type, count, latest in await pool.fetchall(STREAM_ACTIVITY_SQL, (types_param, since))
+    }
+
+
+async def artifact_stats(
+    pool: ReadOnlyPool,
+    project_paths: Dict[str, Path],
+    sample_size: int = 5
+) -> Dict[str, Dict]:
+    """
+    Artifact count and newest samples for many project directories
+
+    Args:
+        project_paths: key -> project directory (keys are returned as-is)
+
+    Returns:
+        key -> {'artifact_count': int, 'sample_artifacts': List[str]}
+    """
+    prefixes_param = json.dumps([
+        [key, *_prefix_range(path)] for key, path in project_paths.items()
+    ])
+
+    stats = {key: {'artifact_count': 0, 'sample_artifacts': []} for key in project_paths}
+
+    for key, count in await pool.fetchall(ARTIFACT_STATS_SQL, (prefixes_param,)):
+        stats[key]['artifact_count'] = count
+
+    if sample_size > 0:
+        for key, name, type_, _ in await pool.fetchall(ARTIFACT_SAMPLES_SQL, (prefixes_param, sample_size)):
+            stats[key]['sample_artifacts'].append(f"{name} ({type_})")
+
+    return stats
+
+
+def _indexed_prefixes(conn: sqlite3.Connection, table: str) -> List[Tuple[str, ...]]:
+    """Column lists of every index on a table"""
+    columns = []
+    for _, index_name, *_ in conn.execute(f"PRAGMA index_list({table})").fetchall():
+        info = conn.execute(f"PRAGMA index_info({index_name})").fetchall()
+        columns.append(tuple(name for _, _, name in sorted(info)))
+    return columns
+
+
+def missing_indexes(db_path: Path) -> List[str]:
+    """
+    CREATE INDEX statements for recommended indexes that are missing
+
+    An existing index counts if its leading columns match. Tables that do
+    not exist are skipped.
+    """
+    conn = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        tables = {name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        missing = []
+        for index_name, table, columns in RECOMMENDED_INDEXES:
+            if table not in tables:
+                continue
+            if any(existing[:len(columns)] == columns for existing in _indexed_prefixes(conn, table)):
+                continue
+            missing.append(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table}({', '.join(columns)})")
+        return missing
+    finally:
+        conn.close()
+
+
+def create_missing_indexes(db_path: Path) -> List[str]:
+    """
+    Create the missing recommended indexes (needs write access)
+
+    Returns:
+        Statements that were executed
+    """
+    statements = missing_indexes(db_path)
+    if statements:
+        conn = sqlite3.connect(db_path, timeout=30)
+        try:
+            with conn:
+                for ddl in statements:
+                    conn.execute(ddl)
+        finally:
+            conn.close()
+    return statements
+
+
+# Example usage
+if __name__ == '__main__':
+    import asyncio
+    import sys
+    from datetime import timedelta
+
+    db_path = Path(sys.argv[1]) if len(sys.argv) > 1 else Path.cwd() / "workflow.db"
+
+    async def main():
+        async with ReadOnlyPool(db_path) as pool:
+            job_ids = [job_id for (job_id,) in await pool.fetchall("SELECT id FROM jobs ORDER BY id DESC LIMIT 10")]
+            for job_id, stats in (await log_stats(pool, job_ids, sample_size=1)).items():
+                print(f"Job {job_id}: {stats['log_count']} logs, latest {stats['latest_timestamp']}")
+
+            since = (datetime.utcnow() - timedelta(minutes=5)).isoformat()
+            for stream_type, activity in (await stream_activity(pool, since)).items():
+                print(f"Stream {stream_type}: {activity['count']} messages in the last 5 minutes")
+
+        for ddl in missing_indexes(db_path):
+            print(f"Recommended: {ddl}")
+
+    asyncio.run(main())
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+Pipeline Watch Mode
+
+Long-running version of the pipeline debugger. Instead of rescanning
+everything on each check, it follows changes as they happen:
+
+- workflow.db: `PRAGMA data_version` is polled (free when nothing was
+  committed); on a change only rows past the last seen rowid are read
+- project directory: watchdog events when installed (inotify on Linux),
+  otherwise an incremental mtime rescan (project_scanner.diff_tree)
+
+From those events it keeps per-stage lag metrics (file write → artifact
+row → stream message, log row → logs stream message) and flags a stage as
+stalled when work has been waiting on it too long.
+
+Usage:
+    python debug_pipeline.py --watch
+    python debug_pipeline.py --watch --job-id 123 --duration 60
+
+    from pipeline_watch import PipelineWatcher
+
+    watcher = PipelineWatcher(db_path, project_path, job_id=123)
+    await watcher.run()
+"""
+
+import asyncio
+import contextlib
+import os
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+try:
+    from .db_pool import ReadOnlyPool
+    from .project_scanner import IGNORED_DIRS, diff_tree
+except ImportError:  # Run as a script, or with scripts/ itself on sys.path
+    from db_pool import ReadOnlyPool
+    from project_scanner import IGNORED_DIRS, diff_tree
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # Optional: fall back to polling the tree
+    Observer = None
+
+
+# Called with (absolute file path, write time as epoch seconds, newly created?)
+FileCallback = Callable[[str, float, bool], None]
+
+DATA_VERSION_SQL = "PRAGMA data_version"
+
+# New rows per table since a rowid watermark; the value columns are
+# (key, epoch-able timestamp) for the lag calculations
+TAIL_SQL = {
+    'log_entries': "SELECT rowid, job_id, timestamp FROM log_entries WHERE rowid > ? ORDER BY rowid LIMIT ?",
+    'artifacts': "SELECT rowid, file_path, created_at FROM artifacts WHERE rowid > ? ORDER BY rowid LIMIT ?",
+    'stream_messages': "SELECT rowid, stream_type, created_at FROM stream_messages WHERE rowid > ? ORDER BY rowid LIMIT ?",
+}
+MAX_ROWID_SQL = {table: f"SELECT MAX(rowid) FROM {table}" for table in TAIL_SQL}
+
+# Lag stages, in pipeline order
+STAGES = ('file→artifact', 'artifact→stream', 'log→stream')
+
+
+def _db_time(value: Optional[str]) -> Optional[float]:
+    """Epoch seconds for a stored timestamp (the backend writes naive UTC); None if unparseable"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class LagStats:
+    """Running lag summary for one stage"""
+
+    __slots__ = ('count', 'last', 'total', 'worst')
+
+    def __init__(self):
+        self.count = 0
+        self.last = 0.0
+        self.total = 0.0
+        self.worst = 0.0
+
+    def add(self, seconds: float):
+        seconds = max(0.0, seconds)
+        self.count += 1
+        self.last = seconds
+        self.total += seconds
+        self.worst = max(self.worst, seconds)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class DatabaseTail:
+    """Follows inserts into the pipeline tables of workflow.db"""
+
+    def __init__(self, pool: ReadOnlyPool, batch: int = 1000):
+        """
+        Args:
+            pool: Read-only pool; use size=1 so data_version is always
+                read on the same connection
+            batch: Rows read per table per poll
+        """
+        self.pool = pool
+        self.batch = batch
+        self.watermarks: Dict[str, int] = {}
+        self.data_version: Optional[int] = None
+
+    async def start(self):
+        """Skip existing rows: only inserts from now on are reported"""
+        self.data_version = await self.pool.scalar(DATA_VERSION_SQL)
+        for table, sql in MAX_ROWID_SQL.items():
+            self.watermarks[table] = await self.pool.scalar(sql) or 0
+
+    async def poll(self) -> Dict[str, List[Tuple]]:
+        """
+        New rows per table since the last poll
+
+        Returns an empty dict without touching any table when no other
+        connection has committed since the last call.
+        """
+        version = await self.pool.scalar(DATA_VERSION_SQL)
+        if version == self.data_version:
+            return {}
+        self.data_version = version
+
+        new_rows = {}
+        for table, sql in TAIL_SQL.items():
+            rows = await self.pool.fetchall(sql, (self.watermarks[table], self.batch))
+            if rows:
+                self.watermarks[table] = rows[-1][0]
+                new_rows[table] = rows
+                if len(rows) == self.batch:
+                    # More waiting: make the next poll read again
+                    self.data_version = None
+        return new_rows
+
+
+class PollingFileWatcher:
+    """
+    Reports written files by rescanning the tree every interval
+
+    Only directories whose mtime changed are read again, but every file is
+    still stat'ed (one stat per file per interval) so in-place edits are
+    reported too.
+    """
+
+    def __init__(self, project_path: Path, interval: float = 1.0):
+        self.project_path = project_path
+        self.interval = interval
+
+    async def run(self, on_change: FileCallback):
+        # The first pass only builds the baseline
+        _, dirs = await asyncio.to_thread(diff_tree, self.project_path, {}, sample_size=0)
+        root = os.fspath(self.project_path)
+
+        while True:
+            await asyncio.sleep(self.interval)
+            delta, dirs = await asyncio.to_thread(diff_tree, self.project_path, dirs, sample_size=0)
+            for rels, created in ((delta.added, True), (delta.modified, False)):
+                for rel in rels:
+                    folder, name = os.path.split(rel)
+                    mtime_ns = dirs[folder]['files'][name][1]
+                    on_change(os.path.join(root, rel), mtime_ns / 1e9, created)
+
+
+class WatchdogFileWatcher:
+    """Reports written files from filesystem events (requires watchdog)"""
+
+    def __init__(self, project_path: Path):
+        self.project_path = project_path
+
+    async def run(self, on_change: FileCallback):
+        loop = asyncio.get_running_loop()
+        root = os.fspath(self.project_path)
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory or event.event_type not in ('created', 'modified', 'moved'):
+                    return
+                path = event.dest_path if event.event_type == 'moved' else event.src_path
+                if IGNORED_DIRS.intersection(Path(os.path.relpath(path, root)).parts):
+                    return
+                # A rename may replace an existing file, so only 'created' is known to be new
+                loop.call_soon_threadsafe(on_change, path, time.time(), event.event_type == 'created')
+
+        observer = Observer()
+        observer.schedule(Handler(), root, recursive=True)
+        observer.start()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            observer.stop()
+            await asyncio.to_thread(observer.join)
+
+
+def make_file_watcher(project_path: Path, interval: float = 1.0):
+    """Event-driven watcher when watchdog is installed, polling otherwise"""
+    if Observer is not None:
+        return WatchdogFileWatcher(project_path)
+    return PollingFileWatcher(project_path, interval)
+
+
+class PipelineWatcher:
+    """
+    Live lag and stall tracking across the pipeline stages
+
+    Pending work is kept per stage (new files without an artifact row,
+    artifacts and logs without a later stream message); it is matched off
+    as the next stage's rows arrive, and anything older than stall_after
+    marks that stage as stalled. Artifact rows usually arrive before the
+    polling file watcher reports their file, so recent unmatched artifact
+    paths are remembered and matched when the file event comes in.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        project_path: Path,
+        job_id: Optional[int] = None,
+        poll_interval: float = 0.25,
+        report_interval: float = 5.0,
+        stall_after: float = 30.0,
+        max_pending: int = 10_000
+    ):
+        """
+        Args:
+            db_path: workflow.db
+            project_path: Directory to watch (one project or all of generated_projects)
+            job_id: Only follow this job's logs (None = all jobs)
+            poll_interval: Seconds between data_version checks
+            report_interval: Seconds between printed status lines
+            stall_after: Seconds pending work may wait before a stage counts as stalled
+            max_pending: Pending items (and unmatched artifact paths) kept per stage, oldest dropped first
+        """
+        self.db_path = db_path
+        self.project_path = project_path
+        self.job_id = job_id
+        self.poll_interval = poll_interval
+        self.report_interval = report_interval
+        self.stall_after = stall_after
+
+        self.project_prefix = f"{project_path}{os.sep}"
+        self.lags: Dict[str, LagStats] = {stage: LagStats() for stage in STAGES}
+
+        # Waiting for the next stage: created file path -> write time, and
+        # timestamps of artifacts/logs not yet followed by a stream message
+        self.pending_files: Dict[str, float] = {}
+        self.pending_artifacts: Deque[float] = deque(maxlen=max_pending)
+        self.pending_logs: Deque[float] = deque(maxlen=max_pending)
+        self.max_pending = max_pending
+
+        # Artifact rows seen before their file event: path -> row time (oldest first)
+        self.seen_artifacts: 'OrderedDict[str, float]' = OrderedDict()
+
+        # Events since the last report
+        self.counts = {'files': 0, 'log_entries': 0, 'artifacts': 0, 'stream_messages': 0}
+
+    def on_file_changed(self, path: str, written_at: float, created: bool = True):
+        """
+        File watcher callback
+
+        Only created files wait for an artifact row: a modified file's
+        artifact is updated in place, which the rowid tail never sees.
+        """
+        self.counts['files'] += 1
+        if not created:
+            return
+
+        artifact_at = self.seen_artifacts.pop(path, None)
+        if artifact_at is not None:
+            # Already scanned: the row beat the file watcher (lag clamps at 0)
+            self.lags['file→artifact'].add(artifact_at - written_at)
+            return
+
+        if path not in self.pending_files and len(self.pending_files) >= self.max_pending:
+            self.pending_files.pop(next(iter(self.pending_files)))
+        self.pending_files[path] = written_at
+
+    def on_rows(self, table: str, rows: List[Tuple]):
+        """Database tail callback"""
+        for _, key, stamp in rows:
+            at = _db_time(stamp)
+            if at is None:
+                continue
+
+            if table == 'log_entries':
+                if self.job_id is None or key == self.job_id:
+                    self.counts[table] += 1
+                    self.pending_logs.append(at)
+
+            elif table == 'artifacts':
+                if key is None or not key.startswith(self.project_prefix):
+                    continue
+                self.counts[table] += 1
+                written_at = self.pending_files.pop(key, None)
+                if written_at is not None:
+                    self.lags['file→artifact'].add(at - written_at)
+                else:
+                    self.seen_artifacts.pop(key, None)
+                    if len(self.seen_artifacts) >= self.max_pending:
+                        self.seen_artifacts.popitem(last=False)
+                    self.seen_artifacts[key] = at
+                self.pending_artifacts.append(at)
+
+            elif table == 'stream_messages':
+                self.counts[table] += 1
+                while self.pending_artifacts and self.pending_artifacts[0] <= at:
+                    self.lags['artifact→stream'].add(at - self.pending_artifacts.popleft())
+                if key == 'logs':
+                    while self.pending_logs and self.pending_logs[0] <= at:
+                        self.lags['log→stream'].add(at - self.pending_logs.popleft())
+
+    def stalls(self, now: float) -> List[str]:
+        """Stages with work waiting longer than stall_after"""
+        waiting = (
+            ('artifact scanner', 'files', min(self.pending_files.values(), default=None), len(self.pending_files)),
+            ('sse streams', 'artifacts', self.pending_artifacts[0] if self.pending_artifacts else None,
+             len(self.pending_artifacts)),
+            ('logs stream', 'logs', self.pending_logs[0] if self.pending_logs else None, len(self.pending_logs)),
+        )
+        return [
+            f"{stage}: {count} {what} waiting {now - oldest:.0f}s"
+            for stage, what, oldest, count in waiting
+            if oldest is not None and now - oldest > self.stall_after
+        ]
+
+    def report(self, now: float) -> str:
+        """One status line; resets the event counts"""
+        counts = (f"files +{self.counts['files']}  logs +{self.counts['log_entries']}  "
+                  f"artifacts +{self.counts['artifacts']}  streams +{self.counts['stream_messages']}")
+        for key in self.counts:
+            self.counts[key] = 0
+
+        lags = '  '.join(
+            f"{stage} {stats.last:.1f}s (avg {stats.mean:.1f}s, max {stats.worst:.1f}s)"
+            for stage, stats in self.lags.items() if stats.count
+        ) or 'no lag samples yet'
+
+        line = f"[{datetime.fromtimestamp(now):%H:%M:%S}] {counts} | {lags}"
+        stalls = self.stalls(now)
+        if stalls:
+            line += f" | ⚠️  {'; '.join(stalls)}"
+        return line
+
+    async def run(self, duration: Optional[float] = None):
+        """Watch until cancelled (or for duration seconds), printing status lines"""
+        watcher = make_file_watcher(self.project_path, max(self.poll_interval, 1.0))
+        print(f"👀 Watching {self.db_path} and {self.project_path} "
+              f"({'watchdog' if isinstance(watcher, WatchdogFileWatcher) else 'polling'})")
+
+        async with ReadOnlyPool(self.db_path, size=1) as pool:
+            tail = DatabaseTail(pool)
+            await tail.start()
+            file_task = asyncio.create_task(watcher.run(self.on_file_changed))
+
+            started = time.monotonic()
+            next_report = started + self.report_interval
+            try:
+                while duration is None or time.monotonic() - started < duration:
+                    for table, rows in (await tail.poll()).items():
+                        self.on_rows(table, rows)
+
+                    if time.monotonic() >= next_report:
+                        print(self.report(time.time()), flush=True)
+                        next_report += self.report_interval
+
+                    await asyncio.sleep(self.poll_interval)
+            finally:
+                file_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await file_task
+
+        print(self.report(time.time()))
+
+
+# Example usage
+if __name__ == '__main__':
+    import sys
+
+    workspace_root = Path.cwd()
+    duration = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+
+    watcher = PipelineWatcher(
+        workspace_root / "workflow.db",
+        workspace_root / "generated_projects",
+        report_interval=2.0
+    )
+    asyncio.run(watcher.run(duration))
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Dashboard Update Emitter
+
+Merges the DashboardUpdate results produced for a job within one event
+loop tick (or a short window) into a single SSE frame. A phase change sets
+4-5 components at once; instead of one broadcast per flag, the frontend
+receives one frame with the components packed into a bitmask.
+
+Usage:
+    from dashboard_state import DashboardStateManager
+    from update_emitter import UpdateEmitter, encode_frame
+
+    async def send(job, mask):
+        await stream_service.broadcast_message('insights', encode_frame(job, mask), 'system')
+
+    emitter = UpdateEmitter(send, window=0.05)
+    manager.enable_trailing_flush(emitter.submit)
+
+    emitter.submit(job, manager.calculate_updates(job, 'phase_change'))
+
+    # Per-client queues that coalesce per job, feeding adaptive debouncing
+    fanout = FrameFanout(on_sample=manager.enable_adaptive_debounce().observe)
+    emitter = UpdateEmitter(fanout.broadcast)
+
+    async def sse_endpoint():
+        with fanout.subscribe() as client:
+            async for frame in fanout.frames(client):
+                yield f"data: {frame}\n\n"
+"""
+
+import asyncio
+import json
+import time
+from contextlib import contextmanager
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    from .dashboard_state import COMPONENTS, DashboardUpdate, JobState
+except ImportError:  # Run as a script, or with scripts/ itself on sys.path
+    from dashboard_state import COMPONENTS, DashboardUpdate, JobState
+
+
+# Sends one merged frame: (latest job state, component bitmask) -> None or awaitable
+SendCallback = Callable[[JobState, int], Optional[Awaitable[None]]]
+
+
+def encode_frame(job: JobState, mask: int) -> str:
+    """
+    Compact JSON payload for one merged frame
+
+    Keys: j=job_id, c=component bitmask (bit i = COMPONENTS[i]),
+    p=current phase, s=status, l=lines written
+    """
+    return json.dumps(
+        {'j': job.job_id, 'c': mask, 'p': job.current_phase, 's': job.status, 'l': job.lines_written},
+        separators=(',', ':')
+    )
+
+
+def decode_components(mask: int) -> List[str]:
+    """Component names set in a frame bitmask"""
+    return [name for index, name in enumerate(COMPONENTS) if mask >> index & 1]
+
+
+class UpdateEmitter:
+    """
+    ORs together DashboardUpdates per job and sends one frame per flush
+
+    With window=0 the flush runs on the next event loop iteration, merging
+    everything submitted in the current tick; a positive window holds
+    updates for that many seconds first.
+    """
+
+    def __init__(
+        self,
+        send: SendCallback,
+        window: float = 0.0,
+        loop: Optional[asyncio.AbstractEventLoop] = None
+    ):
+        """
+        Args:
+            send: Called with (job, mask) once per job per flush;
+                coroutines are scheduled as tasks
+            window: Seconds to merge updates before flushing (0 = one loop tick)
+            loop: Event loop for scheduling (defaults to the running loop)
+        """
+        self.send = send
+        self.window = window
+        self.loop = loop
+
+        # job_id -> (latest job state, merged mask)
+        self.pending: Dict[int, Tuple[JobState, int]] = {}
+        self.flush_handle: Optional[asyncio.Handle] = None
+
+        # Counters for metrics
+        self.updates_submitted = 0
+        self.frames_sent = 0
+
+    def submit(self, job: JobState, update: DashboardUpdate):
+        """Queue an update for the job's next frame (empty updates are ignored)"""
+        mask = update.to_mask()
+        if not mask:
+            return
+
+        self.updates_submitted += 1
+        held = self.pending.get(job.job_id)
+        self.pending[job.job_id] = (job, mask if held is None else held[1] | mask)
+
+        if self.flush_handle is None:
+            loop = self.loop or asyncio.get_running_loop()
+            if self.window > 0:
+                self.flush_handle = loop.call_later(self.window, self.flush)
+            else:
+                self.flush_handle = loop.call_soon(self.flush)
+
+    def flush(self):
+        """Send one frame per job with pending updates"""
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+
+        pending, self.pending = self.pending, {}
+        for job, mask in pending.values():
+            self.frames_sent += 1
+            result = self.send(job, mask)
+            if asyncio.iscoroutine(result):
+                (self.loop or asyncio.get_running_loop()).create_task(result)
+
+    def close(self):
+        """Send anything still pending and stop scheduling"""
+        self.flush()
+
+
+# Receives backlog samples: (deepest client queue, seconds the oldest undelivered frame has waited)
+SampleCallback = Callable[[int, float], None]
+
+
+class ClientQueue:
+    """
+    Frames waiting for one SSE client, at most one per job
+
+    A frame for a job that already has one queued is merged into it (masks
+    ORed, latest JobState kept, original position and enqueue time kept),
+    so a slow client's backlog is bounded by the number of active jobs and
+    it receives fewer, larger frames rather than falling further behind.
+    """
+
+    __slots__ = ('pending', 'ready', 'delivered', 'coalesced', 'latency_ns_total')
+
+    def __init__(self):
+        # job_id -> (latest job state, merged mask, clock value when first queued)
+        self.pending: Dict[int, Tuple[JobState, int, int]] = {}
+        self.ready = asyncio.Event()
+
+        # Counters for metrics
+        self.delivered = 0
+        self.coalesced = 0
+        self.latency_ns_total = 0
+
+    def put(self, job: JobState, mask: int, now: int):
+        held = self.pending.get(job.job_id)
+        if held is None:
+            self.pending[job.job_id] = (job, mask, now)
+        else:
+            self.pending[job.job_id] = (job, held[1] | mask, held[2])
+            self.coalesced += 1
+        self.ready.set()
+
+    def oldest_age_ns(self, now: int) -> int:
+        """How long the oldest queued frame has waited (0 if drained)"""
+        for _, _, queued_at in self.pending.values():
+            return now - queued_at
+        return 0
+
+    async def get(self) -> Tuple[JobState, int, int]:
+        """Next frame, oldest first: (job, mask, clock value when first queued)"""
+        while not self.pending:
+            self.ready.clear()
+            await self.ready.wait()
+        self.delivered += 1
+        return self.pending.pop(next(iter(self.pending)))
+
+    def mean_latency_ms(self) -> float:
+        """Average wait of delivered frames"""
+        return self.latency_ns_total / self.delivered / 1e6 if self.delivered else 0.0
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+
+class FrameFanout:
+    """
+    Broadcasts frames to SSE clients through coalescing ClientQueues
+
+    Use broadcast() as an UpdateEmitter send callback and frames() in each
+    SSE endpoint. After every broadcast and delivery, on_sample receives
+    the deepest client queue and the age of the oldest undelivered frame,
+    e.g. AdaptiveDebounce.observe. Both are 0 once every client has
+    drained, so adaptive intervals come back down when clients catch up.
+    """
+
+    def __init__(
+        self,
+        on_sample: Optional[SampleCallback] = None,
+        clock: Callable[[], int] = time.monotonic_ns
+    ):
+        """
+        Args:
+            on_sample: Called with (queue depth, latency seconds) per sample
+            clock: Nanosecond monotonic clock (injectable for testing)
+        """
+        self.on_sample = on_sample
+        self.clock = clock
+        self.clients: List[ClientQueue] = []
+
+        # Counters for metrics
+        self.frames_broadcast = 0
+        self.max_depth_seen = 0
+        self.max_latency_ns = 0
+
+    @contextmanager
+    def subscribe(self) -> Iterator[ClientQueue]:
+        """Register a client for the duration of the with block"""
+        client = ClientQueue()
+        self.clients.append(client)
+        try:
+            yield client
+        finally:
+            self.clients.remove(client)
+
+    def broadcast(self, job: JobState, mask: int):
+        """Queue a frame for every client"""
+        now = self.clock()
+        self.frames_broadcast += 1
+        for client in self.clients:
+            client.put(job, mask, now)
+        self._sample(now)
+
+    async def frames(self, client: ClientQueue) -> AsyncIterator[str]:
+        """Encoded frames for one client, as fast as it consumes them"""
+        while True:
+            job, mask, queued_at = await client.get()
+            now = self.clock()
+            client.latency_ns_total += now - queued_at
+            self.max_latency_ns = max(self.max_latency_ns, now - queued_at)
+            self._sample(now)
+            yield encode_frame(job, mask)
+
+    def _sample(self, now: int):
+        depth = 0
+        latency_ns = 0
+        for client in self.clients:
+            depth = max(depth, len(client))
+            latency_ns = max(latency_ns, client.oldest_age_ns(now))
+
+        self.max_depth_seen = max(self.max_depth_seen, depth)
+        if self.on_sample is not None:
+            self.on_sample(depth, latency_ns / 1e9)
+
+    def metrics(self) -> Dict:
+        """Client count, backlog and coalescing counters"""
+        return {
+            'clients': len(self.clients),
+            'queue_depth': max((len(client) for client in self.clients), default=0),
+            'max_queue_depth': self.max_depth_seen,
+            'max_latency_ms': round(self.max_latency_ns / 1e6, 1),
+            'frames_broadcast': self.frames_broadcast,
+            'frames_coalesced': sum(client.coalesced for client in self.clients),
+        }
+
+
+# Example usage
+if __name__ == '__main__':
+    from dashboard_state import DashboardStateManager
+
+    async def main():
+        manager = DashboardStateManager()
+        frames = []
+        emitter = UpdateEmitter(lambda job, mask: frames.append(encode_frame(job, mask)))
+
+        job = JobState(job_id=1, status='in_progress', current_phase='implement', lines_written=1500)
+        emitter.submit(job, manager.calculate_updates(job, 'phase_change'))
+        emitter.submit(job, manager.calculate_updates(job, 'log'))
+        emitter.submit(job, manager.calculate_updates(job, 'progress'))
+        await asyncio.sleep(0)
+
+        for frame in frames:
+            print(f"Frame: {frame}")
+            print(f"  Components: {decode_components(json.loads(frame)['c'])}")
+        print(f"\nUpdates submitted: {emitter.updates_submitted}, frames sent: {emitter.frames_sent}")
+
+    asyncio.run(main())